@@ -0,0 +1,64 @@
+"""
+Audio-quality analysis throughput, reported as realtime factor (audio seconds / wall seconds).
+
+Usage::
+
+    uv run python benchmarks/bench_audio_quality.py --minutes 10
+    uv run python benchmarks/bench_audio_quality.py --json
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import wave
+
+import numpy as np
+
+from voiceeval.audio import AudioIngestor, AudioQualityAnalyzer
+from bench_vad import bench, synthetic_call
+
+
+def write_call(path: str, minutes: float, sample_rate: int) -> None:
+    """Stereo call: user on the left, agent on the right with a 120 ms echo of the user."""
+    user = synthetic_call(minutes, sample_rate, seed=0).astype(np.float64)
+    agent = synthetic_call(minutes, sample_rate, seed=1).astype(np.float64)
+    delay = int(0.12 * sample_rate)
+    agent[delay:] += 0.2 * user[:-delay]
+    stereo = np.stack([user, agent], axis=1).clip(-32768, 32767).astype("<i2")
+    with wave.open(path, "wb") as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(stereo.tobytes())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--minutes", type=float, default=10.0)
+    parser.add_argument("--sample-rate", type=int, default=16000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "call.wav")
+        write_call(path, args.minutes, args.sample_rate)
+        analyzer = AudioQualityAnalyzer()
+        with AudioIngestor(path, speakers=["user", "agent"]) as ingestor:
+            seconds = ingestor.duration
+            results = [
+                bench("analyze_stereo", lambda: analyzer.analyze(ingestor), seconds, args.repeat),
+                bench("vad_only_stereo", lambda: analyzer.vad.detect_channels(ingestor), seconds, args.repeat),
+            ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            print(f"{r['name']:<20} {r['audio_seconds']:>8.0f}s audio  {r['wall_seconds']:>8.3f}s wall  RTF {r['rtf']:>10.0f}x")
+
+
+if __name__ == "__main__":
+    main()
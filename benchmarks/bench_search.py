@@ -0,0 +1,96 @@
+"""
+Transcript search benchmark: indexed phrase/boolean queries vs. scanning every call.
+
+Usage::
+
+    uv run python benchmarks/bench_search.py --calls 20000
+    uv run python benchmarks/bench_search.py --json
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from voiceeval.codecs import dump_binary, iter_binary
+from voiceeval.models import Call, Transcript, TranscriptSegment
+from voiceeval.search import TranscriptIndex
+
+WORDS = (
+    "i want to check my order status please can you help me with billing account password reset "
+    "the agent said it would arrive tomorrow thanks okay sure let me look that up for you one moment "
+    "is there anything else today yes no maybe refund delivery address phone number email"
+).split()
+PHRASES = ["cancel my order", "transfer me to a human", "speak to a manager"]
+QUERIES = ['"cancel my order"', '"transfer me to a human" OR "speak to a manager"', 'refund AND NOT "cancel my order"', "deliver*"]
+
+
+def synthetic_calls(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for i in range(n):
+        segments = []
+        t = 0.0
+        for turn in range(rng.randint(6, 20)):
+            words = rng.choices(WORDS, k=rng.randint(4, 18))
+            if rng.random() < 0.01:
+                words[rng.randrange(len(words)):0] = rng.choice(PHRASES).split()
+            segments.append(TranscriptSegment(
+                speaker="user" if turn % 2 else "agent", text=" ".join(words), timestamp=t, end_timestamp=t + 2.0
+            ))
+            t += 2.5
+        yield Call(call_id=f"call-{i}", agent_id="bench", start_time=start, transcript=Transcript(segments=segments))
+
+
+def scan(path: str, query: str) -> int:
+    """Baseline: decode every call and regex-match its segments (phrases only, OR-ed)."""
+    patterns = [re.compile(r"\b" + re.escape(p) + r"\b") for p in re.findall(r'"([^"]+)"', query)] or [re.compile(query.rstrip("*"))]
+    matched = 0
+    for call in iter_binary(path, trusted=True):
+        if any(p.search(seg.text.lower()) for seg in call.transcript.segments for p in patterns):
+            matched += 1
+    return matched
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = os.path.join(tmp, "calls.vecall")
+        dump_binary(synthetic_calls(args.calls), corpus)
+        with TranscriptIndex(os.path.join(tmp, "index")) as index:
+            started = time.perf_counter()
+            index.add_calls(iter_binary(corpus, trusted=True))
+            results.append({"name": "build", "seconds": time.perf_counter() - started, "matches": len(index)})
+            for query in QUERIES:
+                matches = len(index.search(query))
+                results.append({"name": f"search {query}", "seconds": timed(lambda: index.search(query), args.repeat), "matches": matches})
+        results.append({"name": "scan (baseline)", "seconds": timed(lambda: scan(corpus, QUERIES[0]), 1), "matches": scan(corpus, QUERIES[0])})
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            print(f"{r['name']:<60} {r['seconds'] * 1000:>10.2f} ms  {r['matches']:>8} calls")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,438 @@
+"""
+Tracing-overhead benchmarks for the instrumentation hot path.
+
+Measures ns/span and spans/sec for:
+
+* ``CallIdSpanProcessor.on_start`` / ``on_end`` (auto-monitor, sampled, root spans)
+* ``@observe`` sync and async, child-span and rename-parent modes
+* ``PostProcessingSpanExporter`` + ``enforce_name_override`` on large batches
+* ``time_stream`` per-chunk cost, reported per chunk rather than per span and
+  net of bare iteration over the same chunks
+* end-to-end span creation through ``BatchSpanProcessor`` into an in-memory
+  exporter, and optionally an OTLP/HTTP exporter posting to a local stand-in
+  server (``--http``)
+
+Results can be written as JSON and compared against a stored baseline; the
+script exits non-zero when any case is slower than baseline by more than
+``--tolerance`` (cases over the limit are re-measured once first). Cases with
+an absolute budget (``time_stream``: 1 µs per chunk) fail the run whenever
+they exceed it, with or without a baseline::
+
+    uv run python benchmarks/bench_tracing.py
+    uv run python benchmarks/bench_tracing.py --json results.json
+    uv run python benchmarks/bench_tracing.py --baseline benchmarks/baseline_tracing.json
+    uv run python benchmarks/bench_tracing.py --save-baseline benchmarks/baseline_tracing.json
+
+Baselines are machine-specific; regenerate on the reference machine after
+intentional performance changes.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter, SpanExportResult
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+import voiceeval
+from voiceeval.context import _call_metadata_var, _monitoring_skipped_var
+from voiceeval.observability import instrumentation
+from voiceeval.observability.budget import CallBudget
+from voiceeval.observability.exporters import PostProcessingSpanExporter, enforce_name_override
+from voiceeval.observability.processor import CallIdSpanProcessor
+from voiceeval.observability.streaming import time_stream
+
+# A case returns (op, ops_per_call): op() performs ops_per_call spans of work.
+Case = Callable[[], Tuple[Callable[[], None], int]]
+
+CASES: Dict[str, Case] = {}
+
+# Cases reported net of a reference case: the reference's ns/op is subtracted.
+NET_OF: Dict[str, Case] = {}
+
+# Absolute limits in ns/op, enforced independently of any baseline.
+BUDGETS_NS: Dict[str, float] = {}
+
+
+def case(name: str):
+    def register(fn: Case) -> Case:
+        CASES[name] = fn
+        return fn
+    return register
+
+
+def _reset_context() -> None:
+    _call_metadata_var.set(None)
+    _monitoring_skipped_var.set(False)
+
+
+class NullExporter(SpanExporter):
+    """Accepts and drops spans; isolates post-processing cost."""
+
+    def export(self, spans):
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self):
+        pass
+
+
+# ---------------------------------------------------------------------------
+# CallIdSpanProcessor
+# ---------------------------------------------------------------------------
+
+def _unprocessed_spans(name: str, n: int):
+    tracer = TracerProvider().get_tracer("bench")
+    return [tracer.start_span(name) for _ in range(n)]
+
+
+def _processor_case(processor: CallIdSpanProcessor, span_name: str, method: str, batch: int = 1000):
+    def setup():
+        _reset_context()
+        spans = _unprocessed_spans(span_name, batch)
+        if method == "on_end":
+            for span in spans:
+                processor.on_start(span)
+                span.end()
+        fn = getattr(processor, method)
+
+        def op():
+            for span in spans:
+                fn(span)
+        return op, batch
+    return setup
+
+
+case("processor.on_start")(_processor_case(CallIdSpanProcessor(agent_name="bench-agent"), "llm", "on_start"))
+case("processor.on_start.root")(_processor_case(CallIdSpanProcessor(agent_name="bench-agent"), "job_entrypoint", "on_start"))
+case("processor.on_start.sampled")(_processor_case(CallIdSpanProcessor(sample_rate=0.5), "job_entrypoint", "on_start"))
+case("processor.on_end")(_processor_case(CallIdSpanProcessor(agent_name="bench-agent"), "llm", "on_end"))
+case("processor.on_end.root")(_processor_case(CallIdSpanProcessor(agent_name="bench-agent"), "job_entrypoint", "on_end"))
+
+# Accounting cost of an enforced budget the call never reaches.
+_BUDGET = CallBudget(max_spans=10**12, max_attribute_bytes=10**15, max_events=10**12)
+case("processor.on_start.budget")(_processor_case(CallIdSpanProcessor(agent_name="bench-agent", call_budget=_BUDGET), "llm", "on_start"))
+case("processor.on_end.budget")(_processor_case(CallIdSpanProcessor(agent_name="bench-agent", call_budget=_BUDGET), "llm", "on_end"))
+
+
+# ---------------------------------------------------------------------------
+# @observe
+# ---------------------------------------------------------------------------
+
+def _observe_tracer():
+    provider = TracerProvider()
+    provider.add_span_processor(CallIdSpanProcessor(agent_name="bench-agent"))
+    return provider.get_tracer("bench")
+
+
+def _observe_case(is_async: bool, rename_parent: bool, batch: int = 500):
+    def setup():
+        _reset_context()
+        tracer = _observe_tracer()
+        with patch.object(instrumentation, "tracer", tracer):
+            if is_async:
+                @voiceeval.observe(name_override="bench-op", rename_parent=rename_parent)
+                async def fn(x):
+                    return x
+            else:
+                @voiceeval.observe(name_override="bench-op", rename_parent=rename_parent)
+                def fn(x):
+                    return x
+
+        def run_sync():
+            with patch.object(instrumentation, "tracer", tracer):
+                if rename_parent:
+                    with tracer.start_as_current_span("job_entrypoint"):
+                        for i in range(batch):
+                            fn(i)
+                else:
+                    for i in range(batch):
+                        fn(i)
+
+        async def run_async():
+            if rename_parent:
+                with tracer.start_as_current_span("job_entrypoint"):
+                    for i in range(batch):
+                        await fn(i)
+            else:
+                for i in range(batch):
+                    await fn(i)
+
+        if not is_async:
+            return run_sync, batch
+
+        loop = asyncio.new_event_loop()
+
+        def op():
+            with patch.object(instrumentation, "tracer", tracer):
+                loop.run_until_complete(run_async())
+        return op, batch
+    return setup
+
+
+case("observe.sync.child")(_observe_case(False, False))
+case("observe.sync.rename_parent")(_observe_case(False, True))
+case("observe.async.child")(_observe_case(True, False))
+case("observe.async.rename_parent")(_observe_case(True, True))
+
+
+# ---------------------------------------------------------------------------
+# PostProcessingSpanExporter
+# ---------------------------------------------------------------------------
+
+def _exporter_case(batch: int, override_fraction: float):
+    def setup():
+        provider = TracerProvider()
+        tracer = provider.get_tracer("bench")
+        spans = []
+        for i in range(batch):
+            span = tracer.start_span(f"span-{i}")
+            if i < batch * override_fraction:
+                span.set_attribute("voiceeval.trace_name_override", "renamed")
+            span.end()
+            spans.append(span)
+        exporter = PostProcessingSpanExporter(NullExporter(), [enforce_name_override])
+
+        def op():
+            exporter.export(spans)
+        return op, batch
+    return setup
+
+
+case("exporter.enforce_name_override.512")(_exporter_case(512, 0.5))
+case("exporter.enforce_name_override.4096")(_exporter_case(4096, 0.5))
+case("exporter.enforce_name_override.4096.none")(_exporter_case(4096, 0.0))
+
+
+# ---------------------------------------------------------------------------
+# Stream timing
+# ---------------------------------------------------------------------------
+
+def _stream_case(provider: str, make_chunks: Callable[[int], list], batch: int = 5000) -> Tuple[Case, Case]:
+    """The wrapped case and its bare-iteration reference."""
+    def setup():
+        chunks = make_chunks(batch)
+
+        def op():
+            for _ in time_stream(chunks, provider):
+                pass
+        return op, batch
+
+    def bare():
+        chunks = make_chunks(batch)
+
+        def op():
+            for _ in iter(chunks):
+                pass
+        return op, batch
+    return setup, bare
+
+
+def _openai_chunks(n: int) -> list:
+    delta = SimpleNamespace(content="tok", tool_calls=None)
+    return [SimpleNamespace(choices=[SimpleNamespace(delta=delta)], usage=None) for _ in range(n)]
+
+
+def _anthropic_events(n: int) -> list:
+    return [SimpleNamespace(type="content_block_delta") for _ in range(n)]
+
+
+def _stream_overhead_case(name: str, provider: str, make_chunks: Callable[[int], list]) -> None:
+    setup, bare = _stream_case(provider, make_chunks)
+    case(name)(setup)
+    NET_OF[name] = bare
+    BUDGETS_NS[name] = 1000.0
+
+
+_stream_overhead_case("stream.openai.per_chunk", "openai", _openai_chunks)
+_stream_overhead_case("stream.anthropic.per_chunk", "anthropic", _anthropic_events)
+
+
+# ---------------------------------------------------------------------------
+# End to end
+# ---------------------------------------------------------------------------
+
+def _end_to_end_provider(delegate: SpanExporter) -> TracerProvider:
+    provider = TracerProvider()
+    provider.add_span_processor(CallIdSpanProcessor(agent_name="bench-agent"))
+    exporter = PostProcessingSpanExporter(delegate, [enforce_name_override])
+    provider.add_span_processor(BatchSpanProcessor(exporter, max_queue_size=65536, schedule_delay_millis=50))
+    return provider
+
+
+def _end_to_end_case(make_exporter: Callable[[], SpanExporter], batch: int = 2000):
+    def setup():
+        _reset_context()
+        provider = _end_to_end_provider(make_exporter())
+        tracer = provider.get_tracer("bench")
+
+        def op():
+            with tracer.start_as_current_span("job_entrypoint"):
+                for _ in range(batch - 1):
+                    with tracer.start_as_current_span("llm"):
+                        pass
+            provider.force_flush()
+        return op, batch
+    return setup
+
+
+case("e2e.batch_processor.in_memory")(_end_to_end_case(InMemorySpanExporter))
+
+
+class _SinkHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def _otlp_http_case():
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+    server = HTTPServer(("127.0.0.1", 0), _SinkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/v1/traces"
+    return _end_to_end_case(lambda: OTLPSpanExporter(endpoint=url, headers={"Authorization": "Bearer bench"}))()
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def measure(setup: Case, min_time: float, repeat: int) -> Dict[str, float]:
+    """Best-of-``repeat`` ns per span, each repeat running for at least ``min_time``."""
+    op, per_call = setup()
+    op()  # warm up
+    best = float("inf")
+    for _ in range(repeat):
+        calls = 0
+        started = time.perf_counter_ns()
+        while True:
+            op()
+            calls += 1
+            elapsed = time.perf_counter_ns() - started
+            if elapsed >= min_time * 1e9:
+                break
+        best = min(best, elapsed / (calls * per_call))
+    return {"ns_per_span": best, "spans_per_sec": 1e9 / best}
+
+
+def measure_case(name: str, setup: Case, min_time: float, repeat: int) -> Dict[str, float]:
+    """``measure`` one case, net of its reference case if it has one."""
+    result = measure(setup, min_time, repeat)
+    reference = NET_OF.get(name)
+    if reference is None:
+        return result
+    # Floor at 1 ns so noise on a near-zero overhead cannot go negative.
+    net = max(result["ns_per_span"] - measure(reference, min_time, repeat)["ns_per_span"], 1.0)
+    return {"ns_per_span": net, "spans_per_sec": 1e9 / net}
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float) -> List[str]:
+    """Return a message for each case slower than baseline by more than ``tolerance``."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        ratio = result["ns_per_span"] / base["ns_per_span"]
+        if ratio > 1 + tolerance:
+            regressions.append(f"{name}: {result['ns_per_span']:.0f} ns/span vs baseline {base['ns_per_span']:.0f} ({ratio:.2f}x)")
+    return regressions
+
+
+def over_budget(results: Dict[str, Dict[str, float]]) -> List[str]:
+    """Return a message for each case above its absolute budget."""
+    return [
+        f"{name}: {result['ns_per_span']:.0f} ns/span over budget of {BUDGETS_NS[name]:.0f}"
+        for name, result in results.items()
+        if name in BUDGETS_NS and result["ns_per_span"] > BUDGETS_NS[name]
+    ]
+
+
+def _retry(names: List[str], cases: Dict[str, Case], results: Dict[str, Dict[str, float]], args) -> None:
+    """Re-measure ``names`` once, keeping the faster result, so one noisy run doesn't fail a check."""
+    for name in names:
+        retry = measure_case(name, cases[name], args.min_time, args.repeat)
+        if retry["ns_per_span"] < results[name]["ns_per_span"]:
+            results[name] = retry
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="VoiceEval tracing-overhead benchmarks")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per repeat")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--http", action="store_true", help="include OTLP/HTTP export to a local server")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON ('-' for stdout)")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against a stored baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed slowdown vs baseline (0.5 = 50%%)")
+    parser.add_argument("--save-baseline", metavar="PATH", help="write results as the new baseline")
+    args = parser.parse_args(argv)
+
+    cases = dict(CASES)
+    if args.http:
+        cases["e2e.batch_processor.otlp_http"] = _otlp_http_case
+    cases = {name: fn for name, fn in cases.items() if args.filter in name}
+
+    results = {}
+    for name, setup in cases.items():
+        results[name] = measure_case(name, setup, args.min_time, args.repeat)
+        if args.json != "-":
+            r = results[name]
+            print(f"{name:<45} {r['ns_per_span']:>10.0f} ns/span {r['spans_per_sec']:>12.0f} spans/s")
+
+    document = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    if args.json == "-":
+        json.dump(document, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        with open(args.json, "w") as f:
+            json.dump(document, f, indent=2)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(document, f, indent=2)
+            f.write("\n")
+
+    failures = over_budget(results)
+    if failures:
+        suspects = [message.split(":", 1)[0] for message in failures]
+        _retry(suspects, cases, results, args)
+        failures = over_budget({name: results[name] for name in suspects})
+    for message in failures:
+        print(f"OVER BUDGET {message}", file=sys.stderr)
+
+    regressions: List[str] = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            suspects = [message.split(":", 1)[0] for message in regressions]
+            _retry(suspects, cases, results, args)
+            regressions = compare({name: results[name] for name in suspects}, baseline, args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+    return 1 if failures or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
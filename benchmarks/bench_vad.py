@@ -0,0 +1,79 @@
+"""
+VAD throughput benchmark, reported as realtime factor (audio seconds / wall seconds).
+
+Usage::
+
+    uv run python benchmarks/bench_vad.py --minutes 10
+    uv run python benchmarks/bench_vad.py --json
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from voiceeval.audio import VAD
+
+
+def synthetic_call(minutes: float, sample_rate: int, seed: int = 0) -> np.ndarray:
+    """Alternating 1-4 s voiced bursts and 0.3-2 s pauses over background noise."""
+    rng = np.random.default_rng(seed)
+    total = int(minutes * 60 * sample_rate)
+    audio = rng.normal(0, 0.003, total)
+    pos, speaking = 0, False
+    while pos < total:
+        length = int((rng.uniform(1.0, 4.0) if speaking else rng.uniform(0.3, 2.0)) * sample_rate)
+        if speaking:
+            t = np.arange(min(length, total - pos)) / sample_rate
+            f0 = rng.uniform(100, 250)
+            audio[pos:pos + len(t)] += 0.3 * (np.sin(2 * np.pi * f0 * t) + 0.5 * np.sin(4 * np.pi * f0 * t))
+        pos += length
+        speaking = not speaking
+    return (audio * 32767).clip(-32768, 32767).astype("<i2")
+
+
+def bench(name, fn, audio_seconds: float, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return {"name": name, "audio_seconds": audio_seconds, "wall_seconds": best, "rtf": audio_seconds / best}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--minutes", type=float, default=10.0)
+    parser.add_argument("--sample-rate", type=int, default=16000)
+    parser.add_argument("--chunk-ms", type=float, default=20.0, help="chunk size for the streaming run")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    vad = VAD(sample_rate=args.sample_rate)
+    pcm = synthetic_call(args.minutes, args.sample_rate)
+    data = pcm.tobytes()
+    seconds = len(pcm) / args.sample_rate
+    chunk = int(args.sample_rate * args.chunk_ms / 1000) * 2
+
+    def streaming():
+        stream = vad.stream()
+        for i in range(0, len(data), chunk):
+            stream.feed(data[i:i + chunk])
+        stream.flush()
+
+    results = [
+        bench("detect_speech", lambda: vad.detect_speech(data), seconds, args.repeat),
+        bench(f"stream_{args.chunk_ms:g}ms", streaming, seconds, args.repeat),
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            print(f"{r['name']:<20} {r['audio_seconds']:>8.0f}s audio  {r['wall_seconds']:>8.3f}s wall  RTF {r['rtf']:>10.0f}x")
+
+
+if __name__ == "__main__":
+    main()
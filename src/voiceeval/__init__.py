@@ -1,13 +1,33 @@
-from voiceeval.client import Client
-from voiceeval.models import Call, Transcript, Span
-from voiceeval.observability import observe
-from voiceeval.context import (
-    CallMetadata,
-    get_call_id,
-    get_call_metadata,
-    monitor_call,
-    skip_call,
-)
+"""
+VoiceEval SDK.
+
+Public names are loaded on first access, so offline jobs that only need
+``voiceeval.models``, ``voiceeval.metrics`` or ``voiceeval.runners`` never
+import OpenTelemetry, the OTLP exporter or httpx.
+"""
+
+from typing import TYPE_CHECKING
+
+from voiceeval._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from voiceeval.client import Client
+    from voiceeval.models import Call, Transcript, Span
+    from voiceeval.observability import observe
+    from voiceeval.observability.budget import CallBudget
+    from voiceeval.observability.profiles import AgentProfile
+    from voiceeval.executors import ContextProcessPoolExecutor, ContextThreadPoolExecutor, run_in_executor
+    from voiceeval.context import (
+        CallMetadata,
+        agent_scope,
+        get_agent,
+        get_call_id,
+        get_call_metadata,
+        monitor_call,
+        set_agent,
+        set_call_detail,
+        skip_call,
+    )
 
 __all__ = [
     "Client",
@@ -15,9 +35,40 @@ __all__ = [
     "Transcript",
     "Span",
     "observe",
+    "AgentProfile",
+    "CallBudget",
     "CallMetadata",
+    "agent_scope",
+    "get_agent",
     "get_call_id",
     "get_call_metadata",
     "monitor_call",
+    "set_agent",
+    "set_call_detail",
     "skip_call",
+    "ContextThreadPoolExecutor",
+    "ContextProcessPoolExecutor",
+    "run_in_executor",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "Client": "voiceeval.client",
+    "Call": "voiceeval.models",
+    "Transcript": "voiceeval.models",
+    "Span": "voiceeval.models",
+    "observe": "voiceeval.observability",
+    "AgentProfile": "voiceeval.observability.profiles",
+    "CallBudget": "voiceeval.observability.budget",
+    "CallMetadata": "voiceeval.context",
+    "agent_scope": "voiceeval.context",
+    "get_agent": "voiceeval.context",
+    "get_call_id": "voiceeval.context",
+    "get_call_metadata": "voiceeval.context",
+    "monitor_call": "voiceeval.context",
+    "set_agent": "voiceeval.context",
+    "set_call_detail": "voiceeval.context",
+    "skip_call": "voiceeval.context",
+    "ContextThreadPoolExecutor": "voiceeval.executors",
+    "ContextProcessPoolExecutor": "voiceeval.executors",
+    "run_in_executor": "voiceeval.executors",
+})
@@ -0,0 +1,31 @@
+"""Helpers for lazily-populated package namespaces (PEP 562)."""
+
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build ``__getattr__`` and ``__dir__`` for ``package``.
+
+    Args:
+        package: The package's ``__name__``.
+        exports: Maps each public name to the module that defines it.
+
+    The defining module is imported on first access and the value is cached in
+    the package namespace, so later lookups are plain attribute reads.
+    """
+    namespace = import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,341 @@
+"""
+One-pass grouped aggregation of per-call metric results.
+
+``Aggregator`` consumes ``(call, results)`` pairs — exactly what
+``OfflineRunner.run_stream`` yields — and keeps, for every group and metric,
+a count, sum, min, max and a percentile estimate:
+
+* groups are keyed by call attributes (``agent_id``), a time bucket of
+  ``start_time`` (``bucket="1h"``), transcript metadata tags
+  (``"metadata.model"``) or any ``(name, fn(call))`` pair,
+* percentiles are exact while a group has at most ``exact_up_to`` values and
+  come from a mergeable log-bucketed sketch (``LatencyHistogram``, relative
+  error ``relative_error``) after that, so memory per group is bounded no
+  matter how many calls stream through,
+* values are buffered and binned in batches, vectorized with NumPy when it is
+  installed,
+* aggregators built on different shards can be ``merge``d.
+
+Summaries export to CSV or JSON::
+
+    agg = Aggregator(group_by=["agent_id", "metadata.model"], bucket="1h")
+    agg.add_many(runner.run_stream(iter_calls("calls.vecall")))
+    agg.to_csv("daily.csv")
+"""
+
+import csv
+import json
+import math
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from typing import IO, Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from voiceeval.codecs import PathLike
+from voiceeval.histogram import VECTORIZE_THRESHOLD, LatencyHistogram, optional_numpy
+from voiceeval.models import Call
+
+GroupSpec = Union[str, Tuple[str, Callable[[Call], Any]]]
+BucketSpec = Union[None, str, float, timedelta]
+
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_bucket(bucket: BucketSpec) -> Optional[float]:
+    """Bucket width in seconds from ``"15m"``, ``"1h"``, ``"1d"``, seconds or a timedelta."""
+    if bucket is None:
+        return None
+    if isinstance(bucket, timedelta):
+        seconds = bucket.total_seconds()
+    elif isinstance(bucket, str):
+        match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhd])\s*", bucket)
+        if not match:
+            raise ValueError(f"Invalid time bucket {bucket!r}; expected e.g. '15m', '1h' or '1d'")
+        seconds = float(match.group(1)) * _UNITS[match.group(2)]
+    else:
+        seconds = float(bucket)
+    if seconds <= 0:
+        raise ValueError("Time bucket must be positive")
+    return seconds
+
+
+def _group_fn(spec: GroupSpec) -> Tuple[str, Callable[[Call], Any]]:
+    if not isinstance(spec, str):
+        return spec
+    if spec.startswith("metadata."):
+        key = spec[len("metadata."):]
+        return spec, lambda call: call.transcript.metadata.get(key) if call.transcript else None
+    if spec not in Call.model_fields:
+        raise ValueError(f"Unknown group field {spec!r}; use a Call field, 'metadata.<key>' or a (name, fn) pair")
+    return spec, lambda call: getattr(call, spec)
+
+
+class MetricDistribution:
+    """
+    Incremental distribution of one metric within one group.
+
+    Args:
+        relative_error: Sketch accuracy once exact values are dropped.
+        exact_up_to: Keep raw values (exact percentiles) up to this many.
+        buffer_size: Values buffered before being binned in one batch.
+    """
+
+    __slots__ = ("relative_error", "exact_up_to", "buffer_size", "_count", "_total", "_min", "_max",
+                 "positive", "negative", "zeros", "exact", "_pending")
+
+    def __init__(self, relative_error: float = 0.01, exact_up_to: int = 1000, buffer_size: int = 1024):
+        self.relative_error = relative_error
+        self.exact_up_to = exact_up_to
+        self.buffer_size = buffer_size
+        self._count = 0
+        self._total = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        # Metrics can be zero or negative (e.g. sentiment), so magnitudes are
+        # sketched on each side of zero.
+        self.positive = LatencyHistogram(relative_error)
+        self.negative = LatencyHistogram(relative_error)
+        self.zeros = 0
+        self.exact: Optional[List[float]] = [] if exact_up_to > 0 else None
+        self._pending: List[float] = []
+
+    def add(self, value: float) -> None:
+        self._pending.append(value)
+        if len(self._pending) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        values = self._pending
+        if not values:
+            return
+        self._pending = []
+        self._count += len(values)
+        if self.exact is not None:
+            self.exact.extend(values)
+            if len(self.exact) > self.exact_up_to:
+                self.exact = None
+
+        floor = self.positive.min_value
+        np = optional_numpy() if len(values) >= VECTORIZE_THRESHOLD else None
+        if np is not None:
+            arr = np.asarray(values, dtype=np.float64)
+            self._total += float(arr.sum())
+            low, high = float(arr.min()), float(arr.max())
+            positive = arr[arr > floor]
+            negative = -arr[arr < -floor]
+        else:
+            self._total += math.fsum(values)
+            low, high = min(values), max(values)
+            positive = [v for v in values if v > floor]
+            negative = [-v for v in values if v < -floor]
+        self._min = min(self._min, low)
+        self._max = max(self._max, high)
+        self.zeros += len(values) - len(positive) - len(negative)
+        if len(positive):
+            self.positive.record_many(positive)
+        if len(negative):
+            self.negative.record_many(negative)
+
+    def merge(self, other: "MetricDistribution") -> None:
+        self.flush()
+        other.flush()
+        self._count += other._count
+        self._total += other._total
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        self.positive.merge(other.positive)
+        self.negative.merge(other.negative)
+        self.zeros += other.zeros
+        if self.exact is not None and other.exact is not None and len(self.exact) + len(other.exact) <= self.exact_up_to:
+            self.exact.extend(other.exact)
+        else:
+            self.exact = None
+
+    @property
+    def count(self) -> int:
+        self.flush()
+        return self._count
+
+    @property
+    def total(self) -> float:
+        self.flush()
+        return self._total
+
+    @property
+    def min(self) -> float:
+        self.flush()
+        return self._min
+
+    @property
+    def max(self) -> float:
+        self.flush()
+        return self._max
+
+    @property
+    def mean(self) -> float:
+        self.flush()
+        return self._total / self._count if self._count else 0.0
+
+    @property
+    def is_exact(self) -> bool:
+        return self.exact is not None
+
+    def percentile(self, q: float) -> float:
+        """Value at quantile ``q`` in [0, 1]: interpolated when exact, sketch estimate otherwise."""
+        self.flush()
+        if not self._count:
+            return 0.0
+        if self.exact is not None:
+            values = sorted(self.exact)
+            position = q * (len(values) - 1)
+            low = int(position)
+            high = min(low + 1, len(values) - 1)
+            return values[low] + (values[high] - values[low]) * (position - low)
+
+        rank = q * (self._count - 1)
+        seen = 0
+        # Most negative first, then zeros, then positives ascending.
+        for index in sorted(self.negative.counts, reverse=True):
+            seen += self.negative.counts[index]
+            if seen > rank:
+                return min(max(-self.negative._bucket_value(index), self._min), self._max)
+        seen += self.zeros
+        if seen > rank:
+            return min(max(0.0, self._min), self._max)
+        for index in sorted(self.positive.counts):
+            seen += self.positive.counts[index]
+            if seen > rank:
+                return min(max(self.positive._bucket_value(index), self._min), self._max)
+        return self._max
+
+
+class Aggregator:
+    """
+    Groups per-call results and summarises every numeric metric.
+
+    Args:
+        group_by: Grouping dimensions: ``Call`` field names, ``"metadata.<key>"``
+                  for transcript metadata tags, or ``(name, fn(call))`` pairs.
+        bucket: Optional time bucket over ``start_time`` (``"1h"``, ``"1d"``,
+                seconds or a timedelta), added as the ``bucket`` column.
+        metrics: Only aggregate these metric names (default: every numeric one).
+        percentiles: Quantiles reported by ``summaries``.
+        relative_error: Sketch accuracy for large groups.
+        exact_up_to: Groups with at most this many values report exact percentiles.
+    """
+
+    def __init__(
+        self,
+        group_by: Sequence[GroupSpec] = ("agent_id",),
+        bucket: BucketSpec = None,
+        metrics: Optional[Sequence[str]] = None,
+        percentiles: Sequence[float] = (0.5, 0.95, 0.99),
+        relative_error: float = 0.01,
+        exact_up_to: int = 1000,
+    ):
+        self._groupers = [_group_fn(spec) for spec in group_by]
+        self.bucket_seconds = parse_bucket(bucket)
+        self.metrics = set(metrics) if metrics is not None else None
+        self.percentiles = tuple(percentiles)
+        self.relative_error = relative_error
+        self.exact_up_to = exact_up_to
+        self.groups: Dict[Tuple[Any, ...], Dict[str, MetricDistribution]] = {}
+        self.calls = 0
+
+    @property
+    def columns(self) -> List[str]:
+        """Group column names, in key order."""
+        names = [name for name, _ in self._groupers]
+        return names + ["bucket"] if self.bucket_seconds else names
+
+    def group_key(self, call: Call) -> Tuple[Any, ...]:
+        key = [fn(call) for _, fn in self._groupers]
+        if self.bucket_seconds:
+            start = call.start_time if call.start_time.tzinfo else call.start_time.replace(tzinfo=timezone.utc)
+            floored = math.floor(start.timestamp() / self.bucket_seconds) * self.bucket_seconds
+            key.append(datetime.fromtimestamp(floored, tz=timezone.utc).isoformat())
+        return tuple(key)
+
+    def add(self, call: Call, results: Mapping[str, object]) -> None:
+        """Add one call's metric results; non-numeric, NaN and infinite values are skipped."""
+        self.calls += 1
+        key = self.group_key(call)
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = {}
+        for name, value in results.items():
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                continue
+            if self.metrics is not None and name not in self.metrics:
+                continue
+            if not math.isfinite(value):  # NaN, or e.g. a ratio over zero
+                continue
+            dist = group.get(name)
+            if dist is None:
+                dist = group[name] = MetricDistribution(self.relative_error, self.exact_up_to)
+            dist.add(float(value))
+
+    def add_many(self, pairs: Iterable[Tuple[Call, Mapping[str, object]]]) -> int:
+        """Add ``(call, results)`` pairs, e.g. from ``OfflineRunner.run_stream``; returns how many."""
+        added = 0
+        for call, results in pairs:
+            self.add(call, results)
+            added += 1
+        return added
+
+    def merge(self, other: "Aggregator") -> None:
+        """Fold in an aggregator with the same grouping (e.g. from another shard)."""
+        if other.columns != self.columns or other.bucket_seconds != self.bucket_seconds:
+            raise ValueError("Cannot merge aggregators with different grouping")
+        self.calls += other.calls
+        for key, metrics in other.groups.items():
+            group = self.groups.setdefault(key, {})
+            for name, dist in metrics.items():
+                if name in group:
+                    group[name].merge(dist)
+                else:
+                    mine = group[name] = MetricDistribution(self.relative_error, self.exact_up_to)
+                    mine.merge(dist)
+
+    def summaries(self) -> List[Dict[str, Any]]:
+        """One row per (group, metric): group columns, ``metric``, count, mean, min, max and percentiles."""
+        columns = self.columns
+        rows = []
+        for key in sorted(self.groups, key=lambda k: tuple("" if v is None else str(v) for v in k)):
+            for name in sorted(self.groups[key]):
+                dist = self.groups[key][name]
+                row: Dict[str, Any] = dict(zip(columns, key))
+                row.update({"metric": name, "count": dist.count, "mean": dist.mean, "min": dist.min, "max": dist.max})
+                for q in self.percentiles:
+                    row[f"p{q * 100:g}"] = dist.percentile(q)
+                row["exact"] = dist.is_exact
+                rows.append(row)
+        return rows
+
+    def to_csv(self, destination: Union[PathLike, IO[str]]) -> None:
+        rows = self.summaries()
+        fields = self.columns + ["metric", "count", "mean", "min", "max"] + [f"p{q * 100:g}" for q in self.percentiles] + ["exact"]
+        if isinstance(destination, (str, os.PathLike)):
+            with open(destination, "w", newline="", encoding="utf-8") as f:
+                self._write_csv(f, fields, rows)
+        else:
+            self._write_csv(destination, fields, rows)
+
+    @staticmethod
+    def _write_csv(f: IO[str], fields: List[str], rows: List[Dict[str, Any]]) -> None:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    def to_json(self, destination: Union[PathLike, IO[str]]) -> None:
+        document = {
+            "group_by": self.columns,
+            "bucket_seconds": self.bucket_seconds,
+            "calls": self.calls,
+            "rows": self.summaries(),
+        }
+        if isinstance(destination, (str, os.PathLike)):
+            with open(destination, "w", encoding="utf-8") as f:
+                json.dump(document, f, indent=2)
+        else:
+            json.dump(document, destination, indent=2)
@@ -1,5 +1,51 @@
-from voiceeval.audio.ingestion import AudioIngestor
-from voiceeval.audio.transcription import Transcriber
-from voiceeval.audio.vad import VAD
+from typing import TYPE_CHECKING
 
-__all__ = ["AudioIngestor", "Transcriber", "VAD"]
+from voiceeval._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from voiceeval.audio.batch import BatchTranscriber, TranscriberBackend, TranscriptionBackend
+    from voiceeval.audio.ingestion import AudioFormat, AudioFormatError, AudioIngestor, Resampler
+    from voiceeval.audio.pipeline import AudioPipeline, PipelineResult, SpeechRegion, StageStats
+    from voiceeval.audio.quality import AudioQualityAnalyzer, ChannelQuality, QualityReport
+    from voiceeval.audio.transcription import Transcriber
+    from voiceeval.audio.vad import VAD, VADStream
+
+__all__ = [
+    "AudioFormat",
+    "AudioFormatError",
+    "AudioIngestor",
+    "AudioPipeline",
+    "AudioQualityAnalyzer",
+    "BatchTranscriber",
+    "ChannelQuality",
+    "PipelineResult",
+    "QualityReport",
+    "Resampler",
+    "SpeechRegion",
+    "StageStats",
+    "Transcriber",
+    "TranscriberBackend",
+    "TranscriptionBackend",
+    "VAD",
+    "VADStream",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AudioFormat": "voiceeval.audio.ingestion",
+    "AudioFormatError": "voiceeval.audio.ingestion",
+    "AudioIngestor": "voiceeval.audio.ingestion",
+    "AudioPipeline": "voiceeval.audio.pipeline",
+    "AudioQualityAnalyzer": "voiceeval.audio.quality",
+    "BatchTranscriber": "voiceeval.audio.batch",
+    "ChannelQuality": "voiceeval.audio.quality",
+    "PipelineResult": "voiceeval.audio.pipeline",
+    "QualityReport": "voiceeval.audio.quality",
+    "Resampler": "voiceeval.audio.ingestion",
+    "SpeechRegion": "voiceeval.audio.pipeline",
+    "StageStats": "voiceeval.audio.pipeline",
+    "Transcriber": "voiceeval.audio.transcription",
+    "TranscriberBackend": "voiceeval.audio.batch",
+    "TranscriptionBackend": "voiceeval.audio.batch",
+    "VAD": "voiceeval.audio.vad",
+    "VADStream": "voiceeval.audio.vad",
+})
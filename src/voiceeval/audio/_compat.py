@@ -0,0 +1,36 @@
+"""Optional-dependency helpers for ``voiceeval.audio``."""
+
+
+def require_numpy():
+    """Import NumPy or raise an ImportError with the install hint."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "voiceeval.audio requires numpy. Install with: pip install voiceeval-sdk[audio]"
+        ) from e
+    return numpy
+
+
+def to_float32(samples):
+    """Convert a sample array of any supported dtype to float32 in [-1, 1]; float input is not copied."""
+    np = require_numpy()
+    if samples.dtype.kind == "f":
+        return samples.astype(np.float32, copy=False)
+    if samples.dtype.kind == "u":  # 8-bit PCM is unsigned, centred at 128
+        half = float((np.iinfo(samples.dtype).max + 1) // 2)
+        return (samples.astype(np.float32) - half) / half
+    return samples.astype(np.float32) / float(np.iinfo(samples.dtype).max + 1)
+
+
+def to_pcm16(samples) -> bytes:
+    """Convert a 1-D sample array of any supported dtype to 16-bit little-endian PCM."""
+    np = require_numpy()
+    if samples.dtype == np.dtype("<i2"):
+        return samples.tobytes()
+    if samples.dtype.kind == "f":
+        return (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+    if samples.dtype.kind == "u":  # 8-bit PCM is unsigned, centred at 128
+        return ((samples.astype(np.int16) - 128) << 8).astype("<i2").tobytes()
+    shift = samples.dtype.itemsize * 8 - 16
+    return (samples >> shift).astype("<i2").tobytes()
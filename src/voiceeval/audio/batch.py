@@ -0,0 +1,141 @@
+"""
+Concurrent, batched transcription with content-hash caching.
+
+``BatchTranscriber`` drives a pluggable ``TranscriptionBackend``:
+
+* identical clips are transcribed once (deduplicated by SHA-256 of the audio),
+* cached results are served from a ``DiskCache`` without touching the backend,
+* the remaining clips are grouped into requests of ``backend.max_batch_size``
+  and run with at most ``concurrency`` requests in flight,
+* failed requests are retried with exponential backoff.
+
+Any existing synchronous ``Transcriber`` can be plugged in through
+``TranscriberBackend``; its calls run in worker threads::
+
+    batch = BatchTranscriber(TranscriberBackend(MySTT()), concurrency=8, cache=DiskCache(".stt-cache"))
+    results = await batch.transcribe_many(clips)
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from voiceeval.audio.transcription import Transcriber
+from voiceeval.cache import DiskCache, content_key
+from voiceeval.models import TranscriptSegment
+from voiceeval.retry import retry_async
+
+
+class TranscriptionBackend(ABC):
+    """
+    Speech-to-text provider used by ``BatchTranscriber``.
+
+    Attributes:
+        max_batch_size: Clips per ``transcribe_batch`` request. Backends
+                        without a batch API keep the default of 1.
+        cache_namespace: Identifies the model/config in cache keys, so
+                         switching models never serves stale transcripts.
+        sample_rate: Sample rate of the 16-bit PCM clips the backend expects,
+                     or None for any rate.
+    """
+    max_batch_size: int = 1
+    cache_namespace: str = "default"
+    sample_rate: Optional[int] = None
+
+    @abstractmethod
+    async def transcribe_batch(self, clips: Sequence[bytes]) -> List[List[TranscriptSegment]]:
+        """Transcribe ``clips``; returns one segment list per clip, in order."""
+        pass
+
+
+class TranscriberBackend(TranscriptionBackend):
+    """Adapts a synchronous ``Transcriber`` by running it in worker threads."""
+
+    def __init__(self, transcriber: Transcriber, cache_namespace: Optional[str] = None):
+        self.transcriber = transcriber
+        self.cache_namespace = cache_namespace or type(transcriber).__qualname__
+        self.sample_rate = transcriber.sample_rate
+
+    async def transcribe_batch(self, clips: Sequence[bytes]) -> List[List[TranscriptSegment]]:
+        return [await asyncio.to_thread(self.transcriber.transcribe, clip) for clip in clips]
+
+
+class BatchTranscriber:
+    """
+    Concurrent batched transcription over a ``TranscriptionBackend``.
+
+    Args:
+        backend: The speech-to-text provider.
+        concurrency: Maximum backend requests in flight.
+        batch_size: Clips per request; defaults to ``backend.max_batch_size``.
+        cache: Optional ``DiskCache`` for results keyed by audio content.
+        max_retries: Retries per failed request.
+        retry_backoff: Base delay in seconds for exponential backoff.
+    """
+
+    def __init__(
+        self,
+        backend: TranscriptionBackend,
+        concurrency: int = 4,
+        batch_size: Optional[int] = None,
+        cache: Optional[DiskCache] = None,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+    ):
+        self.backend = backend
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size or backend.max_batch_size)
+        self.cache = cache
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.stats = {"requests": 0, "transcribed": 0, "cache_hits": 0, "deduplicated": 0}
+
+    def cache_key(self, clip: bytes) -> str:
+        return content_key(self.backend.cache_namespace, clip)
+
+    async def transcribe(self, clip: bytes) -> List[TranscriptSegment]:
+        return (await self.transcribe_many([clip]))[0]
+
+    async def transcribe_many(self, clips: Sequence[bytes]) -> List[List[TranscriptSegment]]:
+        """Transcribe ``clips``, returning segment lists in input order."""
+        keys = [self.cache_key(clip) for clip in clips]
+        results: Dict[str, List[TranscriptSegment]] = {}
+        pending: Dict[str, bytes] = {}
+
+        for key, clip in zip(keys, clips):
+            if key in results or key in pending:
+                self.stats["deduplicated"] += 1
+                continue
+            cached = self.cache.get(key) if self.cache else None
+            if cached is not None:
+                results[key] = [TranscriptSegment.model_validate(seg) for seg in cached]
+                self.stats["cache_hits"] += 1
+            else:
+                pending[key] = clip
+
+        items = list(pending.items())
+        batches = [items[i:i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(batch: List[Tuple[str, bytes]]) -> None:
+            async with semaphore:
+                self.stats["requests"] += 1
+                outputs = await retry_async(
+                    lambda: self.backend.transcribe_batch([clip for _, clip in batch]),
+                    max_retries=self.max_retries,
+                    backoff=self.retry_backoff,
+                )
+            if len(outputs) != len(batch):
+                raise ValueError(f"Backend returned {len(outputs)} results for {len(batch)} clips")
+            for (key, _), segments in zip(batch, outputs):
+                results[key] = segments
+                self.stats["transcribed"] += 1
+                if self.cache:
+                    self.cache.put(key, [seg.model_dump() for seg in segments])
+
+        await asyncio.gather(*(run(batch) for batch in batches))
+        return [results[key] for key in keys]
+
+    def transcribe_many_sync(self, clips: Sequence[bytes]) -> List[List[TranscriptSegment]]:
+        """Blocking wrapper around ``transcribe_many`` for scripts and offline jobs."""
+        return asyncio.run(self.transcribe_many(clips))
@@ -1,9 +1,293 @@
+"""
+Streaming audio ingestion.
+
+``AudioIngestor`` memory-maps a WAV or raw PCM file and hands out views into
+the mapping instead of reading it into memory: ``frames()`` yields
+``memoryview`` slices of the interleaved bytes, ``arrays()`` yields NumPy
+views of shape ``(n_samples, channels)`` and ``channel()`` returns a strided
+per-channel view. Hour-long stereo recordings cost only the pages that are
+actually touched.
+
+For stereo call recordings each channel is usually one speaker; pass
+``speakers=["user", "agent"]`` to name them. ``VAD.detect_channels`` and
+``Transcriber.transcribe_ingestor`` consume an ingestor directly.
+
+The NumPy-based APIs require ``pip install voiceeval-sdk[audio]``.
+"""
+
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Union
+
+from voiceeval.audio._compat import require_numpy, to_float32
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# (format tag, bits per sample) -> numpy dtype
+_WAV_DTYPES = {
+    (_WAVE_FORMAT_PCM, 8): "u1",
+    (_WAVE_FORMAT_PCM, 16): "<i2",
+    (_WAVE_FORMAT_PCM, 32): "<i4",
+    (_WAVE_FORMAT_IEEE_FLOAT, 32): "<f4",
+    (_WAVE_FORMAT_IEEE_FLOAT, 64): "<f8",
+}
+
+_RAW_DTYPES = {"u1", "<i2", "<i4", "<f4", "<f8"}
+
+
+class AudioFormatError(ValueError):
+    """Raised when an audio file cannot be parsed or uses an unsupported encoding."""
+
+
+@dataclass(frozen=True)
+class AudioFormat:
+    """Layout of the PCM payload inside an audio file."""
+    sample_rate: int
+    channels: int
+    dtype: str
+    data_offset: int
+    data_length: int
+
+    @property
+    def sample_width(self) -> int:
+        return int(self.dtype[-1])
+
+    @property
+    def block_align(self) -> int:
+        """Bytes per multi-channel sample frame."""
+        return self.sample_width * self.channels
+
+    @property
+    def num_samples(self) -> int:
+        """Samples per channel."""
+        return self.data_length // self.block_align
+
+    @property
+    def duration(self) -> float:
+        return self.num_samples / self.sample_rate
+
+
+def parse_wav_header(buf: Union[bytes, mmap.mmap]) -> AudioFormat:
+    """Locate the ``fmt `` and ``data`` chunks of a RIFF/WAVE buffer."""
+    if len(buf) < 12 or buf[0:4] != b"RIFF" or buf[8:12] != b"WAVE":
+        raise AudioFormatError("Not a RIFF/WAVE file")
+    pos, size = 12, len(buf)
+    fmt = None
+    while pos + 8 <= size:
+        chunk_id = buf[pos:pos + 4]
+        (chunk_size,) = struct.unpack_from("<I", buf, pos + 4)
+        body = pos + 8
+        if chunk_id == b"fmt ":
+            tag, channels, rate, _, _, bits = struct.unpack_from("<HHIIHH", buf, body)
+            if tag == _WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40:
+                (tag,) = struct.unpack_from("<H", buf, body + 24)  # first bytes of SubFormat GUID
+            dtype = _WAV_DTYPES.get((tag, bits))
+            if dtype is None:
+                raise AudioFormatError(f"Unsupported WAV encoding (format {tag:#06x}, {bits}-bit)")
+            fmt = (rate, channels, dtype)
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise AudioFormatError("WAV data chunk precedes fmt chunk")
+            # Streaming writers leave the size at 0 or 0xFFFFFFFF; clamp to the file.
+            length = size - body if chunk_size in (0, 0xFFFFFFFF) else min(chunk_size, size - body)
+            rate, channels, dtype = fmt
+            return AudioFormat(rate, channels, dtype, body, length)
+        pos = body + chunk_size + (chunk_size & 1)
+    raise AudioFormatError("WAV file has no data chunk")
+
+
+class Resampler:
+    """
+    Streaming linear-interpolation resampler.
+
+    Keeps one sample of history and the fractional read position between
+    calls, so chunk boundaries are seamless. Linear interpolation is meant
+    for analysis (VAD, STT front-ends), not for playback quality.
+
+    Args:
+        from_rate: Input sample rate in Hz.
+        to_rate: Output sample rate in Hz.
+    """
+    def __init__(self, from_rate: int, to_rate: int):
+        self.from_rate = from_rate
+        self.to_rate = to_rate
+        self._step = from_rate / to_rate
+        self._tail = None
+        self._t = 0.0  # next output position, in samples of (tail + chunk)
+
+    def process(self, chunk: "np.ndarray") -> "np.ndarray":
+        """Resample ``(n,)`` or ``(n, channels)`` samples.
+
+        Integer PCM is scaled (and unsigned 8-bit centred) first, so the
+        output is float32 in [-1, 1] whatever the input dtype.
+        """
+        np = require_numpy()
+        chunk = to_float32(np.asarray(chunk))
+        buf = chunk if self._tail is None else np.concatenate([self._tail, chunk])
+        if len(buf) == 0:
+            return buf
+        last = len(buf) - 1
+        n_out = int(np.floor((last - self._t) / self._step)) + 1 if last >= self._t else 0
+        t = self._t + np.arange(n_out) * self._step
+        i0 = np.floor(t).astype(np.intp)
+        i1 = np.minimum(i0 + 1, last)
+        frac = (t - i0).astype(np.float32)
+        if buf.ndim > 1:
+            frac = frac[:, None]
+        out = buf[i0] * (1 - frac) + buf[i1] * frac
+        self._t = self._t + n_out * self._step - last
+        self._tail = buf[-1:].copy()
+        return out
+
+
 class AudioIngestor:
     """
     Handles ingestion of raw audio bytes or streams.
+
+    WAV files are detected from their header. Anything else is treated as
+    headerless PCM and needs ``sample_rate`` (and ``channels`` / ``dtype`` if
+    they differ from mono 16-bit).
+
+    Args:
+        source: Path to a ``.wav`` or raw PCM file.
+        sample_rate: Sample rate of raw PCM input.
+        channels: Channel count of raw PCM input.
+        dtype: NumPy dtype string of raw PCM samples (``"<i2"``, ``"<f4"``, ...).
+        speakers: Names for each channel, e.g. ``["user", "agent"]``.
     """
-    def __init__(self, source: str):
+    def __init__(
+        self,
+        source: str,
+        sample_rate: Optional[int] = None,
+        channels: int = 1,
+        dtype: str = "<i2",
+        speakers: Optional[Sequence[str]] = None,
+    ):
         self.source = source
+        self._file = open(source, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        buf = self._mm if self._mm is not None else b""
+
+        if buf[:4] == b"RIFF":
+            try:
+                self.format = parse_wav_header(buf)
+            except Exception:
+                self.close()
+                raise
+        else:
+            if sample_rate is None:
+                self.close()
+                raise AudioFormatError(f"{source} has no WAV header; sample_rate is required for raw PCM")
+            if dtype not in _RAW_DTYPES:
+                self.close()
+                raise AudioFormatError(f"Unsupported raw PCM dtype {dtype!r}")
+            self.format = AudioFormat(sample_rate, channels, dtype, 0, size)
+
+        if speakers is not None and len(speakers) != self.format.channels:
+            self.close()
+            raise ValueError(f"Expected {self.format.channels} speaker names, got {len(speakers)}")
+        self.speakers: List[str] = (
+            list(speakers) if speakers is not None
+            else [f"channel_{i}" for i in range(self.format.channels)]
+        )
+
+    def __enter__(self) -> "AudioIngestor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the mapping. Views still referenced keep it alive until collected."""
+        if self._mm is not None:
+            try:
+                self._mm.close()
+            except BufferError:
+                pass  # exported views outstanding; the mapping is freed with them
+            self._mm = None
+        self._file.close()
+
+    @property
+    def sample_rate(self) -> int:
+        return self.format.sample_rate
+
+    @property
+    def channels(self) -> int:
+        return self.format.channels
+
+    @property
+    def duration(self) -> float:
+        return self.format.duration
+
+    def _data(self) -> memoryview:
+        fmt = self.format
+        if self._mm is None:
+            return memoryview(b"")
+        usable = fmt.num_samples * fmt.block_align
+        return memoryview(self._mm)[fmt.data_offset:fmt.data_offset + usable]
 
     def read(self) -> bytes:
-        raise NotImplementedError
+        """Return the full PCM payload. Copies; prefer ``frames`` or ``arrays``."""
+        return self._data().tobytes()
+
+    def frame_samples(self, frame_ms: float) -> int:
+        """Samples per channel in a frame of ``frame_ms``."""
+        return max(1, int(round(self.sample_rate * frame_ms / 1000.0)))
+
+    def frames(self, frame_ms: float = 20.0) -> Iterator[memoryview]:
+        """Yield interleaved PCM frames as zero-copy ``memoryview`` slices.
+
+        The last frame may be shorter.
+        """
+        data = self._data()
+        step = self.frame_samples(frame_ms) * self.format.block_align
+        for start in range(0, len(data), step):
+            yield data[start:start + step]
+
+    def samples(self) -> "np.ndarray":
+        """The whole recording as a zero-copy ``(n_samples, channels)`` array view."""
+        np = require_numpy()
+        fmt = self.format
+        if self._mm is None:
+            return np.zeros((0, fmt.channels), dtype=fmt.dtype)
+        flat = np.frombuffer(self._mm, dtype=fmt.dtype, count=fmt.num_samples * fmt.channels, offset=fmt.data_offset)
+        return flat.reshape(-1, fmt.channels)
+
+    def channel(self, index: int) -> "np.ndarray":
+        """A zero-copy strided 1-D view of one channel."""
+        return self.samples()[:, index]
+
+    def speaker_channels(self) -> Dict[str, "np.ndarray"]:
+        """``{speaker: 1-D channel view}`` for the whole recording."""
+        data = self.samples()
+        return {name: data[:, i] for i, name in enumerate(self.speakers)}
+
+    def arrays(self, frame_ms: float = 20.0, target_rate: Optional[int] = None) -> Iterator["np.ndarray"]:
+        """Yield ``(n, channels)`` frames.
+
+        Without ``target_rate`` each frame is a zero-copy view into the file.
+        With it, frames are resampled on the fly (float32 in [-1, 1], one
+        frame of look-behind state), so output frame lengths vary by one
+        sample.
+        """
+        data = self.samples()
+        step = self.frame_samples(frame_ms)
+        resampler = None
+        if target_rate is not None and target_rate != self.sample_rate:
+            resampler = Resampler(self.sample_rate, target_rate)
+        for start in range(0, len(data), step):
+            frame = data[start:start + step]
+            yield frame if resampler is None else resampler.process(frame)
+
+    def speaker_frames(self, frame_ms: float = 20.0, target_rate: Optional[int] = None) -> Iterator[Dict[str, "np.ndarray"]]:
+        """Like ``arrays`` but split per speaker: ``{speaker: 1-D frame}``."""
+        for frame in self.arrays(frame_ms, target_rate=target_rate):
+            yield {name: frame[:, i] for i, name in enumerate(self.speakers)}
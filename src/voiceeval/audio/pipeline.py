@@ -0,0 +1,313 @@
+"""
+Backpressured streaming audio-to-metrics pipeline.
+
+Stages run as asyncio tasks connected by bounded queues::
+
+    ingest ──▶ VAD ──▶ transcribe (speech regions only) ──▶ assemble ──▶ metrics
+
+* **ingest** reads frames from an ``AudioIngestor`` (memory-mapped views,
+  resampled to the VAD rate when needed).
+* **vad** runs one ``VADStream`` per speaker channel and emits a
+  ``SpeechRegion`` as soon as each interval closes.
+* **transcribe** slices the region (plus padding) out of the mapped file and
+  sends it to a ``BatchTranscriber``. Several workers pull from the queue and
+  group regions into backend-sized batches. Non-speech audio is never sent.
+* **assemble** inserts segments into the ``Transcript`` in timestamp order as
+  they arrive.
+* **metrics** evaluate the assembled ``Call`` once the stream ends, through
+  ``BaseMetric.aevaluate`` so judge-backed metrics await their requests.
+
+Each queue holds at most ``queue_size`` items, so a slow stage blocks the
+stage before it instead of buffering the whole call in memory. Per-stage
+``StageStats`` report throughput and per-item latency (queue wait included).
+"""
+
+import asyncio
+import bisect
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from voiceeval.audio._compat import to_pcm16
+from voiceeval.audio.batch import BatchTranscriber
+from voiceeval.audio.ingestion import AudioIngestor, Resampler
+from voiceeval.audio.vad import VAD
+from voiceeval.metrics.base import BaseMetric
+from voiceeval.metrics.voice import VAD_INTERVALS_KEY
+from voiceeval.models import Call, Transcript, TranscriptSegment
+
+_DONE = object()
+
+
+@dataclass
+class StageStats:
+    """Throughput and latency counters for one pipeline stage."""
+    name: str
+    items: int = 0
+    busy_seconds: float = 0.0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    started: Optional[float] = None
+    finished: Optional[float] = None
+
+    def record(self, enqueued_at: float, busy: float) -> None:
+        latency = time.perf_counter() - enqueued_at
+        self.items += 1
+        self.busy_seconds += busy
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    @property
+    def wall_seconds(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Items per wall-clock second."""
+        return self.items / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """Mean seconds from enqueue to processed, including queue wait."""
+        return self.total_latency / self.items if self.items else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "items": self.items,
+            "throughput": self.throughput,
+            "mean_latency": self.mean_latency,
+            "max_latency": self.max_latency,
+            "busy_seconds": self.busy_seconds,
+            "wall_seconds": self.wall_seconds,
+        }
+
+
+@dataclass(frozen=True)
+class SpeechRegion:
+    """A VAD speech interval on one speaker's channel, in seconds."""
+    speaker: str
+    start: float
+    end: float
+
+
+@dataclass
+class PipelineResult:
+    call: Call
+    metrics: Dict[str, float]
+    stats: Dict[str, StageStats]
+    audio_seconds: float = 0.0
+    speech_seconds: float = 0.0
+
+    @property
+    def speech_ratio(self) -> float:
+        """Fraction of channel-audio sent to transcription."""
+        return self.speech_seconds / self.audio_seconds if self.audio_seconds else 0.0
+
+
+@dataclass
+class _Context:
+    ingestor: AudioIngestor
+    stats: Dict[str, StageStats] = field(default_factory=dict)
+    vad_intervals: Dict[str, List[Tuple[float, float]]] = field(default_factory=dict)
+    segments: List[TranscriptSegment] = field(default_factory=list)
+    speech_seconds: float = 0.0
+
+
+class AudioPipeline:
+    """
+    Streams a recording through VAD, transcription and metrics.
+
+    Args:
+        transcriber: Batched transcription front-end; its ``concurrency`` sets
+                     the number of transcription workers.
+        vad: Voice activity detector; defaults to ``VAD()``.
+        metrics: Metrics evaluated on the assembled call.
+        frame_ms: Ingest frame size.
+        queue_size: Capacity of every inter-stage queue.
+        padding_ms: Audio kept around each speech region for the transcriber.
+    """
+
+    def __init__(
+        self,
+        transcriber: BatchTranscriber,
+        vad: Optional[VAD] = None,
+        metrics: Sequence[BaseMetric] = (),
+        frame_ms: float = 100.0,
+        queue_size: int = 16,
+        padding_ms: float = 100.0,
+    ):
+        self.transcriber = transcriber
+        self.vad = vad or VAD()
+        self.metrics = list(metrics)
+        self.frame_ms = frame_ms
+        self.queue_size = queue_size
+        self.padding = padding_ms / 1000.0
+
+    async def run(self, ingestor: AudioIngestor, call: Optional[Call] = None) -> PipelineResult:
+        """Process one recording. ``call`` supplies ids and timing for the result."""
+        ctx = _Context(ingestor)
+        for name in ("ingest", "vad", "transcribe", "assemble"):
+            ctx.stats[name] = StageStats(name)
+
+        frames: asyncio.Queue = asyncio.Queue(self.queue_size)
+        regions: asyncio.Queue = asyncio.Queue(self.queue_size)
+        segments: asyncio.Queue = asyncio.Queue(self.queue_size)
+        workers = self.transcriber.concurrency
+
+        tasks = [
+            asyncio.ensure_future(self._ingest(ctx, frames)),
+            asyncio.ensure_future(self._detect(ctx, frames, regions, workers)),
+            *(asyncio.ensure_future(self._transcribe(ctx, regions, segments)) for _ in range(workers)),
+            asyncio.ensure_future(self._assemble(ctx, segments, workers)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        transcript = Transcript(
+            segments=ctx.segments,
+            metadata={VAD_INTERVALS_KEY: {k: [list(i) for i in v] for k, v in ctx.vad_intervals.items()}},
+        )
+        if call is None:
+            call = Call(call_id=str(ingestor.source), agent_id="unknown", start_time=datetime.now(timezone.utc))
+        call = call.model_copy(update={"transcript": transcript})
+
+        metric_stats = ctx.stats["metrics"] = StageStats("metrics")
+        metric_stats.started = time.perf_counter()
+        results: Dict[str, float] = {}
+        for metric in self.metrics:
+            started = time.perf_counter()
+            results[metric.name] = await metric.aevaluate(call)
+            metric_stats.record(started, time.perf_counter() - started)
+        metric_stats.finished = time.perf_counter()
+
+        return PipelineResult(
+            call=call,
+            metrics=results,
+            stats=ctx.stats,
+            audio_seconds=ingestor.duration * ingestor.channels,
+            speech_seconds=ctx.speech_seconds,
+        )
+
+    def run_sync(self, ingestor: AudioIngestor, call: Optional[Call] = None) -> PipelineResult:
+        return asyncio.run(self.run(ingestor, call))
+
+    # -----------------------------------------------------------------------
+    # Stages
+    # -----------------------------------------------------------------------
+
+    async def _ingest(self, ctx: _Context, out: asyncio.Queue) -> None:
+        stats = ctx.stats["ingest"]
+        stats.started = time.perf_counter()
+        for frame in ctx.ingestor.speaker_frames(self.frame_ms, target_rate=self.vad.sample_rate):
+            now = time.perf_counter()
+            await out.put((now, frame))
+            stats.record(now, 0.0)
+        await out.put(_DONE)
+        stats.finished = time.perf_counter()
+
+    async def _detect(self, ctx: _Context, inbox: asyncio.Queue, out: asyncio.Queue, workers: int) -> None:
+        stats = ctx.stats["vad"]
+        streams = {name: self.vad.stream() for name in ctx.ingestor.speakers}
+        ctx.vad_intervals = {name: [] for name in ctx.ingestor.speakers}
+        stats.started = time.perf_counter()
+
+        async def emit(name: str, intervals: List[Tuple[float, float]]) -> None:
+            for start, end in intervals:
+                ctx.vad_intervals[name].append((start, end))
+                await out.put((time.perf_counter(), SpeechRegion(name, start, end)))
+
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                break
+            enqueued_at, frame = item
+            started = time.perf_counter()
+            closed = [(name, streams[name].feed(samples)) for name, samples in frame.items()]
+            stats.record(enqueued_at, time.perf_counter() - started)
+            for name, intervals in closed:
+                await emit(name, intervals)
+
+        for name, stream in streams.items():
+            await emit(name, stream.flush())
+        for _ in range(workers):
+            await out.put(_DONE)
+        stats.finished = time.perf_counter()
+
+    def _region_pcm(self, ctx: _Context, region: SpeechRegion) -> bytes:
+        """Slice a padded region from the mapped file as 16-bit PCM at the backend rate."""
+        ingestor = ctx.ingestor
+        rate = ingestor.sample_rate
+        start = max(0, int((region.start - self.padding) * rate))
+        end = min(ingestor.format.num_samples, int((region.end + self.padding) * rate))
+        samples = ingestor.channel(ingestor.speakers.index(region.speaker))[start:end]
+        target = self.transcriber.backend.sample_rate
+        if target and target != rate:
+            samples = Resampler(rate, target).process(samples)
+        return to_pcm16(samples)
+
+    async def _transcribe(self, ctx: _Context, inbox: asyncio.Queue, out: asyncio.Queue) -> None:
+        stats = ctx.stats["transcribe"]
+        if stats.started is None:
+            stats.started = time.perf_counter()
+        batch_size = self.transcriber.batch_size
+        done = False
+        while not done:
+            batch: List[Tuple[float, SpeechRegion]] = []
+            item = await inbox.get()
+            while item is not _DONE:
+                batch.append(item)
+                if len(batch) >= batch_size or inbox.empty():
+                    break
+                item = inbox.get_nowait()
+            done = item is _DONE
+            if not batch:
+                continue
+
+            started = time.perf_counter()
+            clips = [self._region_pcm(ctx, region) for _, region in batch]
+            results = await self.transcriber.transcribe_many(clips)
+            busy = time.perf_counter() - started
+            for (enqueued_at, region), result in zip(batch, results):
+                ctx.speech_seconds += region.end - region.start
+                stats.record(enqueued_at, busy / len(batch))
+                offset = max(0.0, region.start - self.padding)
+                for segment in result:
+                    await out.put((time.perf_counter(), _place(segment, region, offset)))
+        await out.put(_DONE)
+        stats.finished = time.perf_counter()
+
+    async def _assemble(self, ctx: _Context, inbox: asyncio.Queue, producers: int) -> None:
+        stats = ctx.stats["assemble"]
+        stats.started = time.perf_counter()
+        keys: List[float] = []
+        remaining = producers
+        while remaining:
+            item = await inbox.get()
+            if item is _DONE:
+                remaining -= 1
+                continue
+            enqueued_at, segment = item
+            started = time.perf_counter()
+            index = bisect.bisect_right(keys, segment.timestamp)
+            keys.insert(index, segment.timestamp)
+            ctx.segments.insert(index, segment)
+            stats.record(enqueued_at, time.perf_counter() - started)
+        stats.finished = time.perf_counter()
+
+
+def _place(segment: TranscriptSegment, region: SpeechRegion, offset: float) -> TranscriptSegment:
+    """Shift a clip-relative segment onto the call timeline and label its speaker."""
+    update: Dict[str, Any] = {
+        "speaker": region.speaker,
+        "timestamp": segment.timestamp + offset,
+        "end_timestamp": (segment.end_timestamp + offset) if segment.end_timestamp is not None else region.end,
+    }
+    return segment.model_copy(update=update)
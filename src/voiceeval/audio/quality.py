@@ -0,0 +1,395 @@
+"""
+Per-channel audio-quality analysis in one vectorized pass.
+
+``AudioQualityAnalyzer.analyze`` walks an ``AudioIngestor`` in chunks of
+whole frames. Each chunk of each channel is framed once as a
+``(n_frames, frame_len)`` view; the frame power and power spectrum computed
+from it feed every measure and the VAD, so the audio is read once:
+
+* **clipping** — fraction of samples at or above ``clip_level`` of full scale.
+* **RMS level** — dBFS over all samples.
+* **loudness** — BS.1770-style integrated loudness (LUFS): K-weighting is
+  applied to each frame's power spectrum, then 400 ms blocks (100 ms hop)
+  are gated at -70 LUFS and -10 LU relative. Frequency-domain weighting of
+  short frames approximates the standard's IIR filters; expect agreement
+  within a fraction of a LU on speech.
+* **SNR** — mean power of VAD speech frames over mean power of the other
+  (non-silent) frames, in dB.
+* **dropouts** — runs of identical samples (packet loss, concealment gaps)
+  between ``min_dropout_ms`` and ``max_dropout_ms`` long, bounded by live
+  audio on both sides. Longer runs are treated as gated silence.
+* **echo** — peak normalized cross-correlation between channels at lags of
+  0 to ``max_echo_ms``, i.e. how much of another speaker leaks into this
+  channel after a delay. Cross-spectra are accumulated per chunk with FFTs.
+
+``analyze`` also returns the VAD intervals, so timeline metrics
+(``InterruptionRateMetric``, ``SilenceDurationMetric``) reuse the same pass.
+
+Requires NumPy (``pip install voiceeval-sdk[audio]``).
+"""
+
+import math
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from voiceeval.audio._compat import require_numpy
+from voiceeval.audio.vad import VAD, Interval
+
+if TYPE_CHECKING:
+    import numpy as np
+    from voiceeval.audio.ingestion import AudioIngestor
+
+# Pooled measures across every channel are reported under this name.
+ALL_CHANNELS = "all"
+
+LUFS_FLOOR = -70.0
+DBFS_FLOOR = -100.0
+MAX_SNR_DB = 100.0
+
+# BS.1770 K-weighting: high-shelf then high-pass biquad (analog prototypes,
+# so the response is correct at any sample rate).
+_SHELF_F0, _SHELF_GAIN_DB, _SHELF_Q = 1681.974450955533, 3.999843853973347, 0.7071752369554196
+_HIGHPASS_F0, _HIGHPASS_Q = 38.13547087602444, 0.5003270373238773
+
+
+@dataclass
+class ChannelQuality:
+    """Quality measures for one channel, or pooled over all channels."""
+    duration: float = 0.0
+    clipping_ratio: float = 0.0
+    rms_dbfs: float = DBFS_FLOOR
+    lufs: float = LUFS_FLOOR
+    snr_db: float = 0.0
+    speech_seconds: float = 0.0
+    dropouts: int = 0
+    dropout_seconds: float = 0.0
+    echo_correlation: float = 0.0
+    echo_delay_ms: float = 0.0
+
+    @property
+    def dropouts_per_minute(self) -> float:
+        return self.dropouts / (self.duration / 60.0) if self.duration else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return asdict(self)
+
+
+@dataclass
+class QualityReport:
+    """
+    Result of ``AudioQualityAnalyzer.analyze``.
+
+    Attributes:
+        channels: Measures per speaker, plus ``"all"`` pooled over channels.
+        vad_intervals: ``{speaker: [(start, end), ...]}`` from the same pass.
+    """
+    channels: Dict[str, ChannelQuality] = field(default_factory=dict)
+    vad_intervals: Dict[str, List[Interval]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        return {name: quality.to_dict() for name, quality in self.channels.items()}
+
+
+def k_weighting(sample_rate: int, frame_len: int) -> "np.ndarray":
+    """
+    Per-bin weights turning ``|rfft(frame)|**2`` into K-weighted mean-square power.
+
+    Includes the one-sided spectrum (Parseval) scaling, so with flat weights
+    ``spectrum @ weights`` equals ``mean(frame ** 2)``.
+    """
+    np = require_numpy()
+    z = np.exp(-1j * 2 * np.pi * np.fft.rfftfreq(frame_len))  # z^-1 on the unit circle
+
+    def response(b, a):
+        return np.abs((b[0] + b[1] * z + b[2] * z * z) / (a[0] + a[1] * z + a[2] * z * z)) ** 2
+
+    k = math.tan(math.pi * _SHELF_F0 / sample_rate)
+    vh = 10 ** (_SHELF_GAIN_DB / 20.0)
+    vb = vh ** 0.4996667741545416
+    a0 = 1 + k / _SHELF_Q + k * k
+    shelf = response(
+        ((vh + vb * k / _SHELF_Q + k * k) / a0, 2 * (k * k - vh) / a0, (vh - vb * k / _SHELF_Q + k * k) / a0),
+        (1.0, 2 * (k * k - 1) / a0, (1 - k / _SHELF_Q + k * k) / a0),
+    )
+    k = math.tan(math.pi * _HIGHPASS_F0 / sample_rate)
+    a0 = 1 + k / _HIGHPASS_Q + k * k
+    highpass = response((1.0, -2.0, 1.0), (1.0, 2 * (k * k - 1) / a0, (1 - k / _HIGHPASS_Q + k * k) / a0))
+
+    parseval = np.full(len(z), 2.0)
+    parseval[0] = 1.0
+    if frame_len % 2 == 0:
+        parseval[-1] = 1.0
+    return shelf * highpass * parseval / (frame_len * frame_len)
+
+
+def integrated_loudness(block_power: "np.ndarray") -> float:
+    """BS.1770 gated loudness (LUFS) from mean-square K-weighted block powers."""
+    np = require_numpy()
+    if len(block_power) == 0:
+        return LUFS_FLOOR
+    loudness = -0.691 + 10 * np.log10(np.maximum(block_power, 1e-20))
+    gated = block_power[loudness > LUFS_FLOOR]
+    if len(gated) == 0:
+        return LUFS_FLOOR
+    relative = -0.691 + 10 * math.log10(float(gated.mean())) - 10.0
+    gated = block_power[(loudness > LUFS_FLOOR) & (loudness > relative)]
+    return max(LUFS_FLOOR, -0.691 + 10 * math.log10(float(gated.mean())))
+
+
+class _DropoutTracker:
+    """Finds runs of identical samples across chunk boundaries."""
+
+    def __init__(self, min_len: int, max_len: int):
+        self.min_len = min_len
+        self.max_len = max_len
+        self.previous = None  # last sample of the previous chunk
+        self.run = 0  # length of the open run of repeats, in samples
+        self.seen_live = False  # live audio precedes the open run
+        self.count = 0
+        self.samples = 0
+
+    def feed(self, x: "np.ndarray") -> None:
+        np = require_numpy()
+        if len(x) == 0:
+            return
+        # The very first sample counts as a repeat, so leading silence is never "bounded".
+        first = np.array([True]) if self.previous is None else x[:1] == self.previous
+        repeat = np.concatenate([first, x[1:] == x[:-1]])
+        self.previous = x[-1:].copy()
+        live_at = np.flatnonzero(~repeat)
+        if len(live_at) == 0:
+            self.run += len(x)
+            return
+        # Repeats before each live sample: the open run, then gaps between live samples.
+        closed = np.concatenate([[self.run + int(live_at[0])], np.diff(live_at) - 1])
+        bounded = np.ones(len(closed), dtype=bool)
+        bounded[0] = self.seen_live
+        # n repeats after a live sample make n + 1 identical samples.
+        lengths = closed + 1
+        hits = bounded & (closed > 0) & (lengths >= self.min_len) & (lengths <= self.max_len)
+        self.count += int(hits.sum())
+        self.samples += int(lengths[hits].sum())
+        self.seen_live = True
+        self.run = len(x) - 1 - int(live_at[-1])
+
+
+class _EchoAccumulator:
+    """Accumulates the cross-spectrum of a channel pair over chunks."""
+
+    def __init__(self, n_fft: int, max_lag: int):
+        self.n_fft = n_fft
+        self.max_lag = max_lag
+        self.cross = None
+
+    def feed(self, spectra: List["np.ndarray"], a: int, b: int) -> None:
+        np = require_numpy()
+        product = np.conj(spectra[a]) * spectra[b]
+        self.cross = product if self.cross is None else self.cross + product
+
+    def correlation(self) -> "np.ndarray":
+        """sum_t a[t] * b[t + lag] for lags -max_lag..max_lag (index max_lag is lag 0)."""
+        np = require_numpy()
+        if self.cross is None:
+            return np.zeros(2 * self.max_lag + 1)
+        r = np.fft.irfft(self.cross, self.n_fft)
+        return np.concatenate([r[-self.max_lag:] if self.max_lag else r[:0], r[: self.max_lag + 1]])
+
+
+class AudioQualityAnalyzer:
+    """
+    Computes ``ChannelQuality`` for every channel of a recording.
+
+    Args:
+        vad: Detector configuration for speech/noise frames; it is re-targeted
+             to the recording's sample rate, so no resampling is needed.
+        chunk_ms: Audio processed per vectorized step; bounds memory use.
+        clip_level: Fraction of full scale counted as clipped.
+        min_dropout_ms: Shortest run of identical samples counted as a dropout.
+        max_dropout_ms: Longest; longer runs are treated as gated silence.
+        max_echo_ms: Largest echo delay searched.
+    """
+
+    def __init__(
+        self,
+        vad: Optional[VAD] = None,
+        chunk_ms: float = 10000.0,
+        clip_level: float = 0.999,
+        min_dropout_ms: float = 10.0,
+        max_dropout_ms: float = 400.0,
+        max_echo_ms: float = 500.0,
+    ):
+        self.vad = vad or VAD()
+        self.chunk_ms = chunk_ms
+        self.clip_level = clip_level
+        self.min_dropout_ms = min_dropout_ms
+        self.max_dropout_ms = max_dropout_ms
+        self.max_echo_ms = max_echo_ms
+
+    def settings(self) -> Dict[str, Any]:
+        """The parameters that affect a report (``chunk_ms`` does not), for cache keys."""
+        return {
+            "clip_level": self.clip_level,
+            "min_dropout_ms": self.min_dropout_ms,
+            "max_dropout_ms": self.max_dropout_ms,
+            "max_echo_ms": self.max_echo_ms,
+            "vad": dict(self.vad._options),
+        }
+
+    def analyze(self, ingestor: "AudioIngestor") -> QualityReport:
+        np = require_numpy()
+        rate = ingestor.sample_rate
+        vad = self.vad.with_sample_rate(rate)
+        frame_len = vad.frame_len
+        speakers = ingestor.speakers
+        n_channels = len(speakers)
+        chunk_len = max(1, int(self.chunk_ms / 1000.0 * rate / frame_len)) * frame_len
+        max_lag = int(self.max_echo_ms / 1000.0 * rate)
+
+        data = ingestor.samples()
+        scale = float(np.iinfo(data.dtype).max + 1) if data.dtype.kind in "iu" else 1.0
+        offset = 0.0
+        if data.dtype.kind == "u":  # 8-bit PCM is unsigned, centred at 128
+            scale = offset = scale / 2
+        weights = k_weighting(rate, frame_len)
+
+        streams = [vad.stream() for _ in speakers]
+        intervals: List[List[Interval]] = [[] for _ in speakers]
+        dropouts = [
+            _DropoutTracker(int(self.min_dropout_ms / 1000.0 * rate), int(self.max_dropout_ms / 1000.0 * rate))
+            for _ in speakers
+        ]
+        # Zero-padded so correlations up to max_lag don't wrap around.
+        n_fft = 1 << (chunk_len + max_lag - 1).bit_length()
+        pairs = {(a, b): _EchoAccumulator(n_fft, max_lag) for a in range(n_channels) for b in range(a + 1, n_channels)}
+        clipped = np.zeros(n_channels, dtype=np.int64)
+        sum_sq = np.zeros(n_channels)
+        frame_power: List[List["np.ndarray"]] = [[] for _ in speakers]
+        weighted_power: List[List["np.ndarray"]] = [[] for _ in speakers]
+
+        for start in range(0, len(data), chunk_len):
+            block = data[start:start + chunk_len]
+            spectra = []
+            for c in range(n_channels):
+                raw = block[:, c]
+                dropouts[c].feed(raw)
+                x = raw.astype(np.float32)
+                if offset:
+                    x -= offset
+                if scale != 1.0:
+                    x /= scale
+                clipped[c] += int(np.count_nonzero(np.abs(x) >= self.clip_level))
+                sum_sq[c] += float(np.dot(x, x))
+
+                n_frames = len(x) // frame_len
+                if n_frames:
+                    frames = x[: n_frames * frame_len].reshape(n_frames, frame_len)
+                    power = np.einsum("ij,ij->i", frames, frames) / frame_len
+                    spectrum = np.abs(np.fft.rfft(frames, axis=1)) ** 2
+                    frame_power[c].append(power)
+                    weighted_power[c].append(spectrum @ weights)
+                    energy_db, flatness = vad.frame_features(frames, power=power, spectrum=spectrum)
+                    intervals[c].extend(streams[c].feed_features(energy_db, flatness))
+                if pairs:
+                    spectra.append(np.fft.rfft(x, n_fft))
+            for (a, b), acc in pairs.items():
+                acc.feed(spectra, a, b)
+
+        for c, stream in enumerate(streams):
+            intervals[c].extend(stream.flush())
+
+        n_samples = len(data)
+        duration = n_samples / rate
+        frame_seconds = frame_len / rate
+        powers = [np.concatenate(p) if p else np.zeros(0) for p in frame_power]
+        weighted = [np.concatenate(p) if p else np.zeros(0) for p in weighted_power]
+        masks = [self._speech_mask(len(powers[c]), intervals[c], frame_seconds) for c in range(n_channels)]
+        echo = self._echo(pairs, sum_sq, n_channels, rate)
+
+        report = QualityReport(vad_intervals={name: intervals[c] for c, name in enumerate(speakers)})
+        hop = max(1, int(round(0.1 / frame_seconds)))
+        for c, name in enumerate(speakers):
+            report.channels[name] = ChannelQuality(
+                duration=duration,
+                clipping_ratio=int(clipped[c]) / n_samples if n_samples else 0.0,
+                rms_dbfs=self._dbfs(sum_sq[c], n_samples),
+                lufs=integrated_loudness(self._blocks(weighted[c], hop)),
+                snr_db=self._snr([powers[c]], [masks[c]]),
+                speech_seconds=sum(end - begin for begin, end in intervals[c]),
+                dropouts=dropouts[c].count,
+                dropout_seconds=dropouts[c].samples / rate,
+                echo_correlation=echo[c][0],
+                echo_delay_ms=echo[c][1],
+            )
+
+        # Pooled: BS.1770 sums channel powers per block; the rest pool samples/frames.
+        usable = min((len(w) for w in weighted), default=0)
+        best = max(range(n_channels), key=lambda c: echo[c][0]) if n_channels else 0
+        report.channels[ALL_CHANNELS] = ChannelQuality(
+            duration=duration,
+            clipping_ratio=int(clipped.sum()) / (n_samples * n_channels) if n_samples and n_channels else 0.0,
+            rms_dbfs=self._dbfs(float(sum_sq.sum()), n_samples * n_channels),
+            lufs=integrated_loudness(self._blocks(sum(w[:usable] for w in weighted) if weighted else np.zeros(0), hop)),
+            snr_db=self._snr(powers, masks),
+            speech_seconds=sum(q.speech_seconds for q in report.channels.values()),
+            dropouts=sum(d.count for d in dropouts),
+            dropout_seconds=sum(d.samples for d in dropouts) / rate,
+            echo_correlation=echo[best][0] if n_channels else 0.0,
+            echo_delay_ms=echo[best][1] if n_channels else 0.0,
+        )
+        return report
+
+    @staticmethod
+    def _dbfs(sum_sq: float, n: int) -> float:
+        if not n or sum_sq <= 0:
+            return DBFS_FLOOR
+        return max(DBFS_FLOOR, 10 * math.log10(sum_sq / n))
+
+    @staticmethod
+    def _blocks(frame_power: "np.ndarray", hop: int) -> "np.ndarray":
+        """Mean power of 400 ms blocks (four hops) every 100 ms hop."""
+        np = require_numpy()
+        size = 4 * hop
+        if len(frame_power) < size:
+            return np.zeros(0)
+        totals = np.concatenate([[0.0], np.cumsum(frame_power, dtype=np.float64)])
+        starts = np.arange(0, len(frame_power) - size + 1, hop)
+        return (totals[starts + size] - totals[starts]) / size
+
+    @staticmethod
+    def _speech_mask(n_frames: int, intervals: List[Interval], frame_seconds: float) -> "np.ndarray":
+        np = require_numpy()
+        mask = np.zeros(n_frames, dtype=bool)
+        for begin, end in intervals:
+            mask[int(round(begin / frame_seconds)):int(round(end / frame_seconds))] = True
+        return mask
+
+    @staticmethod
+    def _snr(powers: List["np.ndarray"], masks: List["np.ndarray"]) -> float:
+        np = require_numpy()
+        speech = np.concatenate([p[m] for p, m in zip(powers, masks)]) if powers else np.zeros(0)
+        noise = np.concatenate([p[~m] for p, m in zip(powers, masks)]) if powers else np.zeros(0)
+        noise = noise[noise > 0]  # digital silence carries no noise estimate
+        if len(speech) == 0:
+            return 0.0
+        if len(noise) == 0:
+            return MAX_SNR_DB
+        p_speech, p_noise = float(speech.mean()), float(noise.mean())
+        ratio = max(p_speech - p_noise, p_noise * 1e-3) / p_noise
+        return min(MAX_SNR_DB, 10 * math.log10(ratio))
+
+    def _echo(self, pairs, energy, n_channels: int, rate: int) -> List[Tuple[float, float]]:
+        """Per channel: (peak correlation with any other channel leading it, delay in ms)."""
+        np = require_numpy()
+        best = [(0.0, 0.0)] * n_channels
+        for (a, b), acc in pairs.items():
+            norm = math.sqrt(energy[a] * energy[b])
+            if norm <= 0:
+                continue
+            r = acc.correlation() / norm
+            lag0 = acc.max_lag
+            # b echoes a: b[t + lag] ~ a[t] for lag >= 0; a echoes b for negative lags.
+            for target, window, lags in ((b, r[lag0:], np.arange(0, lag0 + 1)), (a, r[lag0::-1], np.arange(0, lag0 + 1))):
+                i = int(np.argmax(window))
+                if window[i] > best[target][0]:
+                    best[target] = (float(window[i]), float(lags[i] / rate * 1000.0))
+        return best
@@ -1,9 +1,43 @@
-from typing import List
+from typing import TYPE_CHECKING, List, Optional
+from voiceeval.audio._compat import to_pcm16
 from voiceeval.models import TranscriptSegment
 
+if TYPE_CHECKING:
+    from voiceeval.audio.ingestion import AudioIngestor
+
+
 class Transcriber:
     """
     Base class for transcription services.
+
+    Attributes:
+        sample_rate: Sample rate ``transcribe`` expects. ``transcribe_ingestor``
+                     resamples to it; ``None`` passes audio at its native rate.
     """
+    sample_rate: Optional[int] = None
+
     def transcribe(self, audio: bytes) -> List[TranscriptSegment]:
         raise NotImplementedError
+
+    def transcribe_ingestor(self, ingestor: "AudioIngestor", chunk_ms: float = 1000.0) -> List[TranscriptSegment]:
+        """
+        Transcribe each channel of an ``AudioIngestor`` as its own speaker.
+
+        Every channel is converted to mono 16-bit PCM for ``transcribe`` and
+        the resulting segments are labelled with the channel's speaker name
+        (for multi-channel recordings) and merged in timestamp order.
+        """
+        pcm = {name: bytearray() for name in ingestor.speakers}
+        for frame in ingestor.speaker_frames(chunk_ms, target_rate=self.sample_rate):
+            for name, samples in frame.items():
+                pcm[name] += to_pcm16(samples)
+
+        segments: List[TranscriptSegment] = []
+        for name, audio in pcm.items():
+            for segment in self.transcribe(bytes(audio)):
+                if ingestor.channels > 1:
+                    segment = segment.model_copy(update={"speaker": name})
+                segments.append(segment)
+        segments.sort(key=lambda s: s.timestamp)
+        return segments
+
@@ -1,11 +1,307 @@
-from typing import List, Tuple
+"""
+Voice Activity Detection.
+
+Frame-based energy + spectral-flatness detector. Every stage is a NumPy
+operation over a ``(n_frames, frame_len)`` view of the PCM buffer, so there
+are no per-sample Python loops:
+
+1. Frame log-energy (dBFS) and spectral flatness.
+2. Adaptive noise floor: minimum of the frame energies over a sliding
+   window (minimum statistics). It follows slowly changing background noise
+   and ignores speech bursts shorter than the window.
+3. A frame is speech when its energy exceeds the floor by ``threshold_db``
+   and its spectrum is not noise-like (flatness below ``max_flatness``).
+4. Hangover smoothing keeps speech active for ``hangover_ms`` after the last
+   speech frame, bridging short pauses between words.
+
+``VAD.stream()`` returns a ``VADStream`` that accepts chunks incrementally and
+emits intervals as soon as they close, i.e. at most ``hangover_ms`` plus one
+frame after speech ends. Set ``max_interval_ms`` to also bound the delay
+during long uninterrupted speech. The first ``noise_window_ms`` of a stream
+are held back until the window is full: only then is the noise floor known,
+so a steady hum is not mistaken for speech and speech at the very start of
+the stream is still detected.
+
+Requires NumPy (``pip install voiceeval-sdk[audio]``).
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+from voiceeval.audio._compat import require_numpy, to_float32
+
+if TYPE_CHECKING:
+    import numpy as np
+    from voiceeval.audio.ingestion import AudioIngestor
+
+Interval = Tuple[float, float]
+
+_ENERGY_FLOOR_DB = -100.0
+
+
+def _as_samples(audio: Union[bytes, bytearray, memoryview, "np.ndarray"]) -> "np.ndarray":
+    """Return mono float32 samples in [-1, 1]; float32 input is not copied."""
+    np = require_numpy()
+    if isinstance(audio, np.ndarray):
+        samples = audio
+    else:
+        buf = memoryview(audio).cast("B")
+        samples = np.frombuffer(buf[: len(buf) - len(buf) % 2], dtype="<i2")
+    if samples.ndim != 1:
+        raise ValueError("VAD expects mono audio; split channels first")
+    return to_float32(samples)
+
 
 class VAD:
     """
     Voice Activity Detection utilities.
+
+    Args:
+        sample_rate: Sample rate of the PCM input in Hz.
+        frame_ms: Analysis frame length.
+        threshold_db: Energy above the noise floor required for speech.
+        hangover_ms: How long speech stays active after the last speech frame.
+        min_speech_ms: Intervals shorter than this are discarded.
+        noise_window_ms: Window of the minimum-statistics noise floor.
+        max_flatness: Frames with spectral flatness above this are treated as
+                      noise regardless of energy. ``None`` disables the check.
+        min_energy_db: Absolute energy gate in dBFS, so near-digital silence
+                       is never speech.
     """
-    def detect_speech(self, audio: bytes) -> List[Tuple[float, float]]:
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        frame_ms: float = 20.0,
+        threshold_db: float = 9.0,
+        hangover_ms: float = 200.0,
+        min_speech_ms: float = 60.0,
+        noise_window_ms: float = 5000.0,
+        max_flatness: Optional[float] = 0.4,
+        min_energy_db: float = -60.0,
+    ):
+        self._options = dict(
+            frame_ms=frame_ms, threshold_db=threshold_db, hangover_ms=hangover_ms, min_speech_ms=min_speech_ms,
+            noise_window_ms=noise_window_ms, max_flatness=max_flatness, min_energy_db=min_energy_db,
+        )
+        self.sample_rate = sample_rate
+        self.frame_len = max(1, int(round(sample_rate * frame_ms / 1000.0)))
+        self.frame_duration = self.frame_len / sample_rate
+        self.threshold_db = threshold_db
+        self.hangover_frames = int(round(hangover_ms / 1000.0 / self.frame_duration))
+        self.min_speech_frames = int(round(min_speech_ms / 1000.0 / self.frame_duration))
+        self.noise_window_frames = max(1, int(round(noise_window_ms / 1000.0 / self.frame_duration)))
+        self.max_flatness = max_flatness
+        self.min_energy_db = min_energy_db
+
+    def detect_speech(self, audio: Union[bytes, "np.ndarray"]) -> List[Tuple[float, float]]:
         """
         Returns list of (start_time, end_time) tuples where speech is detected.
+
+        ``audio`` is mono 16-bit little-endian PCM bytes, or a 1-D NumPy array
+        (integer PCM or float in [-1, 1]) at ``sample_rate``.
+        """
+        stream = self.stream()
+        intervals = stream.feed(audio)
+        intervals.extend(stream.flush())
+        return intervals
+
+    def detect_channels(self, ingestor: "AudioIngestor", chunk_ms: float = 1000.0) -> Dict[str, List[Interval]]:
+        """
+        Run VAD on every channel of an ``AudioIngestor`` in a single pass.
+
+        Frames are read once from the memory-mapped file and each channel view
+        is fed to its own stream; audio at another rate is resampled on the
+        fly. Returns ``{speaker: intervals}``, ready for
+        ``SpeakerTimeline.from_transcript(..., vad=...)``.
+        """
+        streams = {name: self.stream() for name in ingestor.speakers}
+        intervals: Dict[str, List[Interval]] = {name: [] for name in ingestor.speakers}
+        for frame in ingestor.speaker_frames(chunk_ms, target_rate=self.sample_rate):
+            for name, samples in frame.items():
+                intervals[name].extend(streams[name].feed(samples))
+        for name, stream in streams.items():
+            intervals[name].extend(stream.flush())
+        return intervals
+
+    def stream(self, max_interval_ms: Optional[float] = None) -> "VADStream":
+        """Start an incremental detector with this configuration."""
+        return VADStream(self, max_interval_ms=max_interval_ms)
+
+    def with_sample_rate(self, sample_rate: int) -> "VAD":
+        """The same detector configured for audio at ``sample_rate``."""
+        if sample_rate == self.sample_rate:
+            return self
+        return VAD(sample_rate=sample_rate, **self._options)
+
+    def frame_features(
+        self,
+        frames: "np.ndarray",
+        power: Optional["np.ndarray"] = None,
+        spectrum: Optional["np.ndarray"] = None,
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Per-frame energy (dBFS) and spectral flatness for ``(n, frame_len)`` float frames.
+
+        Callers that already computed the frames' mean-square ``power`` or
+        power ``spectrum`` (``|rfft|**2``) pass them in to avoid recomputing.
+        """
+        np = require_numpy()
+        if power is None:
+            power = np.einsum("ij,ij->i", frames, frames) / frames.shape[1]
+        energy_db = 10.0 * np.log10(np.maximum(power, 10 ** (_ENERGY_FLOOR_DB / 10.0)))
+        if self.max_flatness is None:
+            return energy_db, np.zeros(len(frames), dtype=np.float32)
+        if spectrum is None:
+            spectrum = np.abs(np.fft.rfft(frames, axis=1)) ** 2
+        spectrum = spectrum + 1e-12
+        flatness = np.exp(np.mean(np.log(spectrum), axis=1)) / np.mean(spectrum, axis=1)
+        return energy_db, flatness
+
+
+class VADStream:
+    """
+    Incremental VAD over a live or chunked PCM stream.
+
+    ``feed`` returns the intervals that closed within the chunk; ``flush``
+    closes the stream and returns any interval still open. Times are seconds
+    from the first sample fed.
+    """
+    def __init__(self, vad: VAD, max_interval_ms: Optional[float] = None):
+        np = require_numpy()
+        self.vad = vad
+        self.max_interval_frames = (
+            None if max_interval_ms is None
+            else max(1, int(round(max_interval_ms / 1000.0 / vad.frame_duration)))
+        )
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._odd_byte = b""  # trailing half-sample of a byte chunk
+        self._history = np.zeros(0, dtype=np.float64)  # last noise_window - 1 frame energies
+        # Features of the first noise window, held until it is full; None afterwards.
+        self._warmup: Optional[List[Tuple["np.ndarray", "np.ndarray"]]] = []
+        self._warmup_frames = 0
+        self._frames_seen = 0
+        self._last_speech = -(10 ** 12)  # index of the most recent raw speech frame
+        self._open_start: Optional[int] = None  # first frame of the open interval
+
+    @property
+    def in_speech(self) -> bool:
+        """Whether an interval is currently open."""
+        return self._open_start is not None
+
+    @property
+    def position(self) -> float:
+        """Seconds of audio processed so far (whole frames only)."""
+        return (self._frames_seen + self._warmup_frames) * self.vad.frame_duration
+
+    def feed(self, chunk: Any) -> List[Interval]:
+        """Process a chunk and return intervals that closed within it."""
+        np = require_numpy()
+        vad = self.vad
+        if not isinstance(chunk, np.ndarray):
+            chunk = memoryview(chunk).cast("B")
+            if self._odd_byte:
+                chunk = memoryview(self._odd_byte + chunk.tobytes())
+            self._odd_byte = chunk[len(chunk) - len(chunk) % 2:].tobytes()
+        samples = _as_samples(chunk)
+        if len(self._pending):
+            samples = np.concatenate([self._pending, samples])
+        n_frames = len(samples) // vad.frame_len
+        self._pending = samples[n_frames * vad.frame_len:].copy()
+        if n_frames == 0:
+            return []
+
+        frames = samples[: n_frames * vad.frame_len].reshape(n_frames, vad.frame_len)
+        energy_db, flatness = vad.frame_features(frames)
+        return self.feed_features(energy_db, flatness)
+
+    def feed_features(self, energy_db: "np.ndarray", flatness: "np.ndarray") -> List[Interval]:
         """
-        return []
+        Advance by whole frames whose features were computed by the caller
+        (``VAD.frame_features``), e.g. an analysis pass that shares its frames
+        with the detector. Returns intervals that closed within them.
+        """
+        if len(energy_db) == 0:
+            return []
+        if self._warmup is not None:
+            self._warmup.append((energy_db, flatness))
+            self._warmup_frames += len(energy_db)
+            if self._warmup_frames < self.vad.noise_window_frames:
+                return []
+            energy_db, flatness = self._end_warmup()
+        return self._advance(energy_db, flatness)
+
+    def _end_warmup(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Release the held frames, judged against the quietest frame of the first window."""
+        np = require_numpy()
+        energy_db = np.concatenate([e for e, _ in self._warmup])
+        flatness = np.concatenate([f for _, f in self._warmup])
+        window = self.vad.noise_window_frames
+        self._history = np.full(window - 1, energy_db[:window].min())
+        self._warmup = None
+        self._warmup_frames = 0
+        return energy_db, flatness
+
+    def _advance(self, energy_db: "np.ndarray", flatness: "np.ndarray") -> List[Interval]:
+        np = require_numpy()
+        vad = self.vad
+        n_frames = len(energy_db)
+
+        # Minimum-statistics noise floor over a sliding window, carried across chunks.
+        window = vad.noise_window_frames
+        padded = np.concatenate([self._history, energy_db])
+        floor = np.lib.stride_tricks.sliding_window_view(padded, window).min(axis=1)[-n_frames:]
+        self._history = padded[-(window - 1):] if window > 1 else padded[:0]
+
+        raw = (energy_db > floor + vad.threshold_db) & (energy_db > vad.min_energy_db)
+        if vad.max_flatness is not None:
+            raw &= flatness < vad.max_flatness
+
+        # Hangover: active while within hangover_frames of the latest speech frame.
+        index = np.arange(self._frames_seen, self._frames_seen + n_frames)
+        last_speech = np.maximum.accumulate(np.where(raw, index, self._last_speech))
+        active = (index - last_speech) <= vad.hangover_frames
+        self._last_speech = int(last_speech[-1])
+
+        intervals = self._collect(active, index[0])
+        self._frames_seen += n_frames
+        return intervals
+
+    def flush(self) -> List[Interval]:
+        """Close the stream, returning the intervals still held or open."""
+        intervals: List[Interval] = []
+        if self._warmup:
+            intervals.extend(self._advance(*self._end_warmup()))
+        self._warmup = None
+        if self._open_start is not None:
+            end = min(self._frames_seen, self._last_speech + 1)
+            self._emit(self._open_start, end, intervals)
+            self._open_start = None
+        return intervals
+
+    def _collect(self, active: "np.ndarray", first: int) -> List[Interval]:
+        """Turn a boolean activity mask into closed intervals (loops over transitions only)."""
+        np = require_numpy()
+        edges = np.diff(np.concatenate([[self._open_start is not None], active]).astype(np.int8))
+        starts = (np.flatnonzero(edges == 1) + first).tolist()
+        ends = (np.flatnonzero(edges == -1) + first).tolist()
+        if self._open_start is not None:
+            starts.insert(0, self._open_start)
+
+        intervals: List[Interval] = []
+        for start, end in zip(starts, ends):
+            # Activity ends hangover_frames after the last speech frame; trim that tail.
+            self._emit(start, end - self.vad.hangover_frames, intervals)
+
+        open_start = starts[-1] if len(starts) > len(ends) else None
+        if open_start is not None and self.max_interval_frames is not None:
+            end = first + len(active)
+            while end - open_start > self.max_interval_frames:
+                split = open_start + self.max_interval_frames
+                self._emit(open_start, split, intervals)
+                open_start = split
+        self._open_start = open_start
+        return intervals
+
+    def _emit(self, start: int, end: int, out: List[Interval]) -> None:
+        if end - start >= max(1, self.vad.min_speech_frames):
+            duration = self.vad.frame_duration
+            out.append((start * duration, end * duration))
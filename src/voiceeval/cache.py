@@ -0,0 +1,71 @@
+"""
+Content-addressed on-disk cache for expensive per-clip / per-call results.
+
+Values are JSON documents stored under ``<directory>/<key[:2]>/<key>.json``.
+Keys are SHA-256 digests of the inputs (see ``content_key``), so identical
+audio or prompts hit the cache regardless of file name or call id. Writes
+are atomic (temp file + rename), so concurrent writers and interrupted runs
+never leave partial entries behind.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
+
+
+def content_key(*parts: Union[bytes, str]) -> str:
+    """SHA-256 hex digest over ``parts``; strings are UTF-8 encoded.
+
+    Each part is length-prefixed so ``("ab", "c")`` and ``("a", "bc")`` differ.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        raw = part.encode("utf-8") if isinstance(part, str) else part
+        digest.update(len(raw).to_bytes(8, "little"))
+        digest.update(raw)
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """
+    JSON-on-disk cache keyed by content hash.
+
+    Args:
+        directory: Cache root; created if missing.
+    """
+
+    def __init__(self, directory: Union[str, "os.PathLike[str]"]):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on a miss or an unreadable entry."""
+        try:
+            with open(self._path(key), "rb") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).exists()
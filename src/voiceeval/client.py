@@ -2,8 +2,11 @@ import os
 import logging
 from typing import Optional, List, Callable, Sequence
 from voiceeval.models import Call
+from voiceeval.observability.budget import CallBudget
+from voiceeval.observability.detail import DetailLevelSpanProcessor, SpanDurations
 from voiceeval.observability.exporters import PostProcessingSpanExporter, enforce_name_override
 from voiceeval.observability.processor import CallIdSpanProcessor
+from voiceeval.observability.profiles import AgentProfile, ProfileRouter
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
@@ -25,6 +28,21 @@ class Client:
     All LLM calls and LiveKit spans are automatically traced and exported.
     No ``@observe`` decorator or ``client.flush()`` required — OTel flushes
     on process exit automatically.
+
+    To host several agents in one process, pass ``profiles``; each session
+    picks its agent with ``agent_scope(name)``::
+
+        client = Client(api_key="ve_default", profiles=[
+            AgentProfile("billing", api_key="ve_tenant_a"),
+            AgentProfile("support", api_key="ve_tenant_b", sample_rate=0.2),
+        ])
+
+    The profiles share one export thread and HTTP connection pool; spans
+    outside any ``agent_scope`` use the Client's own settings.
+
+    To stop one runaway call from crowding out the rest, cap each call::
+
+        client = Client(api_key="ve_xxx", call_budget=CallBudget(max_spans=2000))
     """
     def __init__(
         self,
@@ -34,6 +52,10 @@ class Client:
         auto_monitor: bool = True,
         sample_rate: float = 1.0,
         span_post_processors: Optional[List[Callable[[Sequence[ReadableSpan]], None]]] = None,
+        stream_timing: bool = True,
+        profiles: Optional[Sequence[AgentProfile]] = None,
+        unmonitored_detail: str = "full",
+        call_budget: Optional[CallBudget] = None,
     ):
         self.api_key = api_key or os.environ.get("VOICE_EVAL_API_KEY")
         if not self.api_key:
@@ -43,21 +65,30 @@ class Client:
         self.agent_name = agent_name
         self.auto_monitor = auto_monitor
         self.sample_rate = sample_rate
+        self.stream_timing = stream_timing
+        self.profiles = list(profiles) if profiles is not None else None
+        self.unmonitored_detail = unmonitored_detail
+        self.call_budget = call_budget
+        # Durations of spans withheld at "metrics" detail, by span name.
+        self.span_durations = SpanDurations()
+        self._router: Optional[ProfileRouter] = None
 
         self._validate_api_key()
         self.enable_observability(span_post_processors)
 
-    def _validate_api_key(self):
+    def _validate_api_key(self, api_key: Optional[str] = None, ingest_url: Optional[str] = None):
         """Checks if the API key is valid by calling the server."""
-        if "/v1/traces" in self.ingest_url:
-            validate_url = self.ingest_url.replace("/v1/traces", "/v1/auth/validate")
+        api_key = api_key or self.api_key
+        ingest_url = ingest_url or self.ingest_url
+        if "/v1/traces" in ingest_url:
+            validate_url = ingest_url.replace("/v1/traces", "/v1/auth/validate")
         else:
-            validate_url = self.ingest_url.replace("/traces", "/auth/validate")
+            validate_url = ingest_url.replace("/traces", "/auth/validate")
 
         try:
             response = httpx.get(
                 validate_url,
-                headers={"Authorization": f"Bearer {self.api_key}"},
+                headers={"Authorization": f"Bearer {api_key}"},
                 timeout=5.0
             )
             if response.status_code == 403:
@@ -76,30 +107,91 @@ class Client:
         # shutdown_on_exit=True (default) registers atexit handler — auto-flush on exit
         provider = TracerProvider()
 
-        # CallIdSpanProcessor runs FIRST on every span start — attaches call_id + agent_name
-        provider.add_span_processor(
-            CallIdSpanProcessor(
-                agent_name=self.agent_name,
-                auto_monitor=self.auto_monitor,
-                sample_rate=self.sample_rate,
-            )
-        )
-
-        exporter = OTLPSpanExporter(
-            endpoint=self.ingest_url,
-            headers={"Authorization": f"Bearer {self.api_key}"}
-        )
-
         post_processors = list(span_post_processors) if span_post_processors else []
         if enforce_name_override not in post_processors:
             post_processors.append(enforce_name_override)
+        self._post_processors = post_processors
 
-        exporter = PostProcessingSpanExporter(exporter, post_processors)
-        provider.add_span_processor(BatchSpanProcessor(exporter))
+        if self.profiles is not None:
+            provider.add_span_processor(self._build_router())
+        else:
+            # CallIdSpanProcessor runs FIRST on every span start — attaches call_id + agent_name
+            provider.add_span_processor(
+                CallIdSpanProcessor(
+                    agent_name=self.agent_name,
+                    auto_monitor=self.auto_monitor,
+                    sample_rate=self.sample_rate,
+                    unmonitored_detail=self.unmonitored_detail,
+                    call_budget=self.call_budget,
+                )
+            )
+            exporter = self._build_exporter(self.api_key, self.ingest_url)
+            provider.add_span_processor(
+                DetailLevelSpanProcessor(BatchSpanProcessor(exporter), self.span_durations)
+            )
         trace.set_tracer_provider(provider)
 
         self._instrument_libraries(provider)
 
+    def _build_exporter(self, api_key: str, ingest_url: str, session=None):
+        # Profiles pass the shared requests.Session so their exports reuse one connection pool.
+        extra = {"session": session} if session is not None else {}
+        exporter = OTLPSpanExporter(
+            endpoint=ingest_url,
+            headers={"Authorization": f"Bearer {api_key}"},
+            **extra,
+        )
+        return PostProcessingSpanExporter(exporter, self._post_processors)
+
+    def _build_router(self) -> ProfileRouter:
+        """One queue and exporter per profile behind a single export thread and connection pool."""
+        import requests
+
+        default = AgentProfile(
+            name=self.agent_name or "default",
+            api_key=self.api_key,
+            base_url=self.ingest_url,
+            auto_monitor=self.auto_monitor,
+            sample_rate=self.sample_rate,
+            unmonitored_detail=self.unmonitored_detail,
+            call_budget=self.call_budget,
+        )
+        self._session = requests.Session()
+        self._router = ProfileRouter(default.name, session=self._session, durations=self.span_durations)
+        self._add_route(default)
+        for profile in self.profiles:
+            self._validate_profile(profile)
+            self._add_route(profile)
+        return self._router
+
+    def add_profile(self, profile: AgentProfile):
+        """
+        Register another agent at runtime.
+
+        Args:
+            profile: The agent's settings; ``api_key`` and ``base_url`` default
+                     to the Client's. A distinct key is validated like the Client's.
+        """
+        if self._router is None:
+            raise ValueError("Client was created without profiles; pass profiles=[] to enable agent routing.")
+        self._validate_profile(profile)
+        self._add_route(profile)
+        self.profiles.append(profile)
+
+    def _validate_profile(self, profile: AgentProfile):
+        api_key = profile.api_key or self.api_key
+        ingest_url = profile.base_url or self.ingest_url
+        if (api_key, ingest_url) != (self.api_key, self.ingest_url):
+            self._validate_api_key(api_key, ingest_url)
+
+    def _add_route(self, profile: AgentProfile):
+        exporter = self._build_exporter(
+            profile.api_key or self.api_key,
+            profile.base_url or self.ingest_url,
+            session=self._session,
+        )
+        self._router.add_profile(profile, exporter)
+
     def _instrument_livekit(self, provider):
         """Attempts to configure LiveKit Agents to use the same TracerProvider."""
         try:
@@ -132,8 +224,22 @@ class Client:
             except Exception as e:
                 logger.debug(f"Could not instrument {entry_point.name}: {e}")
 
+        if self.stream_timing:
+            self._instrument_streaming()
+
         self._instrument_livekit(provider)
 
+    def _instrument_streaming(self):
+        """Wraps streaming LLM responses to record TTFT and inter-token latency."""
+        from voiceeval.observability.streaming import instrument_streaming
+
+        try:
+            patched = instrument_streaming()
+            if patched:
+                logger.debug(f"Stream timing enabled for: {', '.join(patched)}")
+        except Exception as e:
+            logger.warning(f"Failed to enable stream timing: {e}")
+
     def flush(self):
         """Force flush all buffered traces to the backend.
 
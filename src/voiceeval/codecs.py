@@ -0,0 +1,345 @@
+"""
+Serialization codecs for ``Call`` corpora.
+
+Two on-disk formats are supported:
+
+* **JSONL** — one ``Call`` JSON document per line. Human readable and
+  appendable, compatible with ``Call.model_dump_json()``.
+* **Binary** — a compact length-prefixed record format (``.vecall``).
+  Timestamps are stored as fixed-width integers and speaker names are
+  interned per record, so it is considerably smaller and faster to decode
+  than JSON.
+
+All loaders are generators that yield one ``Call`` at a time from a
+memory-mapped file, so memory stays flat regardless of corpus size::
+
+    from voiceeval.codecs import dump_binary, iter_binary
+    from voiceeval.runners import OfflineRunner
+
+    dump_binary(calls, "calls.vecall")
+    runner = OfflineRunner(metrics=[...])
+    for call, results in runner.run_stream(iter_binary("calls.vecall", trusted=True)):
+        ...
+
+Pass ``trusted=True`` for data written by this module: models are built with
+``model_construct`` and pydantic validation is skipped.
+"""
+
+import json
+import mmap
+import os
+import struct
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from voiceeval.models import Call, Transcript, TranscriptSegment
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+BINARY_MAGIC = b"VECALL\x00\x01"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE_OFFSET = -32768  # sentinel utc offset for naive datetimes
+
+_U32 = struct.Struct("<I")
+_DATETIME = struct.Struct("<qh")  # microseconds since epoch, utc offset in minutes
+_SEGMENT = struct.Struct("<Hddd")  # speaker index, timestamp, end_timestamp, confidence
+_MISSING = float("nan")  # encodes None for optional float fields
+
+
+class CodecError(ValueError):
+    """Raised when a corpus file is malformed or has an unexpected format."""
+
+
+# ---------------------------------------------------------------------------
+# Memory mapping
+# ---------------------------------------------------------------------------
+
+@contextmanager
+def _mapped(path: PathLike) -> Iterator[Union[mmap.mmap, bytes]]:
+    """Memory-map ``path`` read-only. Empty files yield ``b""`` (mmap rejects them)."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mm
+        finally:
+            mm.close()
+
+
+# ---------------------------------------------------------------------------
+# Fast-path construction (no validation)
+# ---------------------------------------------------------------------------
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _construct_call(data: Dict[str, Any]) -> Call:
+    """Build a ``Call`` from a decoded dict without running validation."""
+    transcript = data.get("transcript")
+    if transcript is not None:
+        transcript = Transcript.model_construct(
+            segments=[TranscriptSegment.model_construct(**seg) for seg in transcript.get("segments", ())],
+            metadata=transcript.get("metadata") or {},
+        )
+    return Call.model_construct(
+        call_id=data["call_id"],
+        agent_id=data["agent_id"],
+        start_time=_parse_datetime(data["start_time"]),
+        end_time=_parse_datetime(data.get("end_time")),
+        transcript=transcript,
+        metrics=data.get("metrics") or {},
+    )
+
+
+# ---------------------------------------------------------------------------
+# JSONL
+# ---------------------------------------------------------------------------
+
+def dump_jsonl(calls: Iterable[Call], path: PathLike, append: bool = False) -> int:
+    """Write calls to ``path`` as line-delimited JSON.
+
+    Args:
+        calls: Any iterable of calls; it is consumed lazily.
+        path: Destination file.
+        append: Append to an existing file instead of truncating it.
+
+    Returns:
+        The number of calls written.
+    """
+    count = 0
+    with open(path, "ab" if append else "wb") as f:
+        for call in calls:
+            f.write(call.model_dump_json().encode("utf-8"))
+            f.write(b"\n")
+            count += 1
+    return count
+
+
+def iter_jsonl(path: PathLike, trusted: bool = False) -> Iterator[Call]:
+    """Yield calls from a JSONL file one at a time.
+
+    Args:
+        path: File written by ``dump_jsonl`` (or any ``Call`` JSON per line).
+        trusted: Skip pydantic validation and build models directly.
+    """
+    with _mapped(path) as buf:
+        pos, size = 0, len(buf)
+        while pos < size:
+            end = buf.find(b"\n", pos)
+            if end == -1:
+                end = size
+            line = buf[pos:end]
+            pos = end + 1
+            if not line.strip():
+                continue
+            if trusted:
+                yield _construct_call(json.loads(line))
+            else:
+                yield Call.model_validate_json(line)
+
+
+# ---------------------------------------------------------------------------
+# Binary
+# ---------------------------------------------------------------------------
+
+def _pack_str(out: bytearray, value: str) -> None:
+    raw = value.encode("utf-8")
+    out += _U32.pack(len(raw))
+    out += raw
+
+
+def _pack_datetime(out: bytearray, value: datetime) -> None:
+    offset = value.utcoffset()
+    if offset is None:
+        micros = (value.replace(tzinfo=timezone.utc) - _EPOCH) // timedelta(microseconds=1)
+        out += _DATETIME.pack(micros, _NAIVE_OFFSET)
+    else:
+        micros = (value - _EPOCH) // timedelta(microseconds=1)
+        out += _DATETIME.pack(micros, offset // timedelta(minutes=1))
+
+
+def _pack_json(out: bytearray, value: Dict[str, Any]) -> None:
+    _pack_str(out, json.dumps(value, separators=(",", ":"), default=str) if value else "")
+
+
+def encode_call(call: Call) -> bytes:
+    """Encode a single call into the binary record payload (without length prefix)."""
+    out = bytearray()
+    _pack_str(out, call.call_id)
+    _pack_str(out, call.agent_id)
+    _pack_datetime(out, call.start_time)
+    flags = (1 if call.end_time is not None else 0) | (2 if call.transcript is not None else 0)
+    out.append(flags)
+    if call.end_time is not None:
+        _pack_datetime(out, call.end_time)
+    if call.transcript is not None:
+        speakers: Dict[str, int] = {}
+        for seg in call.transcript.segments:
+            speakers.setdefault(seg.speaker, len(speakers))
+        out += _U32.pack(len(speakers))
+        for speaker in speakers:
+            _pack_str(out, speaker)
+        out += _U32.pack(len(call.transcript.segments))
+        for seg in call.transcript.segments:
+            out += _SEGMENT.pack(
+                speakers[seg.speaker],
+                seg.timestamp,
+                _MISSING if seg.end_timestamp is None else seg.end_timestamp,
+                _MISSING if seg.confidence is None else seg.confidence,
+            )
+            _pack_str(out, seg.text)
+        _pack_json(out, call.transcript.metadata)
+    _pack_json(out, call.metrics)
+    return bytes(out)
+
+
+class _Reader:
+    """Cursor over a binary record payload."""
+
+    __slots__ = ("buf", "pos")
+
+    def __init__(self, buf: memoryview, pos: int = 0):
+        self.buf = buf
+        self.pos = pos
+
+    def unpack(self, fmt: struct.Struct) -> tuple:
+        values = fmt.unpack_from(self.buf, self.pos)
+        self.pos += fmt.size
+        return values
+
+    def str(self) -> str:
+        (length,) = self.unpack(_U32)
+        start = self.pos
+        self.pos += length
+        return str(self.buf[start:self.pos], "utf-8")
+
+    def datetime(self) -> datetime:
+        micros, offset = self.unpack(_DATETIME)
+        value = _EPOCH + timedelta(microseconds=micros)
+        if offset == _NAIVE_OFFSET:
+            return value.replace(tzinfo=None)
+        return value.astimezone(timezone(timedelta(minutes=offset)))
+
+    def json(self) -> Dict[str, Any]:
+        raw = self.str()
+        return json.loads(raw) if raw else {}
+
+
+def _decode_fields(reader: _Reader) -> Dict[str, Any]:
+    data: Dict[str, Any] = {
+        "call_id": reader.str(),
+        "agent_id": reader.str(),
+        "start_time": reader.datetime(),
+        "end_time": None,
+        "transcript": None,
+    }
+    flags = reader.buf[reader.pos]
+    reader.pos += 1
+    if flags & 1:
+        data["end_time"] = reader.datetime()
+    if flags & 2:
+        (n_speakers,) = reader.unpack(_U32)
+        speakers = [reader.str() for _ in range(n_speakers)]
+        (n_segments,) = reader.unpack(_U32)
+        segments: List[Dict[str, Any]] = []
+        for _ in range(n_segments):
+            speaker_idx, timestamp, end_timestamp, confidence = reader.unpack(_SEGMENT)
+            segments.append({
+                "speaker": speakers[speaker_idx],
+                "text": reader.str(),
+                "timestamp": timestamp,
+                "end_timestamp": None if end_timestamp != end_timestamp else end_timestamp,
+                "confidence": None if confidence != confidence else confidence,
+            })
+        data["transcript"] = {"segments": segments, "metadata": reader.json()}
+    data["metrics"] = reader.json()
+    return data
+
+
+def decode_call(payload: Union[bytes, memoryview], trusted: bool = False) -> Call:
+    """Decode a binary record payload produced by ``encode_call``."""
+    data = _decode_fields(_Reader(memoryview(payload)))
+    if trusted:
+        return _construct_call(data)
+    return Call.model_validate(data)
+
+
+def dump_binary(calls: Iterable[Call], path: PathLike, append: bool = False) -> int:
+    """Write calls to ``path`` in the binary record format.
+
+    Args:
+        calls: Any iterable of calls; it is consumed lazily.
+        path: Destination file.
+        append: Append records to an existing file. The header is only
+                written when the file is new or empty.
+
+    Returns:
+        The number of calls written.
+    """
+    count = 0
+    with open(path, "ab" if append else "wb") as f:
+        if f.tell() == 0:
+            f.write(BINARY_MAGIC)
+        for call in calls:
+            payload = encode_call(call)
+            f.write(_U32.pack(len(payload)))
+            f.write(payload)
+            count += 1
+    return count
+
+
+def iter_binary(path: PathLike, trusted: bool = False) -> Iterator[Call]:
+    """Yield calls from a binary corpus one at a time.
+
+    Args:
+        path: File written by ``dump_binary``.
+        trusted: Skip pydantic validation and build models directly.
+    """
+    with _mapped(path) as buf:
+        if len(buf) == 0:
+            return
+        if buf[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+            raise CodecError(f"{path} is not a voiceeval binary corpus")
+        view = memoryview(buf)
+        try:
+            pos, size = len(BINARY_MAGIC), len(buf)
+            while pos < size:
+                if pos + _U32.size > size:
+                    raise CodecError(f"Truncated record header at offset {pos}")
+                (length,) = _U32.unpack_from(view, pos)
+                pos += _U32.size
+                if pos + length > size:
+                    raise CodecError(f"Truncated record at offset {pos}")
+                payload = view[pos:pos + length]
+                pos += length
+                try:
+                    yield decode_call(payload, trusted=trusted)
+                finally:
+                    payload.release()
+        finally:
+            view.release()
+
+
+# ---------------------------------------------------------------------------
+# Format dispatch
+# ---------------------------------------------------------------------------
+
+def _is_binary(path: PathLike) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+
+def iter_calls(path: PathLike, trusted: bool = False) -> Iterator[Call]:
+    """Yield calls from either format, detected from the file header."""
+    if _is_binary(path):
+        return iter_binary(path, trusted=trusted)
+    return iter_jsonl(path, trusted=trusted)
@@ -7,9 +7,10 @@ Uses Python's contextvars for safe async/thread-local storage.
 """
 
 import uuid
+from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterator, Optional
 
 
 _call_metadata_var: ContextVar[Optional["CallMetadata"]] = ContextVar(
@@ -20,6 +21,22 @@ _monitoring_skipped_var: ContextVar[bool] = ContextVar(
     "voiceeval_monitoring_skipped", default=False
 )
 
+_agent_var: ContextVar[Optional[str]] = ContextVar(
+    "voiceeval_agent", default=None
+)
+
+_call_detail_var: ContextVar[Optional[str]] = ContextVar(
+    "voiceeval_call_detail", default=None
+)
+
+# Set when a root span decided not to monitor its call, so later spans in
+# the same call don't mint a fresh call_id.
+_call_unmonitored_var: ContextVar[bool] = ContextVar(
+    "voiceeval_call_unmonitored", default=False
+)
+
+DETAIL_LEVELS = ("full", "timing", "metrics")
+
 
 @dataclass
 class CallMetadata:
@@ -69,18 +86,89 @@ def monitor_call() -> CallMetadata:
     Creates a call_id so spans are tagged and traces reach MongoDB/eval pipeline.
     """
     _monitoring_skipped_var.set(False)
+    _call_unmonitored_var.set(False)
     return ensure_call_metadata()
 
 
-def skip_call() -> None:
+def skip_call(detail: Optional[str] = None) -> None:
     """Opt this call out of monitoring.
 
-    Spans will still be exported to Langfuse but will NOT get a voiceeval.call_id,
-    so they won't be written to MongoDB or trigger evaluations.
+    Spans will NOT get a voiceeval.call_id, so they won't be written to
+    MongoDB or trigger evaluations. How much is still exported follows the
+    Client's ``unmonitored_detail`` (full spans to Langfuse by default).
+
+    Args:
+        detail: Override the detail level for this call: "full", "timing"
+                (no inputs/outputs/prompts) or "metrics" (nothing exported).
     """
     _monitoring_skipped_var.set(True)
+    if detail is not None:
+        set_call_detail(detail)
 
 
 def is_monitoring_skipped() -> bool:
     """Check if the current call has been opted out of monitoring."""
     return _monitoring_skipped_var.get()
+
+
+def validate_detail(level: str) -> str:
+    """Return ``level`` if it is one of ``DETAIL_LEVELS``; raise ValueError otherwise."""
+    if level not in DETAIL_LEVELS:
+        raise ValueError(f"Unknown detail level {level!r}; expected one of {', '.join(DETAIL_LEVELS)}")
+    return level
+
+
+def set_call_detail(detail: Optional[str]) -> None:
+    """Set how much of the current call's telemetry is exported.
+
+    Args:
+        detail: "full" (everything), "timing" (span names, durations and
+                status; inputs, outputs and prompts stripped), "metrics"
+                (nothing exported; durations go to local histograms), or
+                None to use the Client's default for the call.
+    """
+    _call_detail_var.set(validate_detail(detail) if detail is not None else None)
+
+
+def get_call_detail() -> Optional[str]:
+    """Return the detail level set for the current call, if any."""
+    return _call_detail_var.get()
+
+
+def set_call_unmonitored(unmonitored: bool) -> None:
+    """Record the root span's monitoring decision for the rest of the call."""
+    _call_unmonitored_var.set(unmonitored)
+
+
+def is_call_unmonitored() -> bool:
+    return _call_unmonitored_var.get()
+
+
+def set_agent(name: Optional[str]) -> None:
+    """Route spans started in this context to the agent profile ``name``.
+
+    Only meaningful when the Client was created with ``profiles``; spans
+    started while no agent (or an unknown one) is set use the default profile.
+    """
+    _agent_var.set(name)
+
+
+def get_agent() -> Optional[str]:
+    """Return the agent profile name set for this context, if any."""
+    return _agent_var.get()
+
+
+@contextmanager
+def agent_scope(name: str) -> Iterator[None]:
+    """Set the agent profile for the duration of a ``with`` block.
+
+    Example::
+
+        with agent_scope("billing-agent"):
+            await run_session(ctx)
+    """
+    token = _agent_var.set(name)
+    try:
+        yield
+    finally:
+        _agent_var.reset(token)
@@ -0,0 +1,180 @@
+"""
+Executors that keep work offloaded from the event loop linked to its call.
+
+Call identity lives in ``ContextVar``s (see ``voiceeval.context``), and so
+does the current OpenTelemetry span. ``ThreadPoolExecutor.submit`` and
+``loop.run_in_executor`` run the function in the worker's own context, so
+spans started there lose the call's ``voiceeval.call_id`` (or mint a fresh
+one) and their parent span.
+
+* ``ContextThreadPoolExecutor`` runs every task in a copy of the submitting
+  context, exactly as ``asyncio.to_thread`` does.
+* ``ContextProcessPoolExecutor`` captures a picklable ``CallContext``
+  (call metadata, monitoring and detail decisions, agent and W3C trace
+  context) and re-establishes it in the worker process around each task.
+* ``run_in_executor`` does the same for any executor, including the loop's
+  default one.
+
+Spans started in a worker process are exported only if that process has a
+``Client`` (e.g. created in the pool's ``initializer``); they are then
+parented to the submitting span and tagged with the same call_id.
+"""
+
+import asyncio
+import contextvars
+import functools
+import sys
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+from voiceeval.context import (
+    CallMetadata,
+    _agent_var,
+    _call_detail_var,
+    _call_metadata_var,
+    _call_unmonitored_var,
+    _monitoring_skipped_var,
+)
+
+T = TypeVar("T")
+
+
+@functools.lru_cache(maxsize=None)
+def _propagator():
+    # Imported on first use, so offline jobs can use these executors without
+    # loading OpenTelemetry.
+    from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+
+    return TraceContextTextMapPropagator()
+
+
+@dataclass(frozen=True)
+class CallContext:
+    """
+    Picklable snapshot of the call state of one execution context.
+
+    Attributes:
+        metadata: The active call, if any.
+        monitoring_skipped: ``skip_call()`` was called.
+        call_unmonitored: The root span decided not to monitor the call.
+        agent: Agent profile selected with ``set_agent()``.
+        detail: Detail level set with ``set_call_detail()``.
+        trace_carrier: W3C ``traceparent``/``tracestate`` of the current span.
+    """
+    metadata: Optional[CallMetadata] = None
+    monitoring_skipped: bool = False
+    call_unmonitored: bool = False
+    agent: Optional[str] = None
+    detail: Optional[str] = None
+    trace_carrier: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def capture(cls) -> "CallContext":
+        """Snapshot the calling context."""
+        carrier: Dict[str, str] = {}
+        if "opentelemetry.context" in sys.modules:  # otherwise no span can be active
+            _propagator().inject(carrier)
+        return cls(
+            metadata=_call_metadata_var.get(),
+            monitoring_skipped=_monitoring_skipped_var.get(),
+            call_unmonitored=_call_unmonitored_var.get(),
+            agent=_agent_var.get(),
+            detail=_call_detail_var.get(),
+            trace_carrier=carrier,
+        )
+
+    @contextmanager
+    def attach(self) -> Iterator[None]:
+        """Make this the current call (and parent span) for a ``with`` block."""
+        tokens = [
+            (_call_metadata_var, _call_metadata_var.set(self.metadata)),
+            (_monitoring_skipped_var, _monitoring_skipped_var.set(self.monitoring_skipped)),
+            (_call_unmonitored_var, _call_unmonitored_var.set(self.call_unmonitored)),
+            (_agent_var, _agent_var.set(self.agent)),
+            (_call_detail_var, _call_detail_var.set(self.detail)),
+        ]
+        otel_token = None
+        if self.trace_carrier:
+            from opentelemetry import context as otel_context
+
+            otel_token = otel_context.attach(_propagator().extract(self.trace_carrier))
+        try:
+            yield
+        finally:
+            if otel_token is not None:
+                otel_context.detach(otel_token)
+            for var, token in reversed(tokens):
+                var.reset(token)
+
+    def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call ``fn(*args, **kwargs)`` inside this call context."""
+        with self.attach():
+            return fn(*args, **kwargs)
+
+
+def _run_in_call_context(call_context: CallContext, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    # Module-level so process pools can pickle it.
+    return call_context.run(fn, *args, **kwargs)
+
+
+def wrap(fn: Callable[..., T]) -> Callable[..., T]:
+    """
+    Bind ``fn`` to the current context, for handing to a thread or callback API.
+
+    The returned callable may be called from any thread, any number of times;
+    each call runs in its own copy of the context captured here.
+    """
+    captured = contextvars.copy_context()
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        return captured.copy().run(fn, *args, **kwargs)
+
+    return wrapper
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    ``ThreadPoolExecutor`` whose tasks run in the submitting context.
+
+    Drop-in replacement; also applies to ``map()`` and to
+    ``loop.run_in_executor(executor, ...)``.
+    """
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> "Future[T]":
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+class ContextProcessPoolExecutor(ProcessPoolExecutor):
+    """
+    ``ProcessPoolExecutor`` whose tasks run in the submitting call's context.
+
+    ``fn`` and its arguments must be picklable, as for any process pool.
+    """
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> "Future[T]":
+        return super().submit(_run_in_call_context, CallContext.capture(), fn, *args, **kwargs)
+
+
+def run_in_executor(executor: Optional[Executor], fn: Callable[..., T], *args: Any) -> "asyncio.Future[T]":
+    """
+    ``loop.run_in_executor`` that carries the current call into the worker.
+
+    Args:
+        executor: Any executor, or None for the loop's default thread pool.
+                  Process pools get a ``CallContext``; threads a context copy.
+        fn: Function to run.
+        *args: Positional arguments for ``fn``.
+
+    Example::
+
+        pcm = await run_in_executor(pool, decode_audio, path)
+    """
+    loop = asyncio.get_running_loop()
+    if isinstance(executor, (ContextThreadPoolExecutor, ContextProcessPoolExecutor)):
+        return loop.run_in_executor(executor, fn, *args)
+    if isinstance(executor, ProcessPoolExecutor):
+        return loop.run_in_executor(executor, functools.partial(_run_in_call_context, CallContext.capture(), fn), *args)
+    return loop.run_in_executor(executor, contextvars.copy_context().run, fn, *args)
@@ -0,0 +1,177 @@
+"""
+Log-bucketed latency histogram.
+
+Values are counted in geometric buckets with a fixed relative width, so a
+percentile read from the histogram is within ``relative_error`` of the true
+value no matter the range (microseconds to minutes), memory is bounded by the
+number of distinct buckets touched, and histograms from different workers can
+be merged exactly.
+
+``record_many`` bins large batches with NumPy when it is installed. NaN and
+infinite values have no bucket and are rejected.
+"""
+
+import math
+from typing import Dict, Iterable, Optional
+
+# Batches at least this long take the NumPy path in ``record_many``.
+VECTORIZE_THRESHOLD = 64
+
+_np = None
+
+
+def optional_numpy():
+    """NumPy if importable, else None. Imported on first use to keep ``import voiceeval`` light."""
+    global _np
+    if _np is None:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = False
+    return _np or None
+
+
+class LatencyHistogram:
+    """
+    Mergeable histogram with bounded relative error.
+
+    Args:
+        relative_error: Maximum relative error of reported percentiles.
+        min_value: Values at or below this (including 0) share the lowest bucket.
+    """
+
+    __slots__ = ("relative_error", "min_value", "_log_gamma", "counts", "count", "total", "min", "max")
+
+    def __init__(self, relative_error: float = 0.01, min_value: float = 1e-9):
+        self.relative_error = relative_error
+        self.min_value = min_value
+        gamma = (1 + relative_error) / (1 - relative_error)
+        self._log_gamma = math.log(gamma)
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _bucket(self, value: float) -> int:
+        if value <= self.min_value:
+            return 0
+        return 1 + int(math.ceil(math.log(value / self.min_value) / self._log_gamma))
+
+    def _bucket_value(self, index: int) -> float:
+        """Representative value of a bucket (midpoint in relative terms)."""
+        if index == 0:
+            return self.min_value
+        upper = self.min_value * math.exp((index - 1) * self._log_gamma)
+        return upper * 2 / (1 + math.exp(self._log_gamma))
+
+    def record(self, value: float) -> None:
+        """Count one value; raises ValueError for NaN or infinity."""
+        if not math.isfinite(value):
+            raise ValueError(f"Cannot record non-finite value {value!r}")
+        index = self._bucket(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def record_many(self, values: Iterable[float]) -> None:
+        """Count many values; raises ValueError (recording none of them) if any is NaN or infinite."""
+        if not isinstance(values, (list, tuple)) and not hasattr(values, "dtype"):
+            values = list(values)
+        np = optional_numpy() if len(values) >= VECTORIZE_THRESHOLD else None
+        if np is None:
+            for value in values:
+                if not math.isfinite(value):
+                    raise ValueError(f"Cannot record non-finite value {value!r}")
+            for value in values:
+                self.record(value)
+            return
+
+        arr = np.asarray(values, dtype=np.float64)
+        if not np.isfinite(arr).all():
+            raise ValueError(f"Cannot record non-finite value {float(arr[~np.isfinite(arr)][0])!r}")
+        above = arr > self.min_value
+        indices = np.zeros(arr.shape, dtype=np.int64)
+        indices[above] = 1 + np.ceil(np.log(arr[above] / self.min_value) / self._log_gamma).astype(np.int64)
+        buckets, counts = np.unique(indices, return_counts=True)
+        for index, n in zip(buckets.tolist(), counts.tolist()):
+            self.counts[index] = self.counts.get(index, 0) + n
+        self.count += arr.size
+        self.total += float(arr.sum())
+        self.min = min(self.min, float(arr.min()))
+        self.max = max(self.max, float(arr.max()))
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add ``other``'s counts; both must use the same bucket layout."""
+        if (other.relative_error, other.min_value) != (self.relative_error, self.min_value):
+            raise ValueError("Cannot merge histograms with different bucket layouts")
+        for index, n in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + n
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Value at quantile ``q`` in [0, 1] (0.0 when empty)."""
+        if not self.count:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen > rank:
+                return min(max(self._bucket_value(index), self.min), self.max)
+        return self.max
+
+    def summary(self, percentiles: Iterable[float] = (0.5, 0.95, 0.99)) -> Dict[str, float]:
+        """``count``, ``mean``, ``min``, ``max`` and ``p<N>`` entries."""
+        out: Dict[str, float] = {
+            "count": self.count,
+            "mean": self.mean,
+            "min": self.min if self.count else 0.0,
+            "max": self.max if self.count else 0.0,
+        }
+        for q in percentiles:
+            out[f"p{q * 100:g}"] = self.percentile(q)
+        return out
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "relative_error": self.relative_error,
+            "min_value": self.min_value,
+            "counts": {str(k): v for k, v in self.counts.items()},
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "LatencyHistogram":
+        hist = cls(relative_error=data["relative_error"], min_value=data["min_value"])
+        hist.counts = {int(k): v for k, v in data["counts"].items()}
+        hist.count = data["count"]
+        hist.total = data["total"]
+        hist.min = data["min"] if data["min"] is not None else math.inf
+        hist.max = data["max"] if data["max"] is not None else -math.inf
+        return hist
+
+
+def merged(histograms: Iterable[LatencyHistogram]) -> LatencyHistogram:
+    """Merge histograms with the same bucket layout into a new one."""
+    result: Optional[LatencyHistogram] = None
+    for hist in histograms:
+        if result is None:
+            result = LatencyHistogram(hist.relative_error, hist.min_value)
+        result.merge(hist)
+    return result if result is not None else LatencyHistogram()
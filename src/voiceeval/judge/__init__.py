@@ -0,0 +1,42 @@
+from typing import TYPE_CHECKING
+
+from voiceeval._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from voiceeval.judge.backends import (
+        AnthropicJudgeBackend,
+        Criterion,
+        JudgeBackend,
+        JudgeItem,
+        JudgeResponseError,
+        LocalJudgeBackend,
+        OpenAIJudgeBackend,
+        PromptJudgeBackend,
+    )
+    from voiceeval.judge.engine import JudgeEngine, render_transcript
+
+__all__ = [
+    "JudgeEngine",
+    "JudgeBackend",
+    "PromptJudgeBackend",
+    "LocalJudgeBackend",
+    "OpenAIJudgeBackend",
+    "AnthropicJudgeBackend",
+    "Criterion",
+    "JudgeItem",
+    "JudgeResponseError",
+    "render_transcript",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "JudgeEngine": "voiceeval.judge.engine",
+    "JudgeBackend": "voiceeval.judge.backends",
+    "PromptJudgeBackend": "voiceeval.judge.backends",
+    "LocalJudgeBackend": "voiceeval.judge.backends",
+    "OpenAIJudgeBackend": "voiceeval.judge.backends",
+    "AnthropicJudgeBackend": "voiceeval.judge.backends",
+    "Criterion": "voiceeval.judge.backends",
+    "JudgeItem": "voiceeval.judge.backends",
+    "JudgeResponseError": "voiceeval.judge.backends",
+    "render_transcript": "voiceeval.judge.engine",
+})
@@ -0,0 +1,303 @@
+"""
+Model backends for LLM-as-judge scoring.
+
+A ``JudgeBackend`` scores a batch of ``JudgeItem`` s against one
+``Criterion`` and returns ``{item_id: score}``. ``PromptJudgeBackend`` packs
+the batch into a single prompt that asks for a JSON object of scores, so one
+request covers several transcripts; subclasses only implement ``complete``.
+
+``LocalJudgeBackend`` is a deterministic, offline stand-in (lexicon and
+keyword heuristics) used by default and in tests.
+"""
+
+import json
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from voiceeval.retry import RateLimitError
+
+
+class JudgeResponseError(ValueError):
+    """The model's reply could not be parsed into scores."""
+
+
+@dataclass(frozen=True)
+class Criterion:
+    """
+    What a judge scores.
+
+    Attributes:
+        name: Stable identifier (also part of the cache key).
+        instructions: Rubric given to the model.
+        scale: Inclusive ``(low, high)`` score range; replies are clamped to it.
+    """
+    name: str
+    instructions: str
+    scale: Tuple[float, float] = (0.0, 1.0)
+
+
+@dataclass(frozen=True)
+class JudgeItem:
+    """
+    One thing to score: usually a rendered transcript, optionally with
+    context such as the topic the agent should stay on.
+    """
+    item_id: str
+    text: str
+    context: str = ""
+
+
+class JudgeBackend(ABC):
+    """
+    Scores batches of items.
+
+    Attributes:
+        max_batch_size: Items per ``score_batch`` request.
+        max_batch_chars: Soft cap on total item text per request, so packed
+                         prompts stay inside the model's context window.
+        cache_namespace: Identifies the model/config in cache keys.
+    """
+    max_batch_size: int = 8
+    max_batch_chars: int = 24000
+    cache_namespace: str = "default"
+
+    def supports(self, criterion: Criterion) -> bool:
+        """Whether this backend can score ``criterion``; checked before any request."""
+        return True
+
+    @abstractmethod
+    async def score_batch(self, criterion: Criterion, items: Sequence[JudgeItem]) -> Dict[str, float]:
+        """Return scores keyed by ``item_id``. Items may be missing from the result."""
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Prompt packing
+# ---------------------------------------------------------------------------
+
+def render_prompt(criterion: Criterion, items: Sequence[JudgeItem]) -> str:
+    """Pack ``items`` into one prompt asking for a JSON object of scores."""
+    low, high = criterion.scale
+    lines = [
+        criterion.instructions.strip(),
+        "",
+        f"Score each item independently on a scale from {low:g} to {high:g}.",
+        'Reply with only a JSON object mapping each item id to its score, e.g. {"' + items[0].item_id + '": ' + f"{high:g}" + "}.",
+    ]
+    for item in items:
+        lines += ["", f"### Item {item.item_id}"]
+        if item.context:
+            lines.append(f"Context: {item.context}")
+        lines += ["Transcript:", item.text]
+    return "\n".join(lines)
+
+
+_JSON_OBJECT = re.compile(r"\{.*\}", re.S)
+
+
+def parse_scores(reply: str, criterion: Criterion, item_ids: Sequence[str]) -> Dict[str, float]:
+    """
+    Extract ``{item_id: score}`` from a model reply.
+
+    Tolerates prose or code fences around the JSON. Unknown ids and
+    non-numeric values are dropped; scores are clamped to the criterion scale.
+    """
+    match = _JSON_OBJECT.search(reply)
+    if not match:
+        raise JudgeResponseError(f"No JSON object in judge reply: {reply[:200]!r}")
+    try:
+        data = json.loads(match.group(0))
+    except ValueError as e:
+        raise JudgeResponseError(f"Invalid JSON in judge reply: {e}") from e
+    if not isinstance(data, dict):
+        raise JudgeResponseError("Judge reply is not a JSON object")
+
+    low, high = criterion.scale
+    wanted = set(item_ids)
+    scores = {}
+    for key, value in data.items():
+        if key not in wanted:
+            continue
+        try:
+            score = float(value)
+        except (TypeError, ValueError):
+            continue
+        scores[key] = min(max(score, low), high)
+    return scores
+
+
+class PromptJudgeBackend(JudgeBackend):
+    """Backend for chat models: one packed prompt per batch, JSON scores back."""
+
+    @abstractmethod
+    async def complete(self, prompt: str) -> str:
+        """Send ``prompt`` and return the model's text reply."""
+        pass
+
+    async def score_batch(self, criterion: Criterion, items: Sequence[JudgeItem]) -> Dict[str, float]:
+        reply = await self.complete(render_prompt(criterion, items))
+        return parse_scores(reply, criterion, [item.item_id for item in items])
+
+
+def _raise_if_rate_limited(error: Exception) -> None:
+    """Translate a provider SDK's 429 into ``RateLimitError`` (with Retry-After)."""
+    if getattr(error, "status_code", None) != 429:
+        return
+    retry_after = None
+    response = getattr(error, "response", None)
+    if response is not None:
+        try:
+            retry_after = float(response.headers.get("retry-after"))
+        except (TypeError, ValueError):
+            pass
+    raise RateLimitError(str(error), retry_after=retry_after) from error
+
+
+class OpenAIJudgeBackend(PromptJudgeBackend):
+    """
+    Judge backed by the OpenAI chat completions API (``pip install openai``).
+
+    Args:
+        model: Chat model name.
+        client: An ``openai.AsyncOpenAI`` instance; created from the
+                environment if omitted.
+        max_batch_size: Items packed per prompt.
+    """
+
+    def __init__(self, model: str = "gpt-4o-mini", client=None, max_batch_size: int = 8):
+        if client is None:
+            try:
+                from openai import AsyncOpenAI
+            except ImportError as e:
+                raise ImportError("OpenAIJudgeBackend requires openai. Install with: pip install openai") from e
+            client = AsyncOpenAI()
+        self.client = client
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.cache_namespace = f"openai:{model}"
+
+    async def complete(self, prompt: str) -> str:
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0,
+                response_format={"type": "json_object"},
+            )
+        except Exception as e:
+            _raise_if_rate_limited(e)
+            raise
+        return response.choices[0].message.content or ""
+
+
+class AnthropicJudgeBackend(PromptJudgeBackend):
+    """
+    Judge backed by the Anthropic messages API (``pip install anthropic``).
+
+    Args:
+        model: Model name.
+        client: An ``anthropic.AsyncAnthropic`` instance; created from the
+                environment if omitted.
+        max_batch_size: Items packed per prompt.
+        max_tokens: Reply token limit.
+    """
+
+    def __init__(self, model: str = "claude-3-5-haiku-latest", client=None, max_batch_size: int = 8, max_tokens: int = 1024):
+        if client is None:
+            try:
+                from anthropic import AsyncAnthropic
+            except ImportError as e:
+                raise ImportError("AnthropicJudgeBackend requires anthropic. Install with: pip install anthropic") from e
+            client = AsyncAnthropic()
+        self.client = client
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_tokens = max_tokens
+        self.cache_namespace = f"anthropic:{model}"
+
+    async def complete(self, prompt: str) -> str:
+        try:
+            response = await self.client.messages.create(
+                model=self.model,
+                max_tokens=self.max_tokens,
+                temperature=0,
+                messages=[{"role": "user", "content": prompt}],
+            )
+        except Exception as e:
+            _raise_if_rate_limited(e)
+            raise
+        return "".join(getattr(block, "text", "") for block in response.content)
+
+
+# ---------------------------------------------------------------------------
+# Local deterministic backend
+# ---------------------------------------------------------------------------
+
+_WORD = re.compile(r"[a-z']+")
+
+_POSITIVE = frozenset({
+    "thanks", "thank", "great", "good", "perfect", "awesome", "helpful", "excellent", "appreciate",
+    "happy", "glad", "wonderful", "love", "nice", "amazing", "resolved", "fantastic", "pleased",
+})
+_NEGATIVE = frozenset({
+    "bad", "terrible", "awful", "angry", "frustrated", "frustrating", "annoyed", "useless", "hate",
+    "wrong", "worst", "ridiculous", "upset", "disappointed", "horrible", "unacceptable", "cancel", "complaint",
+})
+_STOPWORDS = frozenset({
+    "the", "and", "for", "with", "about", "that", "this", "your", "you", "are", "can", "from", "into",
+    "our", "their", "them", "they", "have", "has", "was", "were", "will", "would", "should", "only",
+})
+
+
+def _words(text: str):
+    return _WORD.findall(text.lower())
+
+
+def lexicon_sentiment(item: JudgeItem) -> float:
+    """(positive - negative) / (positive + negative) over the transcript's words; 0 if neither."""
+    positive = negative = 0
+    for word in _words(item.text):
+        if word in _POSITIVE:
+            positive += 1
+        elif word in _NEGATIVE:
+            negative += 1
+    total = positive + negative
+    return (positive - negative) / total if total else 0.0
+
+
+def keyword_topic_adherence(item: JudgeItem) -> float:
+    """Fraction of transcript lines that mention a content word from the context (topic)."""
+    topic = {w for w in _words(item.context) if len(w) > 2 and w not in _STOPWORDS}
+    lines = [line for line in item.text.splitlines() if line.strip()]
+    if not topic or not lines:
+        return 1.0
+    on_topic = sum(1 for line in lines if topic.intersection(_words(line)))
+    return on_topic / len(lines)
+
+
+class LocalJudgeBackend(JudgeBackend):
+    """
+    Deterministic offline judge: no network, same input always scores the same.
+
+    Args:
+        scorers: Maps criterion names to ``scorer(item) -> float``. Defaults
+                 cover ``sentiment`` and ``topic_adherence``.
+    """
+    max_batch_size = 256
+    max_batch_chars = 10_000_000
+    cache_namespace = "local:v1"
+
+    def __init__(self, scorers: Optional[Dict[str, Callable[[JudgeItem], float]]] = None):
+        self.scorers = {"sentiment": lexicon_sentiment, "topic_adherence": keyword_topic_adherence}
+        if scorers:
+            self.scorers.update(scorers)
+
+    def supports(self, criterion: Criterion) -> bool:
+        return criterion.name in self.scorers
+
+    async def score_batch(self, criterion: Criterion, items: Sequence[JudgeItem]) -> Dict[str, float]:
+        scorer = self.scorers[criterion.name]
+        low, high = criterion.scale
+        return {item.item_id: min(max(scorer(item), low), high) for item in items}
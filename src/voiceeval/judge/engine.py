@@ -0,0 +1,169 @@
+"""
+Batched, concurrent, cached LLM-judge scoring.
+
+``JudgeEngine.score_many`` takes many items for one criterion and:
+
+* serves repeats from a ``DiskCache`` keyed by backend, rubric and content,
+  so re-running a corpus only pays for new or changed calls,
+* deduplicates identical items within the run,
+* packs the rest into prompts of up to ``batch_size`` items (and
+  ``backend.max_batch_chars`` characters),
+* runs at most ``concurrency`` requests at once, spaced to
+  ``requests_per_minute``; a 429 pauses every worker for the provider's
+  Retry-After before retrying,
+* re-asks individually for items a packed reply left out.
+"""
+
+import asyncio
+from typing import Awaitable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from voiceeval.cache import DiskCache, content_key
+from voiceeval.judge.backends import Criterion, JudgeBackend, JudgeItem, JudgeResponseError, LocalJudgeBackend
+from voiceeval.models import Call
+from voiceeval.retry import RateLimiter, retry_async
+
+T = TypeVar("T")
+
+
+def _run_blocking(coro: Awaitable[T], method: str, alternative: str) -> T:
+    """``asyncio.run(coro)``, with a pointer to the async API when a loop is already running."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    coro.close()
+    raise RuntimeError(f"{method}() cannot be called from a running event loop; use 'await {alternative}(...)' instead")
+
+
+def render_transcript(call: Call, max_chars: Optional[int] = None) -> str:
+    """
+    Render ``call``'s transcript as ``speaker: text`` lines.
+
+    Args:
+        call: The call to render; an empty string if it has no transcript.
+        max_chars: If set, longer transcripts keep their beginning and end
+                   with an elision marker in between.
+    """
+    if call.transcript is None:
+        return ""
+    text = "\n".join(f"{seg.speaker}: {seg.text}" for seg in call.transcript.segments)
+    if max_chars is not None and len(text) > max_chars:
+        half = max_chars // 2
+        text = f"{text[:half]}\n[...]\n{text[-half:]}"
+    return text
+
+
+class JudgeEngine:
+    """
+    Scores items against a criterion with a ``JudgeBackend``.
+
+    Args:
+        backend: Model backend; defaults to the offline ``LocalJudgeBackend``.
+        concurrency: Maximum requests in flight.
+        batch_size: Items per request; defaults to ``backend.max_batch_size``.
+        cache: Optional ``DiskCache`` for scores.
+        max_retries: Retries per failed request.
+        retry_backoff: Base delay in seconds for exponential backoff.
+        requests_per_minute: Request budget; None for no spacing.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[JudgeBackend] = None,
+        concurrency: int = 8,
+        batch_size: Optional[int] = None,
+        cache: Optional[DiskCache] = None,
+        max_retries: int = 5,
+        retry_backoff: float = 1.0,
+        requests_per_minute: Optional[float] = None,
+    ):
+        self.backend = backend or LocalJudgeBackend()
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size or self.backend.max_batch_size)
+        self.cache = cache
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.limiter = RateLimiter(requests_per_minute, burst=self.concurrency)
+        self.stats = {"requests": 0, "scored": 0, "cache_hits": 0, "deduplicated": 0, "rescored": 0}
+
+    def cache_key(self, criterion: Criterion, item: JudgeItem) -> str:
+        return content_key(self.backend.cache_namespace, criterion.name, criterion.instructions, item.context, item.text)
+
+    async def score_many(self, criterion: Criterion, items: Sequence[JudgeItem]) -> List[float]:
+        """Score ``items``, returning scores in input order."""
+        if not self.backend.supports(criterion):
+            raise ValueError(f"{type(self.backend).__name__} cannot score criterion {criterion.name!r}")
+        keys = [self.cache_key(criterion, item) for item in items]
+        results: Dict[str, float] = {}
+        pending: Dict[str, JudgeItem] = {}
+
+        for key, item in zip(keys, items):
+            if key in results or key in pending:
+                self.stats["deduplicated"] += 1
+                continue
+            cached = self.cache.get(key) if self.cache else None
+            if cached is not None:
+                results[key] = cached
+                self.stats["cache_hits"] += 1
+            else:
+                pending[key] = item
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(batch: List[Tuple[str, JudgeItem]]) -> None:
+            async with semaphore:
+                scores = await self._request(criterion, batch)
+            missing = []
+            for key, item in batch:
+                if key not in scores:
+                    missing.append((key, item))
+                    continue
+                results[key] = scores[key]
+                self.stats["scored"] += 1
+                if self.cache:
+                    self.cache.put(key, scores[key])
+            if missing and len(batch) == 1:
+                raise JudgeResponseError(f"Judge returned no score for item {batch[0][1].item_id!r}")
+            if missing:
+                self.stats["rescored"] += len(missing)
+                await asyncio.gather(*(run([entry]) for entry in missing))
+
+        await asyncio.gather(*(run(batch) for batch in self._pack(list(pending.items()))))
+        return [results[key] for key in keys]
+
+    def score_many_sync(self, criterion: Criterion, items: Sequence[JudgeItem]) -> List[float]:
+        """Blocking wrapper around ``score_many`` for scripts and offline jobs.
+
+        Raises:
+            RuntimeError: When called from a running event loop; await
+                          ``score_many`` there instead.
+        """
+        return _run_blocking(self.score_many(criterion, items), "JudgeEngine.score_many_sync", "engine.score_many")
+
+    def _pack(self, entries: List[Tuple[str, JudgeItem]]) -> List[List[Tuple[str, JudgeItem]]]:
+        """Greedily group entries by ``batch_size`` and the backend's character budget."""
+        batches: List[List[Tuple[str, JudgeItem]]] = []
+        current: List[Tuple[str, JudgeItem]] = []
+        chars = 0
+        for entry in entries:
+            size = len(entry[1].text) + len(entry[1].context)
+            if current and (len(current) >= self.batch_size or chars + size > self.backend.max_batch_chars):
+                batches.append(current)
+                current, chars = [], 0
+            current.append(entry)
+            chars += size
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _request(self, criterion: Criterion, batch: List[Tuple[str, JudgeItem]]) -> Dict[str, float]:
+        # Short positional ids are easier for a model to echo back than call ids.
+        packed = [JudgeItem(str(i + 1), item.text, item.context) for i, (_, item) in enumerate(batch)]
+        self.stats["requests"] += 1
+        scores = await retry_async(
+            lambda: self.backend.score_batch(criterion, packed),
+            max_retries=self.max_retries,
+            backoff=self.retry_backoff,
+            limiter=self.limiter,
+        )
+        return {key: scores[item.item_id] for (key, _), item in zip(batch, packed) if item.item_id in scores}
@@ -1,14 +1,51 @@
-from voiceeval.metrics.base import BaseMetric
-from voiceeval.metrics.conversation import SentimentMetric, TopicAdherenceMetric
-from voiceeval.metrics.performance import TimeToFirstByteMetric, EndToEndLatencyMetric
-from voiceeval.metrics.voice import InterruptionRateMetric, SilenceDurationMetric
+from typing import TYPE_CHECKING
+
+from voiceeval._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from voiceeval.metrics.audio_quality import (
+        ClippingRatioMetric,
+        DropoutRateMetric,
+        EchoCorrelationMetric,
+        LoudnessMetric,
+        SNRMetric,
+    )
+    from voiceeval.metrics.base import BaseMetric
+    from voiceeval.metrics.conversation import JudgeMetric, SentimentMetric, TopicAdherenceMetric
+    from voiceeval.metrics.performance import TimeToFirstByteMetric, EndToEndLatencyMetric
+    from voiceeval.metrics.timeline import SpeakerTimeline
+    from voiceeval.metrics.voice import InterruptionRateMetric, SilenceDurationMetric
 
 __all__ = [
     "BaseMetric",
+    "JudgeMetric",
     "SentimentMetric",
     "TopicAdherenceMetric",
     "TimeToFirstByteMetric",
     "EndToEndLatencyMetric",
     "InterruptionRateMetric",
-    "SilenceDurationMetric"
+    "SilenceDurationMetric",
+    "SpeakerTimeline",
+    "ClippingRatioMetric",
+    "LoudnessMetric",
+    "SNRMetric",
+    "DropoutRateMetric",
+    "EchoCorrelationMetric",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "BaseMetric": "voiceeval.metrics.base",
+    "JudgeMetric": "voiceeval.metrics.conversation",
+    "SentimentMetric": "voiceeval.metrics.conversation",
+    "TopicAdherenceMetric": "voiceeval.metrics.conversation",
+    "TimeToFirstByteMetric": "voiceeval.metrics.performance",
+    "EndToEndLatencyMetric": "voiceeval.metrics.performance",
+    "InterruptionRateMetric": "voiceeval.metrics.voice",
+    "SilenceDurationMetric": "voiceeval.metrics.voice",
+    "SpeakerTimeline": "voiceeval.metrics.timeline",
+    "ClippingRatioMetric": "voiceeval.metrics.audio_quality",
+    "LoudnessMetric": "voiceeval.metrics.audio_quality",
+    "SNRMetric": "voiceeval.metrics.audio_quality",
+    "DropoutRateMetric": "voiceeval.metrics.audio_quality",
+    "EchoCorrelationMetric": "voiceeval.metrics.audio_quality",
+})
@@ -0,0 +1,165 @@
+"""
+Audio-quality metrics: clipping, loudness, SNR, dropouts and echo.
+
+All of them read one ``QualityReport`` per call, computed by
+``voiceeval.audio.quality.AudioQualityAnalyzer`` in a single vectorized pass
+that also runs the VAD. Reports are stored in
+``transcript.metadata["audio_quality"]``, keyed by the analyzer settings and
+channel names that produced them, and the VAD output goes to
+``"vad_intervals"``. Evaluating several of these metrics with the same
+settings, plus ``InterruptionRateMetric`` / ``SilenceDurationMetric``, reads
+each recording once; metrics with other settings get their own report.
+
+The recording comes from the ``audio`` callable if given, else from
+``transcript.metadata["audio_path"]``. Calls without audio score 0.0.
+"""
+
+import json
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence, Union
+
+from voiceeval.metrics.base import BaseMetric
+from voiceeval.metrics.voice import VAD_INTERVALS_KEY
+from voiceeval.models import Call, Transcript
+
+if TYPE_CHECKING:
+    from voiceeval.audio.ingestion import AudioIngestor
+    from voiceeval.audio.quality import AudioQualityAnalyzer
+
+# Transcript metadata key holding ``{settings key: {speaker | "all": ChannelQuality dict}}``.
+AUDIO_QUALITY_KEY = "audio_quality"
+
+# Transcript metadata key holding the path of the call's recording.
+AUDIO_PATH_KEY = "audio_path"
+
+# Returns the call's recording (a path or an open ``AudioIngestor``), or None.
+AudioProvider = Callable[[Call], Optional[Union[str, "AudioIngestor"]]]
+
+
+class AudioQualityMetric(BaseMetric):
+    """
+    Base for metrics read from a call's audio-quality report.
+
+    Args:
+        speaker: Channel to report; None pools every channel.
+        audio: Optional callable returning the call's recording. Defaults to
+               ``transcript.metadata["audio_path"]``.
+        analyzer: Analysis settings; defaults to ``AudioQualityAnalyzer()``.
+        speakers: Channel names for recordings opened from a path, e.g.
+                  ``["user", "agent"]``.
+    """
+    field: str = ""
+    label: str = ""
+
+    def __init__(
+        self,
+        speaker: Optional[str] = None,
+        audio: Optional[AudioProvider] = None,
+        analyzer: Optional["AudioQualityAnalyzer"] = None,
+        speakers: Optional[Sequence[str]] = None,
+    ):
+        self.speaker = speaker
+        self.audio = audio
+        self.analyzer = analyzer
+        self.speakers = speakers
+
+    @property
+    def name(self) -> str:
+        return f"{self.label}.{self.speaker}" if self.speaker else self.label
+
+    def cache_key(self) -> str:
+        """Identifies the analyzer settings and channel names behind a cached report."""
+        from voiceeval.audio.quality import AudioQualityAnalyzer
+
+        settings = (self.analyzer or AudioQualityAnalyzer()).settings()
+        settings["speakers"] = list(self.speakers) if self.speakers is not None else None
+        return json.dumps(settings, sort_keys=True, separators=(",", ":"))
+
+    def report(self, call: Call) -> Optional[Dict[str, Dict[str, Any]]]:
+        """The call's quality report for these settings, analyzing (and caching) it on first use."""
+        metadata = call.transcript.metadata if call.transcript is not None else {}
+        key = self.cache_key()
+        cached = metadata.get(AUDIO_QUALITY_KEY, {}).get(key)
+        if cached is not None:
+            return cached
+
+        source = self.audio(call) if self.audio else metadata.get(AUDIO_PATH_KEY)
+        if source is None:
+            return None
+
+        from voiceeval.audio.ingestion import AudioIngestor
+        from voiceeval.audio.quality import AudioQualityAnalyzer
+
+        analyzer = self.analyzer or AudioQualityAnalyzer()
+        if isinstance(source, AudioIngestor):
+            result = analyzer.analyze(source)
+        else:
+            with AudioIngestor(source, speakers=self.speakers) as ingestor:
+                result = analyzer.analyze(ingestor)
+
+        if call.transcript is None:
+            call.transcript = Transcript()
+        report = result.to_dict()
+        call.transcript.metadata.setdefault(AUDIO_QUALITY_KEY, {})[key] = report
+        call.transcript.metadata.setdefault(
+            VAD_INTERVALS_KEY, {name: [list(i) for i in spans] for name, spans in result.vad_intervals.items()}
+        )
+        return report
+
+    def value(self, quality: Dict[str, Any]) -> float:
+        return float(quality[self.field])
+
+    def evaluate(self, call: Call) -> float:
+        report = self.report(call)
+        if report is None:
+            return 0.0
+        from voiceeval.audio.quality import ALL_CHANNELS
+
+        quality = report.get(self.speaker or ALL_CHANNELS)
+        if quality is None:
+            raise ValueError(f"No channel {self.speaker!r} in audio of call {call.call_id!r}; have {sorted(report)}")
+        return self.value(quality)
+
+
+class ClippingRatioMetric(AudioQualityMetric):
+    """Fraction of samples at (or within 0.1% of) full scale."""
+    field = "clipping_ratio"
+    label = "clipping_ratio"
+
+
+class LoudnessMetric(AudioQualityMetric):
+    """
+    Programme level: BS.1770-style integrated loudness in LUFS, or plain RMS
+    level in dBFS.
+
+    Args:
+        measure: ``"lufs"`` or ``"rms"``.
+        speaker, audio, analyzer, speakers: See ``AudioQualityMetric``.
+    """
+
+    def __init__(self, measure: str = "lufs", **kwargs):
+        if measure not in ("lufs", "rms"):
+            raise ValueError(f"measure must be 'lufs' or 'rms', got {measure!r}")
+        super().__init__(**kwargs)
+        self.field = "lufs" if measure == "lufs" else "rms_dbfs"
+        self.label = "loudness_lufs" if measure == "lufs" else "rms_dbfs"
+
+
+class SNRMetric(AudioQualityMetric):
+    """Estimated signal-to-noise ratio in dB (VAD speech frames vs. the rest)."""
+    field = "snr_db"
+    label = "snr_db"
+
+
+class DropoutRateMetric(AudioQualityMetric):
+    """Dropouts (packet-loss gaps of repeated samples) per minute of audio."""
+    label = "dropouts_per_minute"
+
+    def value(self, quality: Dict[str, Any]) -> float:
+        duration = quality["duration"]
+        return quality["dropouts"] / (duration / 60.0) if duration else 0.0
+
+
+class EchoCorrelationMetric(AudioQualityMetric):
+    """Peak normalized correlation between a channel and another channel leading it (0-1)."""
+    field = "echo_correlation"
+    label = "echo_correlation"
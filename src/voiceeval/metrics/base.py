@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List, Sequence
 from voiceeval.models import Call
 
 class BaseMetric(ABC):
@@ -18,3 +18,25 @@ class BaseMetric(ABC):
         Should return a numerical score or value.
         """
         pass
+
+    def evaluate_many(self, calls: Sequence[Call]) -> List[float]:
+        """
+        Evaluate a batch of calls.
+        Metrics backed by remote models override this to batch requests.
+        """
+        return [self.evaluate(call) for call in calls]
+
+    async def aevaluate(self, call: Call) -> float:
+        """
+        Evaluate the metric from async code.
+        Delegates to ``aevaluate_many``, so batching overrides apply.
+        """
+        return (await self.aevaluate_many([call]))[0]
+
+    async def aevaluate_many(self, calls: Sequence[Call]) -> List[float]:
+        """
+        Evaluate a batch of calls from async code.
+        Metrics backed by remote models override this to await their requests
+        instead of blocking the event loop.
+        """
+        return self.evaluate_many(calls)
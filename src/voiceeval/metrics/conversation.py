@@ -1,19 +1,108 @@
+"""
+Conversation-quality metrics scored by an LLM judge.
+
+Both metrics delegate to a ``JudgeEngine``. ``evaluate`` scores one call;
+``evaluate_many`` (used by ``OfflineRunner``) sends a whole batch of calls
+through the engine at once, so prompts are packed, requests run
+concurrently and previously scored transcripts come from the cache. From
+async code (e.g. ``AudioPipeline``) await ``aevaluate``/``aevaluate_many``;
+the blocking methods raise inside a running event loop.
+
+Without an explicit engine the offline ``LocalJudgeBackend`` is used, which
+needs no network access and is fully deterministic.
+"""
+
+from typing import List, Optional, Sequence
+
+from voiceeval.judge.backends import Criterion, JudgeItem
+from voiceeval.judge.engine import JudgeEngine, _run_blocking, render_transcript
 from voiceeval.metrics.base import BaseMetric
 from voiceeval.models import Call
 
-class SentimentMetric(BaseMetric):
-    @property
-    def name(self) -> str:
-        return "sentiment"
+SENTIMENT = Criterion(
+    name="sentiment",
+    instructions=(
+        "You are rating customer calls with a voice agent. For each transcript, rate the "
+        "caller's overall sentiment by the end of the call: -1 is clearly negative "
+        "(angry, frustrated, unresolved), 0 is neutral and 1 is clearly positive."
+    ),
+    scale=(-1.0, 1.0),
+)
 
-    def evaluate(self, call: Call) -> float:
-        # Placeholder logic
-        return 0.0
+TOPIC_ADHERENCE = Criterion(
+    name="topic_adherence",
+    instructions=(
+        "You are reviewing calls handled by a voice agent. For each transcript, rate how well "
+        "the agent stays on the topic given as context (or, if none is given, on the caller's "
+        "stated purpose): 1 means every agent turn serves the topic, 0 means the agent "
+        "drifted entirely."
+    ),
+    scale=(0.0, 1.0),
+)
+
+
+class JudgeMetric(BaseMetric):
+    """
+    Base for metrics scored by a ``JudgeEngine``.
+
+    Args:
+        engine: Scoring engine; defaults to ``JudgeEngine()`` (local backend).
+        max_transcript_chars: Transcripts longer than this are elided in the
+                              middle before judging.
+    """
+    criterion: Criterion
+
+    def __init__(self, engine: Optional[JudgeEngine] = None, max_transcript_chars: int = 8000):
+        self.engine = engine or JudgeEngine()
+        self.max_transcript_chars = max_transcript_chars
 
-class TopicAdherenceMetric(BaseMetric):
     @property
     def name(self) -> str:
-        return "topic_adherence"
+        return self.criterion.name
+
+    def context(self, call: Call) -> str:
+        return ""
+
+    def item(self, call: Call) -> Optional[JudgeItem]:
+        """The judge input for ``call``, or None when there is nothing to judge."""
+        text = render_transcript(call, self.max_transcript_chars)
+        if not text:
+            return None
+        return JudgeItem(call.call_id, text, self.context(call))
 
     def evaluate(self, call: Call) -> float:
-        return 0.0
+        return _run_blocking(self.aevaluate(call), f"{type(self).__name__}.evaluate", "metric.aevaluate")
+
+    def evaluate_many(self, calls: Sequence[Call]) -> List[float]:
+        return _run_blocking(self.aevaluate_many(calls), f"{type(self).__name__}.evaluate_many", "metric.aevaluate_many")
+
+    async def aevaluate_many(self, calls: Sequence[Call]) -> List[float]:
+        """Async ``evaluate_many``; calls without a transcript score 0.0."""
+        items = [self.item(call) for call in calls]
+        scores = iter(await self.engine.score_many(self.criterion, [item for item in items if item is not None]))
+        return [next(scores) if item is not None else 0.0 for item in items]
+
+
+class SentimentMetric(JudgeMetric):
+    """Caller sentiment from -1 (negative) to 1 (positive)."""
+    criterion = SENTIMENT
+
+
+class TopicAdherenceMetric(JudgeMetric):
+    """
+    How well the agent stays on topic, from 0 to 1.
+
+    Args:
+        topic: Topic the agent should stick to. A call's
+               ``transcript.metadata["topic"]`` takes precedence.
+        engine: Scoring engine; defaults to ``JudgeEngine()`` (local backend).
+    """
+    criterion = TOPIC_ADHERENCE
+
+    def __init__(self, topic: Optional[str] = None, engine: Optional[JudgeEngine] = None, max_transcript_chars: int = 8000):
+        super().__init__(engine, max_transcript_chars)
+        self.topic = topic
+
+    def context(self, call: Call) -> str:
+        topic = call.transcript.metadata.get("topic") if call.transcript else None
+        return topic or self.topic or ""
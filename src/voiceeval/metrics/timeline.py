@@ -0,0 +1,232 @@
+"""
+Speaker timeline engine for turn-taking metrics.
+
+A ``SpeakerTimeline`` holds, for each speaker, a sorted array of disjoint
+``(start, end)`` speech intervals in seconds. All analyses are a single
+sweep over the per-speaker arrays merged with ``heapq.merge``, so they run in
+``O(n log k)`` for ``n`` intervals and ``k`` speakers — linear for a call with
+a fixed number of participants — instead of comparing every pair of segments.
+
+Intervals come from a ``Transcript`` (``timestamp`` / ``end_timestamp``) and
+can be replaced per speaker by VAD output (``voiceeval.audio.VAD``), which
+resolves pauses and overlaps inside a single transcript segment.
+"""
+
+import heapq
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from voiceeval.models import Transcript
+
+Interval = Tuple[float, float]
+
+
+class OverlapInterval(NamedTuple):
+    """A stretch of time where two or more speakers talk at once."""
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class BargeIn(NamedTuple):
+    """``speaker`` started talking while ``interrupted`` were still speaking."""
+    time: float
+    speaker: str
+    interrupted: Tuple[str, ...]
+
+
+class Gap(NamedTuple):
+    """A stretch of time where nobody speaks, between two speech intervals."""
+    start: float
+    end: float
+    before: str
+    after: str
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    @property
+    def is_turn_gap(self) -> bool:
+        """True when the floor passes to a different speaker across the gap."""
+        return self.before != self.after
+
+
+class TimelineAnalysis(NamedTuple):
+    """Everything computed by one sweep over the timeline."""
+    overlaps: List[OverlapInterval]
+    barge_ins: List[BargeIn]
+    gaps: List[Gap]
+    speaker_changes: int
+
+
+@dataclass
+class SilenceStats:
+    """Distribution of silent gaps, in seconds."""
+    count: int = 0
+    total: float = 0.0
+    mean: float = 0.0
+    p50: float = 0.0
+    p95: float = 0.0
+    max: float = 0.0
+
+
+def _normalize(intervals: Sequence[Interval]) -> List[Interval]:
+    """Sort, drop empty intervals and merge overlapping/touching ones."""
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if end <= start:
+            continue
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """Linear-interpolated percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    pos = (len(sorted_values) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+class SpeakerTimeline:
+    """
+    Per-speaker sorted speech intervals with sweep-line analyses.
+
+    Args:
+        intervals: ``{speaker: [(start, end), ...]}`` in seconds. Intervals are
+                   sorted and merged per speaker; order does not matter.
+    """
+
+    def __init__(self, intervals: Mapping[str, Sequence[Interval]]):
+        self.intervals: Dict[str, List[Interval]] = {}
+        for speaker, spans in intervals.items():
+            normalized = _normalize(spans)
+            if normalized:
+                self.intervals[speaker] = normalized
+
+    @classmethod
+    def from_transcript(
+        cls,
+        transcript: Transcript,
+        vad: Optional[Mapping[str, Sequence[Interval]]] = None,
+    ) -> "SpeakerTimeline":
+        """Build a timeline from transcript segments.
+
+        Each segment spans ``timestamp`` to ``end_timestamp``. Segments without
+        ``end_timestamp`` are assumed to last until the next segment starts
+        (so they can never overlap); the final such segment is dropped.
+
+        Args:
+            transcript: Source transcript.
+            vad: Optional ``{speaker: intervals}`` from voice activity
+                 detection. A speaker present here uses these intervals
+                 instead of their transcript segments.
+        """
+        vad = vad or {}
+        segments = sorted(transcript.segments, key=lambda s: s.timestamp)
+        intervals: Dict[str, List[Interval]] = {speaker: list(spans) for speaker, spans in vad.items()}
+        for i, seg in enumerate(segments):
+            if seg.speaker in vad:
+                continue
+            end = seg.end_timestamp
+            if end is None:
+                if i + 1 >= len(segments):
+                    continue
+                end = segments[i + 1].timestamp
+            intervals.setdefault(seg.speaker, []).append((seg.timestamp, end))
+        return cls(intervals)
+
+    @property
+    def speakers(self) -> List[str]:
+        return list(self.intervals)
+
+    def _events(self) -> Iterator[Tuple[float, int, str]]:
+        """Yield ``(time, delta, speaker)`` in time order; ends sort before starts."""
+        streams = [
+            [(t, delta, speaker) for start, end in spans for t, delta in ((start, 1), (end, -1))]
+            for speaker, spans in self.intervals.items()
+        ]
+        # Per-speaker streams are already ordered, so a k-way merge suffices.
+        # Ties order ends (-1) before starts (+1): touching intervals never overlap.
+        return heapq.merge(*streams, key=lambda e: (e[0], e[1]))
+
+    def analyze(self) -> TimelineAnalysis:
+        """Single pass computing overlaps, barge-ins, gaps and speaker changes."""
+        overlaps: List[OverlapInterval] = []
+        barge_ins: List[BargeIn] = []
+        gaps: List[Gap] = []
+        speaker_changes = 0
+
+        active: Dict[str, None] = {}  # insertion-ordered set
+        overlap_start: Optional[float] = None
+        last_end: Optional[float] = None
+        last_speaker: Optional[str] = None
+        previous_starter: Optional[str] = None
+
+        for time, delta, speaker in self._events():
+            if delta > 0:
+                if active:
+                    barge_ins.append(BargeIn(time, speaker, tuple(active)))
+                elif last_end is not None and time > last_end:
+                    gaps.append(Gap(last_end, time, last_speaker, speaker))
+                if previous_starter is not None and speaker != previous_starter:
+                    speaker_changes += 1
+                previous_starter = speaker
+                active[speaker] = None
+                if len(active) == 2:
+                    overlap_start = time
+            else:
+                if len(active) == 2 and overlap_start is not None and time > overlap_start:
+                    overlaps.append(OverlapInterval(overlap_start, time))
+                del active[speaker]
+                if not active:
+                    last_end, last_speaker = time, speaker
+        return TimelineAnalysis(overlaps, barge_ins, gaps, speaker_changes)
+
+    def overlaps(self) -> List[OverlapInterval]:
+        """Intervals where at least two speakers are active."""
+        return self.analyze().overlaps
+
+    def barge_ins(self) -> List[BargeIn]:
+        """Speech onsets that start while another speaker is still talking."""
+        return self.analyze().barge_ins
+
+    def gaps(self) -> List[Gap]:
+        """Silent gaps between consecutive speech, in time order."""
+        return self.analyze().gaps
+
+    def speaker_changes(self) -> int:
+        """Number of speech onsets by a different speaker than the previous onset."""
+        return self.analyze().speaker_changes
+
+    def silence_stats(self, turn_gaps_only: bool = False) -> SilenceStats:
+        """Distribution of gap durations.
+
+        Args:
+            turn_gaps_only: Only count gaps where the floor changes speaker
+                            (response latency), not pauses within a turn.
+        """
+        durations = sorted(
+            gap.duration for gap in self.gaps() if gap.is_turn_gap or not turn_gaps_only
+        )
+        if not durations:
+            return SilenceStats()
+        total = sum(durations)
+        return SilenceStats(
+            count=len(durations),
+            total=total,
+            mean=total / len(durations),
+            p50=_percentile(durations, 0.5),
+            p95=_percentile(durations, 0.95),
+            max=durations[-1],
+        )
@@ -1,18 +1,80 @@
+from typing import Callable, Mapping, Optional, Sequence
 from voiceeval.metrics.base import BaseMetric
+from voiceeval.metrics.timeline import Interval, SpeakerTimeline
 from voiceeval.models import Call
 
-class InterruptionRateMetric(BaseMetric):
+# Transcript metadata key holding ``{speaker: [[start, end], ...]}`` VAD output.
+VAD_INTERVALS_KEY = "vad_intervals"
+
+# Returns per-speaker VAD intervals for a call, or None to use the transcript only.
+VADProvider = Callable[[Call], Optional[Mapping[str, Sequence[Interval]]]]
+
+
+class _TimelineMetric(BaseMetric):
+    """
+    Base for metrics computed from the call's speaker timeline.
+
+    Args:
+        vad: Optional callable returning ``{speaker: [(start, end), ...]}``
+             speech intervals for a call (e.g. from ``voiceeval.audio.VAD``).
+             Speakers it covers use VAD intervals instead of transcript segments.
+             Defaults to ``transcript.metadata["vad_intervals"]`` when present,
+             as recorded by ``voiceeval.audio.AudioPipeline``.
+    """
+    def __init__(self, vad: Optional[VADProvider] = None):
+        self.vad = vad
+
+    def timeline(self, call: Call) -> Optional[SpeakerTimeline]:
+        if call.transcript is None:
+            return None
+        if self.vad:
+            vad = self.vad(call)
+        else:
+            vad = call.transcript.metadata.get(VAD_INTERVALS_KEY)
+        return SpeakerTimeline.from_transcript(call.transcript, vad=vad)
+
+
+class InterruptionRateMetric(_TimelineMetric):
+    """
+    Fraction of speaker turns that were barge-ins, i.e. started while someone
+    else was still talking.
+
+    Every speech onset after the first is a turn, including consecutive
+    onsets by the same speaker, so repeated barge-ins by one speaker each
+    count once in both the numerator and the denominator.
+    """
     @property
     def name(self) -> str:
         return "interruption_rate"
 
     def evaluate(self, call: Call) -> float:
-        return 0.0
+        timeline = self.timeline(call)
+        if timeline is None:
+            return 0.0
+        turns = sum(len(spans) for spans in timeline.intervals.values()) - 1
+        if turns <= 0:
+            return 0.0
+        return len(timeline.barge_ins()) / turns
+
+
+class SilenceDurationMetric(_TimelineMetric):
+    """
+    Total seconds of silence between speech in the call.
+
+    Args:
+        vad: See ``_TimelineMetric``.
+        turn_gaps_only: Only count silence where the floor changes speaker.
+    """
+    def __init__(self, vad: Optional[VADProvider] = None, turn_gaps_only: bool = False):
+        super().__init__(vad=vad)
+        self.turn_gaps_only = turn_gaps_only
 
-class SilenceDurationMetric(BaseMetric):
     @property
     def name(self) -> str:
         return "silence_duration"
 
     def evaluate(self, call: Call) -> float:
-        return 0.0
+        timeline = self.timeline(call)
+        if timeline is None:
+            return 0.0
+        return timeline.silence_stats(turn_gaps_only=self.turn_gaps_only).total
@@ -20,6 +20,7 @@ class TranscriptSegment(BaseModel):
     speaker: str
     text: str
     timestamp: float
+    end_timestamp: Optional[float] = None
     confidence: Optional[float] = None
 
 class Transcript(BaseModel):
@@ -0,0 +1,177 @@
+"""
+Per-call budgets: keep one runaway call from flooding the export queue.
+
+A looping tool call or a reconnecting STT stream can start thousands of
+spans in one call. With a ``CallBudget``, ``CallIdSpanProcessor`` counts each
+monitored call's spans, attribute bytes and events; once any limit is hit,
+the call's further spans are withheld from export at the ``metrics`` detail
+level (only their durations are kept, in ``SpanDurations``) and the root
+span is marked::
+
+    voiceeval.truncated          = True
+    voiceeval.truncated.reason   = "max_spans" | "max_attribute_bytes" | "max_events"
+    voiceeval.truncated.spans    = <spans withheld>
+
+The root span itself is never withheld.
+"""
+
+import collections
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional
+
+TRUNCATED_ATTRIBUTE = "voiceeval.truncated"
+TRUNCATED_REASON_ATTRIBUTE = "voiceeval.truncated.reason"
+TRUNCATED_SPANS_ATTRIBUTE = "voiceeval.truncated.spans"
+
+
+@dataclass(frozen=True)
+class CallBudget:
+    """
+    Limits for one call; None means unlimited.
+
+    Attributes:
+        max_spans: Spans exported per call, not counting the root span.
+        max_attribute_bytes: Approximate size of span and event attributes
+                             (string lengths, 8 bytes per number).
+        max_events: Span events (e.g. streamed completions, exceptions).
+    """
+    max_spans: Optional[int] = None
+    max_attribute_bytes: Optional[int] = None
+    max_events: Optional[int] = None
+
+    def __post_init__(self):
+        for name in ("max_spans", "max_attribute_bytes", "max_events"):
+            value = getattr(self, name)
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must be >= 0, got {value}")
+
+
+def _value_size(value: Any) -> int:
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, (tuple, list)):
+        return sum(_value_size(v) for v in value)
+    return 8
+
+
+def attribute_bytes(attributes: Optional[Mapping[str, Any]]) -> int:
+    """Approximate serialized size of a span's or event's attributes."""
+    if not attributes:
+        return 0
+    # The SDK's BoundedAttributes takes a lock per item; iterate its dict directly.
+    attributes = getattr(attributes, "_dict", attributes)
+    size = 0
+    for key, value in attributes.items():
+        size += len(key) + (len(value) if value.__class__ is str else _value_size(value))
+    return size
+
+
+class CallUsage:
+    """What one call has used so far."""
+    __slots__ = ("spans", "attribute_bytes", "events", "withheld", "reason")
+
+    def __init__(self):
+        self.spans = 0
+        self.attribute_bytes = 0
+        self.events = 0
+        self.withheld = 0
+        self.reason: Optional[str] = None
+
+    def truncation_attributes(self) -> Dict[str, Any]:
+        """Root-span attributes describing the truncation, or {} if none."""
+        if self.reason is None:
+            return {}
+        return {
+            TRUNCATED_ATTRIBUTE: True,
+            TRUNCATED_REASON_ATTRIBUTE: self.reason,
+            TRUNCATED_SPANS_ATTRIBUTE: self.withheld,
+        }
+
+
+class BudgetTracker:
+    """
+    Thread-safe per-call usage accounting for a ``CallBudget``.
+
+    Args:
+        budget: The limits to enforce.
+        max_calls: Calls tracked at once. Usage is dropped when the root span
+                   ends; calls without a root span are evicted least recently
+                   active first. The ids of the last ``max_calls`` finished
+                   calls are remembered, so their late spans are not counted.
+    """
+
+    def __init__(self, budget: CallBudget, max_calls: int = 4096):
+        self.budget = budget
+        self.max_calls = max_calls
+        self._calls: "collections.OrderedDict[str, CallUsage]" = collections.OrderedDict()
+        self._finished: "collections.OrderedDict[str, None]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def _usage(self, call_id: str) -> Optional[CallUsage]:
+        """The call's usage (now most recently active), or None once it has finished."""
+        usage = self._calls.get(call_id)
+        if usage is not None:
+            self._calls.move_to_end(call_id)
+            return usage
+        if call_id in self._finished:
+            return None
+        usage = self._calls[call_id] = CallUsage()
+        if len(self._calls) > self.max_calls:
+            self._calls.popitem(last=False)
+        return usage
+
+    def start(self, call_id: str) -> bool:
+        """Count a span starting in ``call_id``; False if it must be withheld."""
+        limit = self.budget.max_spans
+        with self._lock:
+            usage = self._usage(call_id)
+            if usage is None:
+                return True
+            if usage.reason is None and limit is not None and usage.spans >= limit:
+                usage.reason = "max_spans"
+            if usage.reason is not None:
+                usage.withheld += 1
+                return False
+            usage.spans += 1
+            return True
+
+    def end(self, call_id: str, span) -> bool:
+        """Charge an ended span's attributes and events; False if it must be withheld."""
+        budget = self.budget
+        if budget.max_attribute_bytes is None and budget.max_events is None:
+            return True
+        # The public properties copy; read the SDK's fields when present.
+        events = getattr(span, "_events", None)
+        if events is None:
+            events = span.events
+        size = attribute_bytes(getattr(span, "_attributes", None) or span.attributes)
+        n_events = len(events)
+        if n_events:
+            for event in events:
+                size += len(event.name) + attribute_bytes(event.attributes)
+        with self._lock:
+            usage = self._usage(call_id)
+            if usage is None:
+                return True
+            if usage.reason is not None:
+                usage.withheld += 1
+                return False
+            usage.attribute_bytes += size
+            usage.events += n_events
+            if budget.max_attribute_bytes is not None and usage.attribute_bytes > budget.max_attribute_bytes:
+                usage.reason = "max_attribute_bytes"
+            elif budget.max_events is not None and usage.events > budget.max_events:
+                usage.reason = "max_events"
+            else:
+                return True
+            usage.withheld += 1
+            return False
+
+    def finish(self, call_id: str) -> Optional[CallUsage]:
+        """Stop tracking ``call_id`` and return its usage, if any was recorded."""
+        with self._lock:
+            self._finished[call_id] = None
+            if len(self._finished) > self.max_calls:
+                self._finished.popitem(last=False)
+            return self._calls.pop(call_id, None)
@@ -0,0 +1,145 @@
+"""
+Detail levels: how much of a call's telemetry leaves the process.
+
+Every span carries an effective level, decided when it starts:
+
+* ``full`` — exported as recorded (the default for monitored calls).
+* ``timing`` — exported with name, timestamps, status and structural
+  attributes only; inputs, outputs, prompts and events are stripped before
+  the span is queued, so they are never serialized or sent.
+* ``metrics`` — not exported at all; the span's duration is recorded in a
+  local per-name histogram (``SpanDurations``).
+
+Unmonitored calls (``skip_call()``, ``auto_monitor=False`` or sampled out)
+use the Client's ``unmonitored_detail``; ``set_call_detail()`` overrides it
+for one call. Non-full levels are stored on the span as ``voiceeval.detail``.
+
+Levels are applied when a span ends, not through the sampler: ``metrics``
+spans must still be recorded to measure their duration. So spans at every
+level cost the same to record in-process. What a lower level saves is the
+export queue, serialization and network.
+"""
+
+import threading
+import types
+from typing import Dict, Iterable, Optional
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+
+from voiceeval.context import DETAIL_LEVELS
+from voiceeval.histogram import LatencyHistogram
+
+FULL, TIMING, METRICS = DETAIL_LEVELS
+
+DETAIL_ATTRIBUTE = "voiceeval.detail"
+
+# Attributes kept at ``timing`` detail: identity, model names, token counts,
+# stream timing, truncation markers and status codes — nothing that carries
+# conversation content.
+TIMING_ATTRIBUTES = frozenset({
+    DETAIL_ATTRIBUTE,
+    "voiceeval.call_id",
+    "voiceeval.agent_name",
+    "voiceeval.trace_name_override",
+    "gen_ai.system",
+    "gen_ai.operation.name",
+    "gen_ai.request.model",
+    "gen_ai.response.model",
+    "llm.request.type",
+    "http.status_code",
+    "http.response.status_code",
+    "error.type",
+})
+TIMING_ATTRIBUTE_PREFIXES = ("voiceeval.stream.", "voiceeval.truncated", "gen_ai.usage.", "llm.usage.")
+
+
+def strip_to_timing(span: ReadableSpan) -> None:
+    """Drop content attributes and all events from an ended span, in place."""
+    attributes = span.attributes or {}
+    kept = {
+        key: value for key, value in attributes.items()
+        if key in TIMING_ATTRIBUTES or key.startswith(TIMING_ATTRIBUTE_PREFIXES)
+    }
+    # Same internal-field pattern as CallIdSpanProcessor._update_span_attributes.
+    span._attributes = types.MappingProxyType(kept)
+    span._events = ()
+
+
+class SpanDurations:
+    """
+    Per-span-name duration histograms (seconds) for ``metrics``-level spans.
+
+    Args:
+        relative_error: Percentile accuracy of each histogram.
+    """
+
+    def __init__(self, relative_error: float = 0.01):
+        self.relative_error = relative_error
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, span: ReadableSpan) -> None:
+        if span.start_time is None or span.end_time is None:
+            return
+        seconds = (span.end_time - span.start_time) / 1e9
+        with self._lock:
+            histogram = self.histograms.get(span.name)
+            if histogram is None:
+                histogram = self.histograms[span.name] = LatencyHistogram(self.relative_error)
+            histogram.record(seconds)
+
+    def summary(self, percentiles: Iterable[float] = (0.5, 0.95, 0.99)) -> Dict[str, Dict[str, float]]:
+        """``{span_name: LatencyHistogram.summary()}``."""
+        with self._lock:
+            return {name: hist.summary(percentiles) for name, hist in sorted(self.histograms.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.histograms = {}
+
+
+def admit(span: ReadableSpan, durations: Optional[SpanDurations]) -> bool:
+    """
+    Apply the span's detail level before it is queued for export.
+
+    Returns False for ``metrics`` spans (recorded in ``durations`` instead);
+    ``timing`` spans are stripped in place.
+    """
+    level = span.attributes.get(DETAIL_ATTRIBUTE) if span.attributes else None
+    if level is None or level == FULL:
+        return True
+    if level == METRICS:
+        if durations is not None:
+            durations.record(span)
+        return False
+    strip_to_timing(span)
+    return True
+
+
+class DetailLevelSpanProcessor(SpanProcessor):
+    """
+    Wraps an exporting processor (usually ``BatchSpanProcessor``) so spans
+    are stripped or withheld according to their detail level.
+
+    Args:
+        delegate: Processor that queues and exports admitted spans.
+        durations: Where ``metrics``-level span durations are recorded.
+    """
+
+    def __init__(self, delegate: SpanProcessor, durations: Optional[SpanDurations] = None):
+        self.delegate = delegate
+        self.durations = durations if durations is not None else SpanDurations()
+
+    def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        self.delegate.on_start(span, parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if admit(span, self.durations):
+            self.delegate.on_end(span)
+
+    def shutdown(self) -> None:
+        self.delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.delegate.force_flush(timeout_millis)
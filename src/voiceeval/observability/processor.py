@@ -19,14 +19,21 @@ from opentelemetry.sdk.trace import Span, SpanProcessor
 from voiceeval.context import (
     CallMetadata,
     ensure_call_metadata,
+    get_call_detail,
+    is_call_unmonitored,
     is_monitoring_skipped,
     set_call_metadata,
+    set_call_unmonitored,
+    validate_detail,
 )
+from voiceeval.observability.budget import BudgetTracker, CallBudget
 
 logger = logging.getLogger(__name__)
 
 _ROOT_SPAN_NAMES = frozenset({"job_entrypoint", "job entrypoint"})
 
+_DETAIL_ATTRIBUTE = "voiceeval.detail"
+
 
 class CallIdSpanProcessor(SpanProcessor):
     """SpanProcessor that attaches voiceeval.call_id to every span.
@@ -40,6 +47,13 @@ class CallIdSpanProcessor(SpanProcessor):
         auto_monitor: If True (default), every call gets a call_id.
                       If False, only calls where monitor_call() was invoked.
         sample_rate: Float 0.0-1.0. Fraction of calls to monitor (default 1.0).
+        unmonitored_detail: Detail level for spans of unmonitored calls:
+                            "full" (default), "timing" or "metrics". Non-full
+                            levels are recorded as ``voiceeval.detail`` and
+                            applied at export (see observability.detail).
+        call_budget: Optional per-call limits on spans, attribute bytes and
+                     events; spans over budget are withheld from export and
+                     the root span is marked ``voiceeval.truncated``.
     """
 
     def __init__(
@@ -47,10 +61,15 @@ class CallIdSpanProcessor(SpanProcessor):
         agent_name: Optional[str] = None,
         auto_monitor: bool = True,
         sample_rate: float = 1.0,
+        unmonitored_detail: str = "full",
+        call_budget: Optional[CallBudget] = None,
     ):
+        validate_detail(unmonitored_detail)
         self._agent_name = agent_name
         self._auto_monitor = auto_monitor
         self._sample_rate = max(0.0, min(1.0, sample_rate))
+        self._unmonitored_detail = unmonitored_detail
+        self._budget = BudgetTracker(call_budget) if call_budget is not None else None
 
     def _should_monitor(self) -> bool:
         """Decide whether the current call should be monitored."""
@@ -68,7 +87,30 @@ class CallIdSpanProcessor(SpanProcessor):
 
         return True
 
+    def _detail_for(self, monitored: bool) -> str:
+        return get_call_detail() or ("full" if monitored else self._unmonitored_detail)
+
     def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        meta = self._call_for_span(span)
+        detail = self._detail_for(meta is not None)
+        if (
+            meta is not None and self._budget is not None and span.name not in _ROOT_SPAN_NAMES
+            and not self._budget.start(meta.call_id)
+        ):
+            detail = "metrics"
+        if detail != "full":
+            span.set_attribute(_DETAIL_ATTRIBUTE, detail)
+        if meta is None:
+            return
+
+        span.set_attribute("voiceeval.call_id", meta.call_id)
+        span.set_attribute("gen_ai.system", "voiceeval")
+
+        if self._agent_name:
+            span.set_attribute("voiceeval.agent_name", self._agent_name)
+
+    def _call_for_span(self, span: Span) -> Optional[CallMetadata]:
+        """The call ``span`` belongs to, or None if the call is not monitored."""
         is_root = span.name in _ROOT_SPAN_NAMES
 
         if is_root:
@@ -76,16 +118,18 @@ class CallIdSpanProcessor(SpanProcessor):
             if self._should_monitor():
                 meta = CallMetadata()
                 set_call_metadata(meta)
+                set_call_unmonitored(False)
             else:
                 # Not monitoring this call — clear any stale metadata
                 set_call_metadata(None)  # type: ignore[arg-type]
-                return
+                set_call_unmonitored(True)
+                return None
 
         # Check skip_call() on every span — it may be called after the root
         # span started (e.g. inside a LiveKit session handler that runs after
         # job_entrypoint). Once skipped, stop tagging new spans.
         if is_monitoring_skipped():
-            return
+            return None
 
         # Get or create metadata for this context
         from voiceeval.context import get_call_metadata
@@ -93,17 +137,13 @@ class CallIdSpanProcessor(SpanProcessor):
 
         if meta is None:
             # No root span was seen yet (non-LiveKit usage, or auto_monitor=False
-            # and monitor_call() wasn't called). Skip tagging.
-            if not self._auto_monitor:
-                return
+            # and monitor_call() wasn't called). Skip tagging. A root span that
+            # sampled its call out also leaves the rest of the call untagged.
+            if not self._auto_monitor or is_call_unmonitored():
+                return None
             # For auto_monitor=True without a root span, create metadata
             meta = ensure_call_metadata()
-
-        span.set_attribute("voiceeval.call_id", meta.call_id)
-        span.set_attribute("gen_ai.system", "voiceeval")
-
-        if self._agent_name:
-            span.set_attribute("voiceeval.agent_name", self._agent_name)
+        return meta
 
     def on_end(self, span) -> None:
         """Reconcile monitoring state on root spans.
@@ -115,15 +155,20 @@ class CallIdSpanProcessor(SpanProcessor):
         BatchSpanProcessor queues it for export.
         """
         if span.name not in _ROOT_SPAN_NAMES:
+            if self._budget is not None:
+                self._charge_budget(span)
             return
 
-        has_call_id = span.attributes.get("voiceeval.call_id") is not None
+        attributes = span.attributes
+        call_id = attributes.get("voiceeval.call_id")
+        has_call_id = call_id is not None
+        remove_keys = ()
+        add_attrs = None
 
         if has_call_id and is_monitoring_skipped():
             # skip_call() was called after root span was tagged — strip attrs
-            self._update_span_attributes(span, remove_keys=(
-                "voiceeval.call_id", "voiceeval.agent_name", "gen_ai.system",
-            ))
+            remove_keys = ("voiceeval.call_id", "voiceeval.agent_name", "gen_ai.system")
+            has_call_id = False
         elif not has_call_id and not is_monitoring_skipped():
             # monitor_call() was called after root span was skipped — add attrs
             from voiceeval.context import get_call_metadata
@@ -135,7 +180,36 @@ class CallIdSpanProcessor(SpanProcessor):
                 }
                 if self._agent_name:
                     add_attrs["voiceeval.agent_name"] = self._agent_name
-                self._update_span_attributes(span, add_attrs=add_attrs)
+                has_call_id = True
+
+        # The call's detail level may also have been decided by the handler.
+        # With every level at "full" there is nothing to reconcile.
+        explicit = get_call_detail()
+        if explicit is not None or self._unmonitored_detail != "full":
+            detail = explicit or ("full" if has_call_id else self._unmonitored_detail)
+            current = attributes.get(_DETAIL_ATTRIBUTE)
+            if detail == "full":
+                if current is not None:
+                    remove_keys += (_DETAIL_ATTRIBUTE,)
+            elif current != detail:
+                add_attrs = dict(add_attrs or (), **{_DETAIL_ATTRIBUTE: detail})
+
+        if self._budget is not None and call_id is not None:
+            usage = self._budget.finish(call_id)
+            if usage is not None and usage.reason is not None and has_call_id:
+                add_attrs = dict(add_attrs or (), **usage.truncation_attributes())
+
+        if remove_keys or add_attrs:
+            self._update_span_attributes(span, remove_keys=remove_keys, add_attrs=add_attrs)
+
+    def _charge_budget(self, span) -> None:
+        """Count an ended span against its call's budget; withhold it if over."""
+        attributes = span.attributes
+        call_id = attributes.get("voiceeval.call_id")
+        if call_id is None or attributes.get(_DETAIL_ATTRIBUTE) == "metrics":
+            return
+        if not self._budget.end(call_id, span):
+            self._update_span_attributes(span, add_attrs={_DETAIL_ATTRIBUTE: "metrics"})
 
     @staticmethod
     def _update_span_attributes(span, remove_keys=(), add_attrs=None):
@@ -0,0 +1,223 @@
+"""
+Per-agent span routing for workers that host several agents.
+
+One ``Client`` can serve many agents (tenants), each with its own API key,
+ingestion endpoint, monitoring policy and export queue. The agent is chosen
+per execution context with ``agent_scope()`` / ``set_agent()``, so concurrent
+sessions in one process route independently.
+
+``ProfileRouter`` binds every span to a profile when it starts, tags it with
+that profile's ``CallIdSpanProcessor`` and, when it ends, queues it for that
+profile's exporter. All profiles share one export thread (and, via the
+Client, one HTTP connection pool), so adding an agent costs a queue and an
+exporter rather than a process.
+"""
+
+import collections
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.sdk.trace.export import SpanExporter
+
+from voiceeval.context import get_agent
+from voiceeval.observability.budget import CallBudget
+from voiceeval.observability.detail import SpanDurations, admit
+from voiceeval.observability.processor import _ROOT_SPAN_NAMES, CallIdSpanProcessor
+
+logger = logging.getLogger(__name__)
+
+# Private attribute naming the profile a span started on. on_end receives a
+# ReadableSpan snapshot, but it shares the live span's attribute mapping, so
+# the name is set there (as a Python attribute, never exported) rather than
+# kept in the router: a span that never ends leaves nothing behind.
+_PROFILE_ATTR = "_voiceeval_profile"
+
+
+@dataclass
+class AgentProfile:
+    """
+    Export and monitoring settings for one agent.
+
+    Attributes:
+        name: Agent identifier. Selected with ``agent_scope(name)`` and
+              attached to its spans as ``voiceeval.agent_name``.
+        api_key: Tenant API key; defaults to the Client's key.
+        base_url: Ingestion endpoint; defaults to the Client's.
+        auto_monitor: Monitor every call (see ``Client``).
+        sample_rate: Fraction of calls to monitor (see ``Client``).
+        unmonitored_detail: Detail level for unmonitored calls (see ``Client``).
+        call_budget: Per-call span, attribute and event limits (see ``Client``).
+        max_queue_size: Finished spans buffered for this profile; further
+                        spans are dropped until the queue drains.
+    """
+    name: str
+    api_key: Optional[str] = None
+    base_url: Optional[str] = None
+    auto_monitor: bool = True
+    sample_rate: float = 1.0
+    unmonitored_detail: str = "full"
+    call_budget: Optional[CallBudget] = None
+    max_queue_size: int = 2048
+
+
+class _Route:
+    __slots__ = ("profile", "tagger", "exporter", "queue", "dropped")
+
+    def __init__(self, profile: AgentProfile, exporter: SpanExporter):
+        self.profile = profile
+        self.tagger = CallIdSpanProcessor(
+            agent_name=profile.name,
+            auto_monitor=profile.auto_monitor,
+            sample_rate=profile.sample_rate,
+            unmonitored_detail=profile.unmonitored_detail,
+            call_budget=profile.call_budget,
+        )
+        self.exporter = exporter
+        self.queue: Deque[ReadableSpan] = collections.deque()
+        self.dropped = 0
+
+
+class ProfileRouter(SpanProcessor):
+    """
+    SpanProcessor that routes spans to per-agent exporters.
+
+    Replaces the ``CallIdSpanProcessor`` + ``BatchSpanProcessor`` pair when
+    the Client is configured with profiles. Spans started while no agent (or
+    an unknown one) is set go to the default profile.
+
+    Root spans (``job_entrypoint``) are re-routed when they end: LiveKit
+    starts them before the session handler can call ``set_agent()``, so the
+    agent chosen by then wins, as with ``skip_call()``. Only the export queue
+    changes; the call is still reconciled (and its budget finished) by the
+    profile that started the root span.
+
+    Args:
+        default: Name of the fallback profile; must be added before use.
+        schedule_delay_millis: Longest a span waits in a queue before export.
+        max_export_batch_size: Spans per export request; a full batch wakes
+                               the export thread early.
+        session: Shared ``requests.Session`` closed on shutdown, if any.
+        durations: Where durations of ``metrics``-detail spans are recorded.
+    """
+
+    def __init__(
+        self,
+        default: str,
+        schedule_delay_millis: float = 5000,
+        max_export_batch_size: int = 512,
+        session=None,
+        durations: Optional[SpanDurations] = None,
+    ):
+        self.default = default
+        self.durations = durations if durations is not None else SpanDurations()
+        self.schedule_delay = schedule_delay_millis / 1000.0
+        self.max_export_batch_size = max(1, max_export_batch_size)
+        self._session = session
+        # Replaced wholesale on add, so span callbacks read it without a lock.
+        self._routes: Dict[str, _Route] = {}
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._shutdown = False
+
+    @property
+    def profiles(self) -> List[AgentProfile]:
+        return [route.profile for route in self._routes.values()]
+
+    def dropped(self, name: str) -> int:
+        """Spans dropped for profile ``name`` because its queue was full."""
+        return self._routes[name].dropped
+
+    def add_profile(self, profile: AgentProfile, exporter: SpanExporter) -> None:
+        """Register ``profile``; its spans are exported with ``exporter``."""
+        with self._lock:
+            if profile.name in self._routes:
+                raise ValueError(f"Duplicate agent profile: {profile.name!r}")
+            self._routes = {**self._routes, profile.name: _Route(profile, exporter)}
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="VoiceEvalExport", daemon=True)
+                self._worker.start()
+
+    def _current_route(self) -> _Route:
+        routes = self._routes
+        route = routes.get(get_agent())
+        return route if route is not None else routes[self.default]
+
+    def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        route = self._current_route()
+        setattr(span._attributes, _PROFILE_ATTR, route.profile.name)
+        route.tagger.on_start(span, parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        routes = self._routes
+        route = routes.get(getattr(span._attributes, _PROFILE_ATTR, None)) or routes[self.default]
+        # The starting route's tagger holds the call's budget, so it finishes the call.
+        route.tagger.on_end(span)
+        if span.name in _ROOT_SPAN_NAMES:
+            current = self._current_route()
+            if current is not route:
+                route = current
+                if span.attributes.get("voiceeval.agent_name") is not None:
+                    CallIdSpanProcessor._update_span_attributes(
+                        span, add_attrs={"voiceeval.agent_name": route.profile.name}
+                    )
+
+        if not span.context.trace_flags.sampled or self._shutdown:
+            return
+        if not admit(span, self.durations):
+            return
+        if len(route.queue) >= route.profile.max_queue_size:
+            route.dropped += 1
+            return
+        route.queue.append(span)
+        if len(route.queue) >= self.max_export_batch_size:
+            with self._condition:
+                self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._shutdown:
+                    self._condition.wait(self.schedule_delay)
+                if self._shutdown:
+                    return
+            self._export_all()
+
+    def _export_all(self, deadline: Optional[float] = None) -> bool:
+        """Drain every queue in batches; False if ``deadline`` passed first."""
+        with self._export_lock:
+            for route in self._routes.values():
+                queue = route.queue
+                while queue:
+                    if deadline is not None and time.monotonic() > deadline:
+                        return False
+                    count = min(len(queue), self.max_export_batch_size)
+                    batch = [queue.popleft() for _ in range(count)]
+                    try:
+                        route.exporter.export(batch)
+                    except Exception:
+                        logger.exception(f"Exception while exporting spans for agent {route.profile.name!r}")
+        return True
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._export_all(time.monotonic() + timeout_millis / 1000.0)
+
+    def shutdown(self) -> None:
+        with self._condition:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            self._condition.notify()
+        if self._worker is not None:
+            self._worker.join()
+        self._export_all()
+        for route in self._routes.values():
+            route.exporter.shutdown()
+        if self._session is not None:
+            self._session.close()
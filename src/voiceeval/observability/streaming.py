@@ -0,0 +1,389 @@
+"""
+Timing for streaming LLM responses.
+
+Voice agents care about when the first token arrives and how evenly the rest
+follow. ``time_stream`` wraps a streaming response (OpenAI, Anthropic or
+Gemini, sync or async) and, when the stream ends, emits one ``<provider>.stream``
+span carrying a handful of attributes:
+
+* ``voiceeval.stream.ttft_ms`` — request start to first content chunk
+* ``voiceeval.stream.duration_ms`` — request start to end of stream
+* ``voiceeval.stream.chunks`` — content-bearing chunks received
+* ``voiceeval.stream.input_tokens`` / ``output_tokens`` — from provider usage, when reported
+* ``voiceeval.stream.itl_mean_ms`` / ``itl_max_ms`` / ``itl_p50_ms`` / ``itl_p95_ms``
+* ``voiceeval.stream.itl_histogram`` — inter-token latency counts in
+  power-of-two millisecond buckets: ``[<1, 1-2, 2-4, ..., >=16384]``
+
+Nothing is recorded per chunk beyond a few integer updates, so memory per
+stream is constant and the per-chunk cost stays well under a microsecond.
+
+``instrument_streaming()`` patches the installed provider clients so every
+``stream=True`` request is wrapped automatically; ``Client`` calls it during
+setup.
+"""
+
+import logging
+from functools import wraps
+from importlib import import_module
+from time import perf_counter_ns, time_ns
+from typing import Any, Callable, Dict, List, Optional
+
+from opentelemetry import context as otel_context
+from opentelemetry.trace import Status, StatusCode
+
+from voiceeval.observability import instrumentation
+
+logger = logging.getLogger(__name__)
+
+ATTRIBUTE_PREFIX = "voiceeval.stream."
+
+ITL_BUCKETS = 16
+
+# Inspectors decide whether a chunk carries generated content and pick up
+# usage counts. They run once per chunk, so they stick to plain attribute reads.
+Inspector = Callable[["StreamTimer", Any], bool]
+
+
+def _openai_chunk(timer: "StreamTimer", chunk: Any) -> bool:
+    choices = chunk.choices
+    if choices:
+        delta = choices[0].delta
+        if delta.content or delta.tool_calls:
+            return True
+    # Usage arrives on a final chunk with no choices (stream_options.include_usage).
+    usage = getattr(chunk, "usage", None)
+    if usage is not None:
+        timer.input_tokens = usage.prompt_tokens
+        timer.output_tokens = usage.completion_tokens
+    return False
+
+
+def _anthropic_event(timer: "StreamTimer", event: Any) -> bool:
+    kind = event.type
+    if kind == "content_block_delta":
+        return True
+    if kind == "message_start":
+        timer.input_tokens = event.message.usage.input_tokens
+    elif kind == "message_delta":
+        timer.output_tokens = event.usage.output_tokens
+    return False
+
+
+def _gemini_chunk(timer: "StreamTimer", chunk: Any) -> bool:
+    usage = getattr(chunk, "usage_metadata", None)
+    if usage is not None:
+        # Counts are cumulative; the last chunk holds the totals.
+        timer.input_tokens = getattr(usage, "prompt_token_count", None) or timer.input_tokens
+        timer.output_tokens = getattr(usage, "candidates_token_count", None) or timer.output_tokens
+    candidates = getattr(chunk, "candidates", None)
+    if not candidates:
+        return False
+    content = getattr(candidates[0], "content", None)
+    return bool(getattr(content, "parts", None))
+
+
+def _any_chunk(timer: "StreamTimer", chunk: Any) -> bool:
+    return True
+
+
+INSPECTORS: Dict[str, Inspector] = {
+    "openai": _openai_chunk,
+    "anthropic": _anthropic_event,
+    "gemini": _gemini_chunk,
+}
+
+
+class StreamTimer:
+    """
+    Constant-size timing state for one streamed response.
+
+    Args:
+        provider: Key into ``INSPECTORS``; also names the emitted span.
+                  Unknown providers count every chunk as content.
+        span_name: Overrides the ``<provider>.stream`` span name.
+    """
+
+    __slots__ = (
+        "provider", "span_name", "inspector", "context",
+        "started_ns", "wall_started_ns", "first_ns", "last_ns",
+        "chunks", "itl_total_ns", "itl_max_ns", "histogram",
+        "input_tokens", "output_tokens", "finished",
+    )
+
+    def __init__(self, provider: str, span_name: Optional[str] = None):
+        self.provider = provider
+        self.span_name = span_name or f"{provider}.stream"
+        self.inspector = INSPECTORS.get(provider, _any_chunk)
+        # The span is created when the stream ends; parent it where the request began.
+        self.context = otel_context.get_current()
+        self.wall_started_ns = time_ns()
+        self.started_ns = perf_counter_ns()
+        self.first_ns = 0
+        self.last_ns = 0
+        self.chunks = 0
+        self.itl_total_ns = 0
+        self.itl_max_ns = 0
+        self.histogram = [0] * ITL_BUCKETS
+        self.input_tokens: Optional[int] = None
+        self.output_tokens: Optional[int] = None
+        self.finished = False
+
+    def observe(self, chunk: Any) -> None:
+        """Record one chunk. This is the per-chunk hot path."""
+        if not self.inspector(self, chunk):
+            return
+        now = perf_counter_ns()
+        if self.chunks:
+            gap = now - self.last_ns
+            self.itl_total_ns += gap
+            if gap > self.itl_max_ns:
+                self.itl_max_ns = gap
+            bucket = (gap // 1_000_000).bit_length()
+            self.histogram[bucket if bucket < ITL_BUCKETS else ITL_BUCKETS - 1] += 1
+        else:
+            self.first_ns = now
+        self.last_ns = now
+        self.chunks += 1
+
+    def itl_percentile(self, q: float) -> float:
+        """Upper bound (ms) of the bucket holding quantile ``q``, capped at the max gap."""
+        gaps = self.chunks - 1
+        if gaps <= 0:
+            return 0.0
+        rank = q * (gaps - 1)
+        seen = 0
+        for index, count in enumerate(self.histogram):
+            seen += count
+            if seen > rank:
+                return min(float(1 << index), self.itl_max_ns / 1e6)
+        return self.itl_max_ns / 1e6
+
+    def attributes(self, end_ns: int) -> Dict[str, Any]:
+        attrs: Dict[str, Any] = {
+            "gen_ai.system": self.provider,
+            ATTRIBUTE_PREFIX + "duration_ms": (end_ns - self.started_ns) / 1e6,
+            ATTRIBUTE_PREFIX + "chunks": self.chunks,
+        }
+        if self.chunks:
+            attrs[ATTRIBUTE_PREFIX + "ttft_ms"] = (self.first_ns - self.started_ns) / 1e6
+        if self.chunks > 1:
+            gaps = self.chunks - 1
+            attrs[ATTRIBUTE_PREFIX + "itl_mean_ms"] = self.itl_total_ns / gaps / 1e6
+            attrs[ATTRIBUTE_PREFIX + "itl_max_ms"] = self.itl_max_ns / 1e6
+            attrs[ATTRIBUTE_PREFIX + "itl_p50_ms"] = self.itl_percentile(0.5)
+            attrs[ATTRIBUTE_PREFIX + "itl_p95_ms"] = self.itl_percentile(0.95)
+            attrs[ATTRIBUTE_PREFIX + "itl_histogram"] = list(self.histogram)
+        if self.input_tokens is not None:
+            attrs[ATTRIBUTE_PREFIX + "input_tokens"] = self.input_tokens
+        if self.output_tokens is not None:
+            attrs[ATTRIBUTE_PREFIX + "output_tokens"] = self.output_tokens
+        return attrs
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """Emit the stream span. Later calls are no-ops."""
+        if self.finished:
+            return
+        self.finished = True
+        end_ns = perf_counter_ns()
+        try:
+            span = instrumentation.tracer.start_span(
+                self.span_name,
+                context=self.context,
+                start_time=self.wall_started_ns,
+                attributes=self.attributes(end_ns),
+            )
+            if error is not None:
+                span.record_exception(error)
+                span.set_status(Status(StatusCode.ERROR))
+            span.end(end_time=self.wall_started_ns + (end_ns - self.started_ns))
+        except Exception as e:
+            logger.debug(f"Failed to record stream timing: {e}")
+
+
+class _StreamProxy:
+    """Forwards everything except iteration to the wrapped stream."""
+
+    def __init__(self, stream: Any, timer: StreamTimer):
+        self._stream = stream
+        self._timer = timer
+
+    @property
+    def timer(self) -> StreamTimer:
+        return self._timer
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+class TimedStream(_StreamProxy):
+    """Synchronous stream wrapper; see ``time_stream``."""
+
+    def __init__(self, stream: Any, timer: StreamTimer):
+        super().__init__(stream, timer)
+        self._chunks = self._iterate()
+
+    def _iterate(self):
+        # A generator is markedly cheaper per item than a Python-level __next__.
+        timer = self._timer
+        observe = timer.observe
+        try:
+            for chunk in self._stream:
+                observe(chunk)
+                yield chunk
+        except GeneratorExit:
+            raise
+        except BaseException as e:
+            timer.finish(e)
+            raise
+        finally:
+            timer.finish()
+
+    def __iter__(self):
+        return self._chunks
+
+    def __next__(self):
+        return next(self._chunks)
+
+    def close(self) -> None:
+        self._timer.finish()
+        self._chunks.close()
+        close = getattr(self._stream, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class AsyncTimedStream(_StreamProxy):
+    """Asynchronous stream wrapper; see ``time_stream``."""
+
+    def __init__(self, stream: Any, timer: StreamTimer):
+        super().__init__(stream, timer)
+        self._chunks = self._iterate()
+
+    async def _iterate(self):
+        timer = self._timer
+        observe = timer.observe
+        try:
+            async for chunk in self._stream:
+                observe(chunk)
+                yield chunk
+        except GeneratorExit:
+            raise
+        except BaseException as e:
+            timer.finish(e)
+            raise
+        finally:
+            timer.finish()
+
+    def __aiter__(self):
+        return self._chunks
+
+    async def __anext__(self):
+        return await self._chunks.__anext__()
+
+    async def close(self) -> None:
+        self._timer.finish()
+        await self._chunks.aclose()
+        close = getattr(self._stream, "close", None) or getattr(self._stream, "aclose", None)
+        if close is not None:
+            await close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+def time_stream(stream: Any, provider: str, timer: Optional[StreamTimer] = None):
+    """
+    Wrap a streaming response so its timing is recorded when it ends.
+
+    Args:
+        stream: A sync or async iterable of chunks/events.
+        provider: ``"openai"``, ``"anthropic"``, ``"gemini"`` or any other
+                  name (every chunk then counts as content).
+        timer: Pass a timer created before the request was sent so TTFT
+               includes request latency; by default timing starts now.
+
+    The span is emitted when the stream is exhausted, raises, or is closed.
+    A stream abandoned mid-way without ``close()`` records nothing.
+    """
+    timer = timer or StreamTimer(provider)
+    if hasattr(stream, "__aiter__"):
+        return AsyncTimedStream(stream, timer)
+    return TimedStream(stream, timer)
+
+
+# ---------------------------------------------------------------------------
+# Client patching
+# ---------------------------------------------------------------------------
+
+# (provider, module, class, method, is_async, always_streams)
+_TARGETS = [
+    ("openai", "openai.resources.chat.completions", "Completions", "create", False, False),
+    ("openai", "openai.resources.chat.completions", "AsyncCompletions", "create", True, False),
+    ("anthropic", "anthropic.resources.messages", "Messages", "create", False, False),
+    ("anthropic", "anthropic.resources.messages", "AsyncMessages", "create", True, False),
+    ("gemini", "google.generativeai.generative_models", "GenerativeModel", "generate_content", False, False),
+    ("gemini", "google.generativeai.generative_models", "GenerativeModel", "generate_content_async", True, False),
+    ("gemini", "google.genai.models", "Models", "generate_content_stream", False, True),
+    ("gemini", "google.genai.models", "AsyncModels", "generate_content_stream", True, True),
+]
+
+_PATCHED_FLAG = "_voiceeval_stream_timing"
+
+
+def patch_stream_method(owner: type, method: str, provider: str, is_async: bool, always_streams: bool = False) -> bool:
+    """
+    Wrap ``owner.method`` so streaming calls return timed streams.
+
+    Returns False if the method was already patched.
+    """
+    original = getattr(owner, method)
+    if getattr(original, _PATCHED_FLAG, False):
+        return False
+
+    if is_async:
+        @wraps(original)
+        async def wrapper(*args, **kwargs):
+            if not (always_streams or kwargs.get("stream")):
+                return await original(*args, **kwargs)
+            timer = StreamTimer(provider)
+            return time_stream(await original(*args, **kwargs), provider, timer)
+    else:
+        @wraps(original)
+        def wrapper(*args, **kwargs):
+            if not (always_streams or kwargs.get("stream")):
+                return original(*args, **kwargs)
+            timer = StreamTimer(provider)
+            return time_stream(original(*args, **kwargs), provider, timer)
+
+    setattr(wrapper, _PATCHED_FLAG, True)
+    setattr(owner, method, wrapper)
+    return True
+
+
+def instrument_streaming() -> List[str]:
+    """
+    Patch every installed provider client for stream timing.
+
+    Returns the ``Class.method`` names that were patched by this call.
+    """
+    patched = []
+    for provider, module_name, class_name, method, is_async, always_streams in _TARGETS:
+        try:
+            owner = getattr(import_module(module_name), class_name)
+        except (ImportError, AttributeError):
+            continue
+        try:
+            if patch_stream_method(owner, method, provider, is_async, always_streams):
+                patched.append(f"{class_name}.{method}")
+        except Exception as e:
+            logger.debug(f"Could not patch {module_name}.{class_name}.{method} for stream timing: {e}")
+    return patched
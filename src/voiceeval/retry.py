@@ -0,0 +1,99 @@
+"""
+Retry and rate-limit helpers shared by the batched model clients
+(transcription, LLM judges).
+
+``retry_async`` retries with jittered exponential backoff and honours a
+server-provided ``retry_after`` on ``RateLimitError``. ``RateLimiter`` spaces
+requests to a requests-per-minute budget and lets any worker push the whole
+pool back after a 429, so concurrent workers don't keep hammering a
+throttled endpoint.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Optional, Tuple, Type, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class RateLimitError(Exception):
+    """
+    Raised by backends when the provider throttles a request.
+
+    Args:
+        retry_after: Seconds the provider asked us to wait, if it said.
+    """
+
+    def __init__(self, message: str = "Rate limited", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RateLimiter:
+    """
+    Async limiter spacing request starts to ``requests_per_minute``.
+
+    Args:
+        requests_per_minute: Sustained request budget; None disables spacing
+                             (``penalize`` still applies).
+        burst: Requests allowed back-to-back before spacing kicks in.
+    """
+
+    def __init__(self, requests_per_minute: Optional[float] = None, burst: int = 1):
+        self.interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+        self.burst = max(1, burst)
+        self._next = 0.0
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until the next request may start."""
+        async with self._lock:
+            now = time.monotonic()
+            # Allow up to ``burst`` requests of credit to accumulate while idle.
+            start = max(self._next, now - self.interval * (self.burst - 1), self._paused_until)
+            self._next = start + self.interval
+        delay = start - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def penalize(self, seconds: float) -> None:
+        """Hold every request for ``seconds`` (e.g. after a 429)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+async def retry_async(
+    fn: Callable[[], Awaitable[T]],
+    max_retries: int = 3,
+    backoff: float = 0.5,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    limiter: Optional[RateLimiter] = None,
+) -> T:
+    """
+    Await ``fn()``, retrying up to ``max_retries`` times with jittered exponential backoff.
+
+    A ``RateLimitError`` with ``retry_after`` waits that long instead, and
+    also pauses ``limiter`` so other workers back off too.
+    """
+    attempt = 0
+    while True:
+        if limiter is not None:
+            await limiter.acquire()
+        try:
+            return await fn()
+        except retry_on as e:
+            if attempt >= max_retries:
+                raise
+            delay = backoff * (2 ** attempt) * (0.5 + random.random())
+            retry_after = getattr(e, "retry_after", None)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+                if limiter is not None:
+                    limiter.penalize(retry_after)
+            logger.debug(f"Retrying after {type(e).__name__}: {e} (attempt {attempt + 1}, sleeping {delay:.2f}s)")
+            attempt += 1
+            await asyncio.sleep(delay)
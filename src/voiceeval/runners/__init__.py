@@ -1,4 +1,37 @@
-from voiceeval.runners.offline import OfflineRunner
-from voiceeval.runners.simulator import Simulator
+from typing import TYPE_CHECKING
 
-__all__ = ["OfflineRunner", "Simulator"]
+from voiceeval._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from voiceeval.runners.offline import OfflineRunner
+    from voiceeval.runners.simulator import (
+        CallResult,
+        HTTPTransport,
+        InProcessTransport,
+        SimulationReport,
+        Simulator,
+        Transport,
+        WebSocketTransport,
+    )
+
+__all__ = [
+    "OfflineRunner",
+    "Simulator",
+    "SimulationReport",
+    "CallResult",
+    "Transport",
+    "InProcessTransport",
+    "HTTPTransport",
+    "WebSocketTransport",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "OfflineRunner": "voiceeval.runners.offline",
+    "Simulator": "voiceeval.runners.simulator",
+    "SimulationReport": "voiceeval.runners.simulator",
+    "CallResult": "voiceeval.runners.simulator",
+    "Transport": "voiceeval.runners.simulator",
+    "InProcessTransport": "voiceeval.runners.simulator",
+    "HTTPTransport": "voiceeval.runners.simulator",
+    "WebSocketTransport": "voiceeval.runners.simulator",
+})
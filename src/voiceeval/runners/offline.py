@@ -1,16 +1,89 @@
-from typing import List
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Sequence, Tuple
 from voiceeval.models import Call
 from voiceeval.metrics import BaseMetric
 
+if TYPE_CHECKING:
+    from voiceeval.search import TranscriptIndex
+    from voiceeval.store import CallStore
+
 class OfflineRunner:
     """
     Runs metrics on past call logs.
+
+    Args:
+        metrics: Metrics to evaluate.
+        batch_size: Calls handed to each metric's ``evaluate_many`` at once by
+                    ``run_stream``; model-judged metrics use this to pack and
+                    parallelise requests.
     """
-    def __init__(self, metrics: List[BaseMetric]):
+    def __init__(self, metrics: List[BaseMetric], batch_size: int = 64):
         self.metrics = metrics
+        self.batch_size = max(1, batch_size)
 
     def run(self, call: Call) -> dict:
         results = {}
         for metric in self.metrics:
             results[metric.name] = metric.evaluate(call)
         return results
+
+    def run_many(self, calls: Sequence[Call]) -> List[dict]:
+        """Evaluate a batch of calls; returns one results dict per call, in order."""
+        results: List[dict] = [{} for _ in calls]
+        for metric in self.metrics:
+            for row, value in zip(results, metric.evaluate_many(calls)):
+                row[metric.name] = value
+        return results
+
+    def run_stream(self, calls: Iterable[Call]) -> Iterator[Tuple[Call, dict]]:
+        """
+        Lazily evaluate a stream of calls, e.g. from ``voiceeval.codecs.iter_calls``.
+
+        Yields ``(call, results)`` pairs. Calls are evaluated ``batch_size`` at
+        a time, so at most one batch is held in memory.
+        """
+        iterator = iter(calls)
+        while True:
+            batch = list(islice(iterator, self.batch_size))
+            if not batch:
+                return
+            yield from zip(batch, self.run_many(batch))
+
+    def run_incremental(self, store: "CallStore", consumer: str = "offline") -> int:
+        """
+        Evaluate only the calls added to ``store`` since this consumer's last run.
+
+        Results are written back to the store and the watermark advances after
+        every batch, so an interrupted run resumes where it stopped.
+
+        Returns:
+            The number of calls evaluated.
+        """
+        evaluated = 0
+        for batch in store.iter_since(store.get_watermark(consumer)):
+            calls = [call for _, call in batch]
+            store.save_many_results((call.call_id, results) for call, results in zip(calls, self.run_many(calls)))
+            store.set_watermark(consumer, batch[-1][0])
+            evaluated += len(batch)
+        return evaluated
+
+    def run_search(
+        self,
+        store: "CallStore",
+        index: "TranscriptIndex",
+        query: str,
+        speaker: Optional[str] = None,
+    ) -> Iterator[Tuple[Call, dict]]:
+        """
+        Evaluate only the calls whose transcripts match ``query``.
+
+        Matching call ids come from ``index`` (see ``voiceeval.search``);
+        only those calls are decoded from ``store``, ``batch_size`` at a time.
+
+        Args:
+            store: Where the calls are stored.
+            index: Transcript index over the same calls.
+            query: Search query, e.g. ``'"cancel my order" AND NOT refund'``.
+            speaker: Only match text spoken by this speaker.
+        """
+        return self.run_stream(store.get_calls(index.search_ids(query, speaker=speaker)))
@@ -1,6 +1,328 @@
+"""
+Load-generating call simulator.
+
+``Simulator`` drives many scripted conversations against an agent at once
+over a pluggable ``Transport``:
+
+* ``HTTPTransport`` — one JSON POST per turn (pooled ``httpx.AsyncClient``),
+* ``WebSocketTransport`` — one socket per call (needs ``websockets``),
+* ``InProcessTransport`` — calls a Python function directly; used in tests
+  and to measure the SDK's own overhead without network noise.
+
+Workers ramp up linearly over ``ramp_up`` seconds and pause ``think_time``
+between turns. Every turn's response latency goes into a ``LatencyHistogram``
+and the ``SimulationReport`` gives p50/p95/p99, throughput and error rates.
+
+Each simulated call gets its own ``voiceeval.call_id``: it is set as the
+``CallMetadata`` of the call's task (so in-process agents and their spans
+inherit it) and sent to remote agents in the ``X-VoiceEval-Call-Id`` header /
+``call_id`` field, so report entries link straight to traces.
+"""
+
+import asyncio
+import inspect
+import json
+import random
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from voiceeval.context import CallMetadata, set_call_metadata
+from voiceeval.histogram import LatencyHistogram
+
+CALL_ID_HEADER = "X-VoiceEval-Call-Id"
+
+ThinkTime = Union[float, Tuple[float, float]]
+
+
+# ---------------------------------------------------------------------------
+# Transports
+# ---------------------------------------------------------------------------
+
+class Transport(ABC):
+    """Carries one simulated caller's turns to the agent."""
+
+    async def start(self) -> None:
+        """Called once before the simulation (open pools, etc.)."""
+
+    async def stop(self) -> None:
+        """Called once after the simulation."""
+
+    async def open_call(self, call_id: str) -> None:
+        """Called when a simulated call begins."""
+
+    async def close_call(self, call_id: str) -> None:
+        """Called when a simulated call ends, successfully or not."""
+
+    @abstractmethod
+    async def send(self, call_id: str, message: str) -> str:
+        """Send one user turn and return the agent's reply."""
+        pass
+
+
+class InProcessTransport(Transport):
+    """
+    Calls an in-process agent function ``agent(call_id, message) -> reply``.
+
+    The function may be sync or async. It runs inside the simulated call's
+    task, so ``get_call_id()`` returns the simulated call's id.
+    """
+
+    def __init__(self, agent: Callable[[str, str], Union[str, Awaitable[str]]]):
+        self.agent = agent
+
+    async def send(self, call_id: str, message: str) -> str:
+        reply = self.agent(call_id, message)
+        if inspect.isawaitable(reply):
+            reply = await reply
+        return reply
+
+
+class HTTPTransport(Transport):
+    """
+    POSTs ``{"call_id", "message"}`` to ``url`` and reads ``reply`` (or the
+    raw body) from the response. All calls share one connection pool.
+    """
+
+    def __init__(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 30.0, max_connections: int = 256):
+        self.url = url
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._client = None
+
+    async def start(self) -> None:
+        import httpx
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+        )
+
+    async def stop(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def send(self, call_id: str, message: str) -> str:
+        response = await self._client.post(
+            self.url,
+            json={"call_id": call_id, "message": message},
+            headers={**self.headers, CALL_ID_HEADER: call_id},
+        )
+        response.raise_for_status()
+        try:
+            body = response.json()
+        except ValueError:
+            return response.text
+        return body.get("reply", "") if isinstance(body, dict) else str(body)
+
+
+class WebSocketTransport(Transport):
+    """
+    One WebSocket per call to ``url`` (``?call_id=...`` appended); each turn
+    sends ``{"message"}`` and waits for the next text frame as the reply.
+    Requires ``pip install websockets``.
+    """
+
+    def __init__(self, url: str, headers: Optional[Dict[str, str]] = None):
+        self.url = url
+        self.headers = dict(headers or {})
+        self._sockets: Dict[str, Any] = {}
+
+    async def open_call(self, call_id: str) -> None:
+        try:
+            import websockets
+        except ImportError as e:
+            raise ImportError("WebSocketTransport requires websockets. Install with: pip install websockets") from e
+        separator = "&" if "?" in self.url else "?"
+        self._sockets[call_id] = await websockets.connect(
+            f"{self.url}{separator}call_id={call_id}",
+            additional_headers={**self.headers, CALL_ID_HEADER: call_id},
+        )
+
+    async def close_call(self, call_id: str) -> None:
+        socket = self._sockets.pop(call_id, None)
+        if socket is not None:
+            await socket.close()
+
+    async def send(self, call_id: str, message: str) -> str:
+        socket = self._sockets[call_id]
+        await socket.send(json.dumps({"call_id": call_id, "message": message}))
+        reply = await socket.recv()
+        try:
+            body = json.loads(reply)
+        except ValueError:
+            return reply
+        return body.get("reply", "") if isinstance(body, dict) else str(body)
+
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+
+@dataclass
+class CallResult:
+    """Outcome of one simulated call."""
+    call_id: str
+    turns: int = 0
+    duration: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class SimulationReport:
+    """Aggregate results of a simulation run."""
+    calls: List[CallResult] = field(default_factory=list)
+    turn_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    turn_errors: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+
+    @property
+    def calls_completed(self) -> int:
+        return sum(1 for call in self.calls if call.error is None)
+
+    @property
+    def calls_failed(self) -> int:
+        return len(self.calls) - self.calls_completed
+
+    @property
+    def turns(self) -> int:
+        return self.turn_latency.count
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of attempted turns that failed."""
+        attempted = self.turns + self.turn_errors
+        return self.turn_errors / attempted if attempted else 0.0
+
+    @property
+    def turns_per_second(self) -> float:
+        return self.turns / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def calls_per_second(self) -> float:
+        return len(self.calls) / self.wall_seconds if self.wall_seconds else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "calls": len(self.calls),
+            "calls_completed": self.calls_completed,
+            "calls_failed": self.calls_failed,
+            "turns": self.turns,
+            "error_rate": self.error_rate,
+            "turns_per_second": self.turns_per_second,
+            "calls_per_second": self.calls_per_second,
+            "wall_seconds": self.wall_seconds,
+            "latency": self.turn_latency.summary(),
+            "errors": dict(self.errors),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Simulator
+# ---------------------------------------------------------------------------
+
 class Simulator:
     """
     Simulates a user calling the voice agent.
+
+    Args:
+        transport: How turns reach the agent. Defaults to ``HTTPTransport``
+                   for the endpoint passed to ``run_simulation``.
+        scripts: Conversations to play; each is a list of user turns. Calls
+                 cycle through them.
+        concurrency: Simultaneous calls.
+        total_calls: Calls to run in total; defaults to ``concurrency``.
+        ramp_up: Seconds over which workers start, evenly spaced.
+        think_time: Pause between turns, fixed or a ``(min, max)`` range.
+        turn_timeout: Seconds before a turn counts as failed.
+        seed: Seed for think-time jitter.
     """
-    def run_simulation(self, agent_endpoint: str) -> None:
-        pass
+    def __init__(
+        self,
+        transport: Optional[Transport] = None,
+        scripts: Optional[Sequence[Sequence[str]]] = None,
+        concurrency: int = 1,
+        total_calls: Optional[int] = None,
+        ramp_up: float = 0.0,
+        think_time: ThinkTime = 0.0,
+        turn_timeout: float = 30.0,
+        seed: Optional[int] = None,
+    ):
+        self.transport = transport
+        self.scripts = [list(s) for s in scripts] if scripts else [["Hello?"]]
+        self.concurrency = max(1, concurrency)
+        self.total_calls = total_calls if total_calls is not None else self.concurrency
+        self.ramp_up = ramp_up
+        self.think_time = think_time
+        self.turn_timeout = turn_timeout
+        self._random = random.Random(seed)
+
+    def run_simulation(self, agent_endpoint: str) -> SimulationReport:
+        """Run the simulation against an HTTP endpoint (blocking)."""
+        transport = self.transport or HTTPTransport(agent_endpoint, timeout=self.turn_timeout)
+        return asyncio.run(self.run(transport))
+
+    async def run(self, transport: Optional[Transport] = None) -> SimulationReport:
+        transport = transport or self.transport
+        if transport is None:
+            raise ValueError("A transport is required (or use run_simulation(agent_endpoint))")
+
+        report = SimulationReport()
+        next_call = iter(range(self.total_calls))
+        workers = min(self.concurrency, self.total_calls)
+
+        async def worker(index: int) -> None:
+            if self.ramp_up and workers > 1:
+                await asyncio.sleep(self.ramp_up * index / workers)
+            for call_index in next_call:
+                script = self.scripts[call_index % len(self.scripts)]
+                # Each call runs in its own task so it gets a fresh context.
+                report.calls.append(await asyncio.ensure_future(self._call(transport, script, report)))
+
+        await transport.start()
+        started = time.perf_counter()
+        try:
+            await asyncio.gather(*(worker(i) for i in range(workers)))
+        finally:
+            report.wall_seconds = time.perf_counter() - started
+            await transport.stop()
+        return report
+
+    def _think(self) -> float:
+        if isinstance(self.think_time, tuple):
+            return self._random.uniform(*self.think_time)
+        return self.think_time
+
+    def _record_error(self, report: SimulationReport, error: BaseException) -> str:
+        name = type(error).__name__
+        report.errors[name] = report.errors.get(name, 0) + 1
+        return f"{name}: {error}"
+
+    async def _call(self, transport: Transport, script: Sequence[str], report: SimulationReport) -> CallResult:
+        meta = CallMetadata()
+        set_call_metadata(meta)
+        result = CallResult(call_id=meta.call_id)
+        started = time.perf_counter()
+        try:
+            await transport.open_call(meta.call_id)
+            try:
+                for turn, message in enumerate(script):
+                    if turn and self.think_time:
+                        await asyncio.sleep(self._think())
+                    sent = time.perf_counter()
+                    try:
+                        await asyncio.wait_for(transport.send(meta.call_id, message), self.turn_timeout)
+                    except Exception:
+                        report.turn_errors += 1
+                        raise
+                    report.turn_latency.record(time.perf_counter() - sent)
+                    result.turns += 1
+            finally:
+                await transport.close_call(meta.call_id)
+        except Exception as e:
+            result.error = self._record_error(report, e)
+        result.duration = time.perf_counter() - started
+        return result
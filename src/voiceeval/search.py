@@ -0,0 +1,638 @@
+"""
+On-disk inverted index over transcript text.
+
+Finds the calls (and transcript segments) that mention a phrase without
+decoding a single ``Call``::
+
+    from voiceeval.search import TranscriptIndex
+
+    with TranscriptIndex("calls.index") as index:
+        index.add_calls(iter_calls("calls.vecall", trusted=True))
+        for hit in index.search('"cancel my order" AND NOT refund', speaker="user"):
+            print(hit.call_id, [(s.start_ms, s.end_ms) for s in hit.segments])
+
+The index is a directory of immutable, memory-mapped segment files plus a
+``manifest.json`` naming them. ``add_calls`` writes one new segment file per
+batch, so updates never rewrite existing data. A call re-added later replaces
+its earlier postings, and ``remove_calls`` hides calls. ``compact`` merges
+every file into one.
+
+Text is lower-cased and split into word tokens. Each posting records the
+transcript segment and the token position, so phrases match consecutive
+words within one segment. Query syntax:
+
+* ``cancel order``: both terms anywhere in the call (implicit ``AND``).
+* ``"cancel my order"``: a phrase.
+* ``refund*``: a prefix.
+* ``AND``, ``OR``, ``NOT`` and parentheses, e.g.
+  ``("talk to a human" OR "transfer me") AND NOT resolved``.
+"""
+
+import bisect
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from voiceeval.codecs import CodecError, PathLike
+from voiceeval.models import Call
+
+if TYPE_CHECKING:
+    from voiceeval.store import CallStore
+
+INDEX_MAGIC = b"VEIDX\x00\x01\x00"
+MANIFEST = "manifest.json"
+
+_TOKEN = re.compile(r"\w+(?:'\w+)*")
+_QUERY_TOKEN = re.compile(r'"[^"]*"|\(|\)|[^\s()"]+')
+_SECTION = struct.Struct("<QQ")
+_NO_END = -1  # seg_end value for segments without end_timestamp
+
+_DELETED = 1  # doc flag
+
+# (name, array typecode) in file order. Blobs are raw UTF-8.
+_SECTIONS = (
+    ("doc_ids", "B"), ("doc_id_offsets", "I"), ("doc_flags", "B"), ("doc_segments", "I"),
+    ("speakers", "B"), ("speaker_offsets", "I"),
+    ("seg_speaker", "I"), ("seg_index", "I"), ("seg_start", "q"), ("seg_end", "q"),
+    ("terms", "B"), ("term_offsets", "I"), ("term_postings", "I"),
+    ("pairs", "I"),
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased word tokens of ``text``; apostrophes stay inside words ("don't")."""
+    return _TOKEN.findall(text.lower().replace("’", "'"))
+
+
+@dataclass
+class SegmentHit:
+    """A matching transcript segment."""
+    segment: int  # index into ``transcript.segments``
+    speaker: str
+    start_ms: int
+    end_ms: Optional[int]
+
+
+@dataclass
+class SearchHit:
+    """A matching call and the segments that matched its positive terms."""
+    call_id: str
+    segments: List[SegmentHit] = field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Segment files
+# ---------------------------------------------------------------------------
+
+def _ms(seconds: float) -> int:
+    return int(round(seconds * 1000))
+
+
+def _blob(strings: Sequence[str]) -> Tuple[bytes, array]:
+    """Concatenated UTF-8 strings and their ``len + 1`` offsets."""
+    offsets = array("I", [0])
+    parts = []
+    for value in strings:
+        raw = value.encode("utf-8")
+        parts.append(raw)
+        offsets.append(offsets[-1] + len(raw))
+    return b"".join(parts), offsets
+
+
+class _Doc:
+    """One call to be written: its id, deleted flag and tokenized segments."""
+    __slots__ = ("call_id", "deleted", "segments")
+
+    def __init__(self, call_id: str, deleted: bool = False, segments=()):
+        self.call_id = call_id
+        self.deleted = deleted
+        # (speaker, index, start_ms, end_ms, tokens)
+        self.segments: List[Tuple[str, int, int, int, List[str]]] = list(segments)
+
+    @classmethod
+    def from_call(cls, call: Call) -> "_Doc":
+        segments = []
+        if call.transcript is not None:
+            for i, seg in enumerate(call.transcript.segments):
+                end = _ms(seg.end_timestamp) if seg.end_timestamp is not None else _NO_END
+                segments.append((seg.speaker, i, _ms(seg.timestamp), end, tokenize(seg.text)))
+        return cls(call.call_id, segments=segments)
+
+
+def _write_segment_file(path: str, docs: Sequence[_Doc], postings: Optional[Dict[bytes, List[int]]] = None) -> None:
+    """
+    Write ``docs`` as an immutable segment file.
+
+    ``postings`` maps UTF-8 terms to flat ``[seg, pos, ...]`` lists; when
+    omitted it is built from the docs' tokens.
+    """
+    speakers: Dict[str, int] = {}
+    doc_segments = array("I", [0])
+    seg_speaker, seg_index = array("I"), array("I")
+    seg_start, seg_end = array("q"), array("q")
+    build = postings is None
+    postings = {} if postings is None else postings
+    for doc in docs:
+        for speaker, index, start_ms, end_ms, tokens in doc.segments:
+            seg = len(seg_index)
+            seg_speaker.append(speakers.setdefault(speaker, len(speakers)))
+            seg_index.append(index)
+            seg_start.append(start_ms)
+            seg_end.append(end_ms)
+            if build:
+                for pos, token in enumerate(tokens):
+                    entry = postings.get(token)
+                    if entry is None:
+                        entry = postings[token] = []
+                    entry += (seg, pos)
+        doc_segments.append(len(seg_index))
+
+    if build:
+        postings = {term.encode("utf-8"): entry for term, entry in postings.items()}
+    terms = sorted(postings)
+    term_offsets, term_postings = array("I", [0]), array("I", [0])
+    flat = array("I")
+    for term in terms:
+        flat.extend(postings[term])
+        term_offsets.append(term_offsets[-1] + len(term))
+        term_postings.append(len(flat) // 2)
+
+    doc_ids, doc_id_offsets = _blob([doc.call_id for doc in docs])
+    speaker_blob, speaker_offsets = _blob(list(speakers))
+    sections = {
+        "doc_ids": doc_ids, "doc_id_offsets": doc_id_offsets,
+        "doc_flags": bytes(_DELETED if doc.deleted else 0 for doc in docs), "doc_segments": doc_segments,
+        "speakers": speaker_blob, "speaker_offsets": speaker_offsets,
+        "seg_speaker": seg_speaker, "seg_index": seg_index, "seg_start": seg_start, "seg_end": seg_end,
+        "terms": b"".join(terms), "term_offsets": term_offsets, "term_postings": term_postings,
+        "pairs": flat,
+    }
+
+    # Sections are little-endian regardless of platform.
+    header_size = len(INDEX_MAGIC) + _SECTION.size * len(_SECTIONS)
+    header = bytearray(INDEX_MAGIC)
+    body = bytearray()
+    for name, _ in _SECTIONS:
+        data = sections[name]
+        if isinstance(data, array):
+            if sys.byteorder != "little":
+                data = array(data.typecode, data)
+                data.byteswap()
+            data = data.tobytes()
+        body += b"\0" * (-(header_size + len(body)) % 8)  # 8-byte align every section
+        header += _SECTION.pack(header_size + len(body), len(data))
+        body += data
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(body)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class _SegmentFile:
+    """Read-only, memory-mapped view of one segment file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise CodecError(f"{path} is empty; not a transcript index segment")
+        if self._mm[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+            self.close()
+            raise CodecError(f"{path} is not a transcript index segment")
+        view = memoryview(self._mm)
+        pos = len(INDEX_MAGIC)
+        self._views: List[memoryview] = [view]
+        for name, typecode in _SECTIONS:
+            offset, length = _SECTION.unpack_from(self._mm, pos)
+            pos += _SECTION.size
+            section = view[offset:offset + length]
+            if typecode != "B":
+                if sys.byteorder != "little":
+                    swapped = array(typecode, section.tobytes())
+                    swapped.byteswap()
+                    section = memoryview(swapped)
+                else:
+                    section = section.cast(typecode)
+            self._views.append(section)
+            setattr(self, name, section)
+        n_docs = len(self.doc_flags)
+        self.call_ids = [self._string(self.doc_ids, self.doc_id_offsets, i) for i in range(n_docs)]
+        self.speaker_names = [self._string(self.speakers, self.speaker_offsets, i) for i in range(len(self.speaker_offsets) - 1)]
+        # Local doc numbers superseded by a newer file (or deleted).
+        self.dead: Set[int] = {i for i in range(n_docs) if self.doc_flags[i] & _DELETED}
+
+    @staticmethod
+    def _string(blob: memoryview, offsets: memoryview, i: int) -> str:
+        return bytes(blob[offsets[i]:offsets[i + 1]]).decode("utf-8")
+
+    def close(self) -> None:
+        for view in reversed(getattr(self, "_views", ())):
+            view.release()
+        self._mm.close()
+        self._file.close()
+
+    @property
+    def n_terms(self) -> int:
+        return len(self.term_offsets) - 1
+
+    def term(self, i: int) -> bytes:
+        return bytes(self.terms[self.term_offsets[i]:self.term_offsets[i + 1]])
+
+    def _lower_bound(self, key: bytes) -> int:
+        lo, hi = 0, self.n_terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.term(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def term_range(self, key: bytes, prefix: bool = False) -> range:
+        """Term numbers equal to (or starting with) ``key``."""
+        start = self._lower_bound(key)
+        if not prefix:
+            return range(start, start + 1) if start < self.n_terms and self.term(start) == key else range(0)
+        end = start
+        while end < self.n_terms and self.term(end).startswith(key):
+            end += 1
+        return range(start, end)
+
+    def postings(self, term: int) -> memoryview:
+        """Flat ``[seg, pos, seg, pos, ...]`` for term number ``term``."""
+        return self.pairs[2 * self.term_postings[term]:2 * self.term_postings[term + 1]]
+
+    def doc_of(self, seg: int) -> int:
+        return bisect.bisect_right(self.doc_segments, seg) - 1
+
+    def hit(self, seg: int) -> SegmentHit:
+        end = self.seg_end[seg]
+        return SegmentHit(
+            segment=self.seg_index[seg],
+            speaker=self.speaker_names[self.seg_speaker[seg]],
+            start_ms=self.seg_start[seg],
+            end_ms=None if end == _NO_END else end,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _Term:
+    tokens: List[str]
+    prefix: bool = False
+
+
+@dataclass
+class _Op:
+    op: str  # "and" | "or" | "not"
+    args: List[Union["_Op", _Term]]
+
+
+def parse_query(query: str) -> Union[_Op, _Term]:
+    """Parse the query syntax described in the module docstring."""
+    tokens = _QUERY_TOKEN.findall(query)
+    pos = 0
+
+    def peek() -> Optional[str]:
+        return tokens[pos] if pos < len(tokens) else None
+
+    def take() -> str:
+        nonlocal pos
+        pos += 1
+        return tokens[pos - 1]
+
+    def parse_or():
+        args = [parse_and()]
+        while peek() == "OR":
+            take()
+            args.append(parse_and())
+        return args[0] if len(args) == 1 else _Op("or", args)
+
+    def parse_and():
+        args = [parse_not()]
+        while peek() not in (None, ")", "OR"):
+            if peek() == "AND":
+                take()
+            args.append(parse_not())
+        return args[0] if len(args) == 1 else _Op("and", args)
+
+    def parse_not():
+        if peek() == "NOT":
+            take()
+            return _Op("not", [parse_not()])
+        return parse_atom()
+
+    def parse_atom():
+        token = peek()
+        if token is None or token in (")", "AND", "OR"):
+            raise ValueError(f"Expected a term at position {pos} of query {query!r}")
+        take()
+        if token == "(":
+            node = parse_or()
+            if peek() != ")":
+                raise ValueError(f"Unbalanced parentheses in query {query!r}")
+            take()
+            return node
+        if token.startswith('"'):
+            words = tokenize(token.strip('"'))
+            if not words:
+                raise ValueError(f"Empty phrase in query {query!r}")
+            return _Term(words)
+        prefix = token.endswith("*")
+        words = tokenize(token.rstrip("*"))
+        if not words:
+            raise ValueError(f"Term {token!r} has no searchable words")
+        return _Term(words, prefix=prefix and len(words) == 1)
+
+    if not tokens:
+        raise ValueError("Empty query")
+    node = parse_or()
+    if pos != len(tokens):
+        raise ValueError(f"Unexpected {tokens[pos]!r} in query {query!r}")
+    return node
+
+
+# {(file number, local doc): set of local segment numbers that matched}
+_Matches = Dict[Tuple[int, int], Set[int]]
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+class TranscriptIndex:
+    """
+    Incrementally updatable, memory-mapped inverted index of transcripts.
+
+    Args:
+        path: Index directory; created if missing.
+        batch_size: Calls per segment file written by ``add_calls``.
+    """
+
+    def __init__(self, path: PathLike, batch_size: int = 10000):
+        self.path = os.fspath(path)
+        self.batch_size = max(1, batch_size)
+        os.makedirs(self.path, exist_ok=True)
+        self._files: List[_SegmentFile] = []
+        self._next = 0
+        # call_id -> (file number, local doc) of its current version.
+        self._live: Dict[str, Tuple[int, int]] = {}
+        manifest = os.path.join(self.path, MANIFEST)
+        if os.path.exists(manifest):
+            with open(manifest) as f:
+                data = json.load(f)
+            self._next = data["next"]
+            for name in data["segments"]:
+                self._open(name)
+
+    def __enter__(self) -> "TranscriptIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for segment in self._files:
+            segment.close()
+        self._files = []
+
+    def __len__(self) -> int:
+        """Number of indexed (not removed) calls."""
+        return sum(1 for n, doc in self._live.values() if doc not in self._files[n].dead)
+
+    def __contains__(self, call_id: str) -> bool:
+        located = self._live.get(call_id)
+        return located is not None and located[1] not in self._files[located[0]].dead
+
+    # -----------------------------------------------------------------------
+    # Writes
+    # -----------------------------------------------------------------------
+
+    def _open(self, name: str) -> None:
+        segment = _SegmentFile(os.path.join(self.path, name))
+        number = len(self._files)
+        self._files.append(segment)
+        for doc, call_id in enumerate(segment.call_ids):
+            previous = self._live.get(call_id)
+            if previous is not None:
+                self._files[previous[0]].dead.add(previous[1])
+            self._live[call_id] = (number, doc)
+
+    def _save_manifest(self) -> None:
+        data = {"version": 1, "next": self._next, "segments": [os.path.basename(s.path) for s in self._files]}
+        path = os.path.join(self.path, MANIFEST)
+        with open(path + ".tmp", "w") as f:
+            json.dump(data, f)
+        os.replace(path + ".tmp", path)
+
+    def _append(self, docs: List[_Doc], postings: Optional[Dict[bytes, List[int]]] = None) -> str:
+        name = f"segment-{self._next:06d}.vidx"
+        self._next += 1
+        _write_segment_file(os.path.join(self.path, name), docs, postings)
+        self._open(name)
+        self._save_manifest()
+        return name
+
+    def add_calls(self, calls: Iterable[Call]) -> int:
+        """
+        Index calls, replacing earlier versions of the same call_ids.
+
+        Calls are consumed lazily and written ``batch_size`` per segment file.
+
+        Returns:
+            The number of calls indexed.
+        """
+        count = 0
+        batch: List[_Doc] = []
+        for call in calls:
+            batch.append(_Doc.from_call(call))
+            if len(batch) >= self.batch_size:
+                count += len(batch)
+                self._append(batch)
+                batch = []
+        if batch:
+            count += len(batch)
+            self._append(batch)
+        return count
+
+    def remove_calls(self, call_ids: Iterable[str]) -> int:
+        """Hide calls from future searches; returns how many were indexed."""
+        docs = [_Doc(call_id, deleted=True) for call_id in dict.fromkeys(call_ids) if call_id in self]
+        if docs:
+            self._append(docs)
+        return len(docs)
+
+    def add_from_store(self, store: "CallStore", consumer: str = "transcript-index") -> int:
+        """
+        Index the calls added to ``store`` since this consumer's last run.
+
+        Uses the store's watermarks (as ``OfflineRunner.run_incremental``
+        does), so repeated runs only read new or replaced calls.
+
+        Returns:
+            The number of calls indexed.
+        """
+        indexed = 0
+        for batch in store.iter_since(store.get_watermark(consumer), batch_size=self.batch_size):
+            indexed += self.add_calls(call for _, call in batch)
+            store.set_watermark(consumer, batch[-1][0])
+        return indexed
+
+    def compact(self) -> None:
+        """Merge every segment file into one, dropping replaced and removed calls."""
+        if len(self._files) <= 1 and not any(s.dead for s in self._files):
+            return
+        docs: List[_Doc] = []
+        remap: List[Dict[int, int]] = []  # per file: old seg -> new seg
+        new_seg = 0
+        for segment in self._files:
+            mapping: Dict[int, int] = {}
+            for doc, call_id in enumerate(segment.call_ids):
+                if doc in segment.dead:
+                    continue
+                first, last = segment.doc_segments[doc], segment.doc_segments[doc + 1]
+                segs = []
+                for seg in range(first, last):
+                    mapping[seg] = new_seg
+                    new_seg += 1
+                    hit = segment.hit(seg)
+                    segs.append((hit.speaker, hit.segment, hit.start_ms, _NO_END if hit.end_ms is None else hit.end_ms, ()))
+                docs.append(_Doc(call_id, segments=segs))
+            remap.append(mapping)
+
+        postings: Dict[bytes, List[int]] = {}
+        for segment, mapping in zip(self._files, remap):
+            if not mapping:
+                continue
+            for term in range(segment.n_terms):
+                kept = []
+                with segment.postings(term) as flat:  # released before the file is closed
+                    for i in range(0, len(flat), 2):
+                        seg = mapping.get(flat[i])
+                        if seg is not None:
+                            kept += (seg, flat[i + 1])
+                if kept:
+                    postings.setdefault(segment.term(term), []).extend(kept)
+        for entry in postings.values():
+            # Later files' segments were numbered after earlier ones, but keep
+            # (seg, pos) pairs ordered in case several files share a term.
+            pairs = sorted(zip(entry[0::2], entry[1::2]))
+            entry[:] = [value for pair in pairs for value in pair]
+
+        old = self._files
+        self._files, self._live = [], {}
+        name = f"segment-{self._next:06d}.vidx"
+        self._next += 1
+        _write_segment_file(os.path.join(self.path, name), docs, postings)
+        self._open(name)
+        self._save_manifest()
+        for segment in old:
+            segment.close()
+            os.remove(segment.path)
+
+    # -----------------------------------------------------------------------
+    # Queries
+    # -----------------------------------------------------------------------
+
+    def search(self, query: str, speaker: Optional[str] = None, limit: Optional[int] = None) -> List[SearchHit]:
+        """
+        Calls matching ``query``, oldest-indexed first.
+
+        Args:
+            query: Terms, ``"phrases"``, ``prefix*``, ``AND``/``OR``/``NOT``
+                   and parentheses.
+            speaker: Only match text spoken by this speaker.
+            limit: Maximum number of calls to return.
+
+        Returns:
+            One ``SearchHit`` per call, with the segments (ordered by start
+            time) where its positive terms matched. Calls matched only through
+            ``NOT`` have no segments.
+        """
+        matches = self._evaluate(parse_query(query), speaker)
+        hits = []
+        for (number, doc) in sorted(matches):
+            segment = self._files[number]
+            found = sorted((segment.hit(seg) for seg in matches[number, doc]), key=lambda h: (h.start_ms, h.segment))
+            hits.append(SearchHit(segment.call_ids[doc], found))
+            if limit is not None and len(hits) >= limit:
+                break
+        return hits
+
+    def search_ids(self, query: str, speaker: Optional[str] = None) -> List[str]:
+        """Like ``search`` but returns only call ids."""
+        matches = self._evaluate(parse_query(query), speaker)
+        return [self._files[number].call_ids[doc] for number, doc in sorted(matches)]
+
+    def _evaluate(self, node: Union[_Op, _Term], speaker: Optional[str]) -> _Matches:
+        if isinstance(node, _Term):
+            return self._match_term(node, speaker)
+        if node.op == "not":
+            excluded = self._evaluate(node.args[0], speaker)
+            return {key: set() for key in self._all_docs() if key not in excluded}
+        results = [self._evaluate(arg, speaker) for arg in node.args]
+        if node.op == "and":
+            keys = set(results[0]).intersection(*results[1:])
+        else:
+            keys = set().union(*results)
+        return {key: set().union(*(r.get(key, ()) for r in results)) for key in keys}
+
+    def _all_docs(self) -> Iterator[Tuple[int, int]]:
+        for number, segment in enumerate(self._files):
+            for doc in range(len(segment.call_ids)):
+                if doc not in segment.dead:
+                    yield number, doc
+
+    def _match_term(self, term: _Term, speaker: Optional[str]) -> _Matches:
+        matches: _Matches = {}
+        for number, segment in enumerate(self._files):
+            speaker_id = None
+            if speaker is not None:
+                if speaker not in segment.speaker_names:
+                    continue
+                speaker_id = segment.speaker_names.index(speaker)
+            for seg in self._matching_segments(segment, term):
+                if speaker_id is not None and segment.seg_speaker[seg] != speaker_id:
+                    continue
+                doc = segment.doc_of(seg)
+                if doc in segment.dead:
+                    continue
+                matches.setdefault((number, doc), set()).add(seg)
+        return matches
+
+    @staticmethod
+    def _matching_segments(segment: _SegmentFile, term: _Term) -> Set[int]:
+        words = [word.encode("utf-8") for word in term.tokens]
+        if len(words) == 1:
+            segs: Set[int] = set()
+            for number in segment.term_range(words[0], prefix=term.prefix):
+                segs.update(segment.postings(number)[0::2])
+            return segs
+        # Phrase: (seg, pos) of the first word with word i found at pos + i.
+        candidates: Optional[Set[Tuple[int, int]]] = None
+        for i, word in enumerate(words):
+            found = segment.term_range(word)
+            if not found:
+                return set()
+            flat = segment.postings(found[0])
+            starts = set(zip(flat[0::2], (pos - i for pos in flat[1::2])))
+            candidates = starts if candidates is None else candidates & starts
+            if not candidates:
+                return set()
+        return {seg for seg, _ in candidates}
@@ -0,0 +1,323 @@
+"""
+Local embedded store for ``Call`` objects and their metric results.
+
+Backed by SQLite (stdlib), so there is nothing to install or run::
+
+    from voiceeval.store import CallStore
+
+    with CallStore("calls.db") as store:
+        store.add_calls(iter_calls("calls.vecall", trusted=True))
+        slow = store.query(
+            agent_id="booking-agent",
+            start=datetime.now(timezone.utc) - timedelta(hours=24),
+            metric_min={"e2e_latency": 2.0},
+        )
+
+Calls are indexed by ``agent_id`` and ``start_time``; metric values are kept
+in a separate ``(metric, value)`` indexed table so threshold queries never
+decode call payloads. Every inserted call gets a monotonically increasing
+sequence number, which incremental consumers use as a watermark — see
+``OfflineRunner.run_incremental``.
+"""
+
+import math
+import sqlite3
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from voiceeval.codecs import PathLike, decode_call, encode_call
+from voiceeval.models import Call
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS calls (
+    seq        INTEGER PRIMARY KEY AUTOINCREMENT,
+    call_id    TEXT NOT NULL UNIQUE,
+    agent_id   TEXT NOT NULL,
+    start_time REAL NOT NULL,
+    end_time   REAL,
+    payload    BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_calls_agent_start ON calls (agent_id, start_time);
+CREATE INDEX IF NOT EXISTS idx_calls_start ON calls (start_time);
+
+CREATE TABLE IF NOT EXISTS metric_values (
+    call_id TEXT NOT NULL,
+    metric  TEXT NOT NULL,
+    value   REAL NOT NULL,
+    PRIMARY KEY (call_id, metric)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_metric_values ON metric_values (metric, value);
+
+CREATE TABLE IF NOT EXISTS watermarks (
+    consumer TEXT PRIMARY KEY,
+    seq      INTEGER NOT NULL
+);
+"""
+
+# SQLite's default limit on host parameters in one statement.
+_MAX_PARAMS = 999
+
+_UPSERT_CALL = """
+INSERT INTO calls (call_id, agent_id, start_time, end_time, payload)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (call_id) DO UPDATE SET
+    seq = (SELECT COALESCE(MAX(seq), 0) + 1 FROM calls),
+    agent_id = excluded.agent_id,
+    start_time = excluded.start_time,
+    end_time = excluded.end_time,
+    payload = excluded.payload
+"""
+
+_UPSERT_METRIC = """
+INSERT INTO metric_values (call_id, metric, value) VALUES (?, ?, ?)
+ON CONFLICT (call_id, metric) DO UPDATE SET value = excluded.value
+"""
+
+
+def _timestamp(value: datetime) -> float:
+    """Epoch seconds; naive datetimes are treated as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _numeric_items(metrics: Mapping[str, object]) -> Iterator[Tuple[str, float]]:
+    for name, value in metrics.items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and not math.isnan(value):
+            yield name, float(value)
+
+
+class CallStore:
+    """
+    SQLite-backed store for calls and metric results.
+
+    Args:
+        path: Database file, or ``":memory:"`` for a throwaway store.
+        batch_size: Rows per transaction for bulk inserts.
+    """
+
+    def __init__(self, path: Union[PathLike, str] = ":memory:", batch_size: int = 1000):
+        self.path = path
+        self.batch_size = batch_size
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "CallStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM calls").fetchone()[0]
+
+    # -----------------------------------------------------------------------
+    # Writes
+    # -----------------------------------------------------------------------
+
+    def add_call(self, call: Call) -> None:
+        """Insert or replace a single call."""
+        self.add_calls([call])
+
+    def add_calls(self, calls: Iterable[Call]) -> int:
+        """Insert or replace calls in transactions of ``batch_size`` rows.
+
+        Numeric entries of ``Call.metrics`` are indexed as metric values; NaN
+        values are not stored. Re-adding an existing ``call_id`` replaces it,
+        drops its old metric values and moves it past every watermark, so
+        incremental runners evaluate it again.
+
+        Returns:
+            The number of calls written.
+        """
+        count = 0
+        batch: List[Call] = []
+        for call in calls:
+            batch.append(call)
+            if len(batch) >= self.batch_size:
+                count += self._write_batch(batch)
+                batch = []
+        if batch:
+            count += self._write_batch(batch)
+        return count
+
+    def _write_batch(self, batch: List[Call]) -> int:
+        with self._conn:
+            # Row-at-a-time so conflicting rows each get a fresh sequence number.
+            for call in batch:
+                self._conn.execute("DELETE FROM metric_values WHERE call_id = ?", (call.call_id,))
+                self._conn.execute(_UPSERT_CALL, (
+                    call.call_id,
+                    call.agent_id,
+                    _timestamp(call.start_time),
+                    _timestamp(call.end_time) if call.end_time is not None else None,
+                    encode_call(call),
+                ))
+            self._conn.executemany(_UPSERT_METRIC, (
+                (call.call_id, name, value)
+                for call in batch
+                for name, value in _numeric_items(call.metrics)
+            ))
+        return len(batch)
+
+    def save_results(self, call_id: str, results: Mapping[str, object]) -> None:
+        """Store metric results for one call (e.g. the output of ``OfflineRunner.run``).
+
+        Non-numeric and NaN results are skipped.
+        """
+        self.save_many_results([(call_id, results)])
+
+    def save_many_results(self, results: Iterable[Tuple[str, Mapping[str, object]]]) -> None:
+        """Store metric results for many calls in a single transaction."""
+        with self._conn:
+            self._conn.executemany(_UPSERT_METRIC, (
+                (call_id, name, value)
+                for call_id, metrics in results
+                for name, value in _numeric_items(metrics)
+            ))
+
+    # -----------------------------------------------------------------------
+    # Reads
+    # -----------------------------------------------------------------------
+
+    def get_call(self, call_id: str) -> Optional[Call]:
+        row = self._conn.execute(
+            "SELECT payload FROM calls WHERE call_id = ?", (call_id,)
+        ).fetchone()
+        return decode_call(row[0], trusted=True) if row else None
+
+    def get_calls(self, call_ids: Iterable[str]) -> Iterator[Call]:
+        """Yield the stored calls among ``call_ids``, in the given order; unknown ids are skipped.
+
+        Ids are looked up ``batch_size`` at a time, so only one batch of
+        payloads is held in memory.
+        """
+        ids = iter(call_ids)
+        while True:
+            chunk = list(islice(ids, min(self.batch_size, _MAX_PARAMS)))
+            if not chunk:
+                return
+            rows = dict(self._conn.execute(
+                f"SELECT call_id, payload FROM calls WHERE call_id IN ({','.join('?' * len(chunk))})", chunk
+            ))
+            for call_id in chunk:
+                payload = rows.get(call_id)
+                if payload is not None:
+                    yield decode_call(payload, trusted=True)
+
+    def get_results(self, call_id: str) -> Dict[str, float]:
+        rows = self._conn.execute(
+            "SELECT metric, value FROM metric_values WHERE call_id = ?", (call_id,)
+        )
+        return dict(rows)
+
+    def query(
+        self,
+        agent_id: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        metric_min: Optional[Mapping[str, float]] = None,
+        metric_max: Optional[Mapping[str, float]] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Call]:
+        """Yield calls matching every given filter, ordered by ``start_time``.
+
+        Args:
+            agent_id: Only calls from this agent.
+            start: Only calls starting at or after this time.
+            end: Only calls starting before this time.
+            metric_min: ``{metric: threshold}``; keep calls with value >= threshold.
+            metric_max: ``{metric: threshold}``; keep calls with value <= threshold.
+            limit: Maximum number of calls to return.
+        """
+        sql, params = self._build_query("c.payload", agent_id, start, end, metric_min, metric_max)
+        sql += " ORDER BY c.start_time"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        for (payload,) in self._conn.execute(sql, params):
+            yield decode_call(payload, trusted=True)
+
+    def query_ids(
+        self,
+        agent_id: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        metric_min: Optional[Mapping[str, float]] = None,
+        metric_max: Optional[Mapping[str, float]] = None,
+    ) -> List[str]:
+        """Like ``query`` but returns only call ids, without decoding payloads."""
+        sql, params = self._build_query("c.call_id", agent_id, start, end, metric_min, metric_max)
+        return [row[0] for row in self._conn.execute(sql + " ORDER BY c.start_time", params)]
+
+    @staticmethod
+    def _build_query(columns, agent_id, start, end, metric_min, metric_max):
+        joins: List[str] = []
+        where: List[str] = []
+        params: list = []
+
+        bounds = [(name, ">=", value) for name, value in (metric_min or {}).items()]
+        bounds += [(name, "<=", value) for name, value in (metric_max or {}).items()]
+        for i, (name, op, value) in enumerate(bounds):
+            joins.append(
+                f"JOIN metric_values m{i} ON m{i}.call_id = c.call_id "
+                f"AND m{i}.metric = ? AND m{i}.value {op} ?"
+            )
+            params += [name, value]
+
+        if agent_id is not None:
+            where.append("c.agent_id = ?")
+            params.append(agent_id)
+        if start is not None:
+            where.append("c.start_time >= ?")
+            params.append(_timestamp(start))
+        if end is not None:
+            where.append("c.start_time < ?")
+            params.append(_timestamp(end))
+
+        sql = f"SELECT {columns} FROM calls c " + " ".join(joins)
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        return sql, params
+
+    # -----------------------------------------------------------------------
+    # Incremental consumption
+    # -----------------------------------------------------------------------
+
+    def get_watermark(self, consumer: str) -> int:
+        """Return the last sequence number processed by ``consumer`` (0 if never run)."""
+        row = self._conn.execute(
+            "SELECT seq FROM watermarks WHERE consumer = ?", (consumer,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def set_watermark(self, consumer: str, seq: int) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO watermarks (consumer, seq) VALUES (?, ?) "
+                "ON CONFLICT (consumer) DO UPDATE SET seq = excluded.seq",
+                (consumer, seq),
+            )
+
+    def iter_since(self, seq: int, batch_size: Optional[int] = None) -> Iterator[List[Tuple[int, Call]]]:
+        """Yield batches of ``(seq, call)`` added after ``seq``, oldest first.
+
+        Batches are fetched page by page, so the caller may write to the store
+        (results, watermarks) between batches.
+        """
+        batch_size = batch_size or self.batch_size
+        while True:
+            rows = self._conn.execute(
+                "SELECT seq, payload FROM calls WHERE seq > ? ORDER BY seq LIMIT ?",
+                (seq, batch_size),
+            ).fetchall()
+            if not rows:
+                return
+            yield [(row_seq, decode_call(payload, trusted=True)) for row_seq, payload in rows]
+            seq = rows[-1][0]
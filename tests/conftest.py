@@ -0,0 +1,55 @@
+"""Shared fixtures — a clean call context and an in-memory traced pipeline."""
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from voiceeval.context import (
+    _agent_var,
+    _call_detail_var,
+    _call_unmonitored_var,
+    _monitoring_skipped_var,
+    set_call_metadata,
+)
+from voiceeval.observability.detail import DetailLevelSpanProcessor, SpanDurations
+from voiceeval.observability.processor import CallIdSpanProcessor
+
+
+@pytest.fixture
+def clean_call_context():
+    """Reset the agent, detail and monitoring context around a test."""
+    vars_ = ((_agent_var, None), (_call_detail_var, None), (_call_unmonitored_var, False), (_monitoring_skipped_var, False))
+    tokens = [var.set(default) for var, default in vars_]
+    set_call_metadata(None)
+    yield
+    for (var, _), token in zip(vars_, tokens):
+        var.reset(token)
+    set_call_metadata(None)
+
+
+@pytest.fixture
+def make_tracer():
+    """
+    Factory for a tracer wired like the Client's single-agent pipeline.
+
+    ``make_tracer(call_budget=None, **processor_kwargs)`` returns
+    ``(tracer, exporter, durations, processor)``: spans are tagged by a
+    ``CallIdSpanProcessor`` built with the given budget and arguments, then
+    exported to memory through ``DetailLevelSpanProcessor``.
+    """
+    providers = []
+
+    def make(call_budget=None, **processor_kwargs):
+        exporter = InMemorySpanExporter()
+        durations = SpanDurations()
+        processor = CallIdSpanProcessor(call_budget=call_budget, **processor_kwargs)
+        provider = TracerProvider()
+        provider.add_span_processor(processor)
+        provider.add_span_processor(DetailLevelSpanProcessor(SimpleSpanProcessor(exporter), durations))
+        providers.append(provider)
+        return provider.get_tracer("test"), exporter, durations, processor
+
+    yield make
+    for provider in providers:
+        provider.shutdown()
@@ -0,0 +1,167 @@
+"""Unit tests for voiceeval.aggregation — grouped one-pass aggregation."""
+
+import csv
+import io
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from voiceeval import histogram
+from voiceeval.aggregation import Aggregator, MetricDistribution, parse_bucket
+from voiceeval.models import Call, Transcript
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_call(i, agent="a", minutes=0, model=None):
+    transcript = Transcript(metadata={"model": model}) if model else None
+    return Call(call_id=f"c{i}", agent_id=agent, start_time=T0 + timedelta(minutes=minutes), transcript=transcript)
+
+
+def exact_percentile(values, q):
+    values = sorted(values)
+    position = q * (len(values) - 1)
+    low = int(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def vector_mode(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(histogram, "_np", False)
+    return request.param
+
+
+# ---------------------------------------------------------------------------
+# Grouping
+# ---------------------------------------------------------------------------
+
+def test_groups_by_agent_and_hour():
+    agg = Aggregator(group_by=["agent_id"], bucket="1h")
+    agg.add(make_call(1, "a", minutes=5), {"latency": 1.0})
+    agg.add(make_call(2, "a", minutes=50), {"latency": 3.0})
+    agg.add(make_call(3, "a", minutes=65), {"latency": 10.0})
+    agg.add(make_call(4, "b", minutes=5), {"latency": 2.0})
+
+    rows = agg.summaries()
+
+    assert agg.columns == ["agent_id", "bucket"]
+    assert [(r["agent_id"], r["bucket"], r["count"], r["mean"]) for r in rows] == [
+        ("a", "2024-01-01T00:00:00+00:00", 2, 2.0),
+        ("a", "2024-01-01T01:00:00+00:00", 1, 10.0),
+        ("b", "2024-01-01T00:00:00+00:00", 1, 2.0),
+    ]
+
+
+def test_groups_by_metadata_tag_and_callable():
+    agg = Aggregator(group_by=["metadata.model", ("long_id", lambda call: len(call.call_id) > 2)])
+    agg.add(make_call(1, model="gpt"), {"score": 1.0})
+    agg.add(make_call(22, model="gpt"), {"score": 2.0})
+    agg.add(make_call(3), {"score": 3.0})
+
+    keys = {(r["metadata.model"], r["long_id"]) for r in agg.summaries()}
+    assert keys == {("gpt", False), ("gpt", True), (None, False)}
+
+
+def test_skips_non_numeric_non_finite_and_unselected_metrics():
+    agg = Aggregator(metrics=["a", "b", "d"])
+    agg.add(make_call(1), {"a": 1, "b": float("nan"), "c": 5.0, "d": float("inf"), "label": "x", "flag": True})
+    agg.add(make_call(2), {"d": float("-inf")})
+    rows = agg.summaries()
+    assert [r["metric"] for r in rows] == ["a"]
+    assert agg.calls == 2
+
+
+def test_invalid_group_and_bucket():
+    with pytest.raises(ValueError, match="Unknown group field"):
+        Aggregator(group_by=["agent"])
+    with pytest.raises(ValueError):
+        parse_bucket("hourly")
+    assert parse_bucket("15m") == 900
+    assert parse_bucket(timedelta(days=1)) == 86400
+
+
+# ---------------------------------------------------------------------------
+# Distributions
+# ---------------------------------------------------------------------------
+
+def test_small_groups_report_exact_percentiles(vector_mode):
+    values = [random.uniform(0, 10) for _ in range(200)]
+    dist = MetricDistribution(exact_up_to=1000, buffer_size=64)
+    for v in values:
+        dist.add(v)
+
+    assert dist.is_exact
+    for q in (0.0, 0.5, 0.9, 1.0):
+        assert dist.percentile(q) == pytest.approx(exact_percentile(values, q))
+
+
+def test_large_groups_fall_back_to_bounded_sketch(vector_mode):
+    rng = random.Random(7)
+    values = [rng.lognormvariate(0, 1.5) for _ in range(50000)] + [-rng.uniform(0, 5) for _ in range(5000)] + [0.0] * 1000
+    dist = MetricDistribution(relative_error=0.01, exact_up_to=100, buffer_size=1024)
+    for v in values:
+        dist.add(v)
+
+    assert not dist.is_exact
+    assert dist.count == len(values)
+    assert dist.mean == pytest.approx(sum(values) / len(values))
+    assert len(dist.positive.counts) + len(dist.negative.counts) < 3000
+    for q in (0.01, 0.05, 0.095, 0.5, 0.95, 0.99):
+        truth = exact_percentile(values, q)
+        # Within the sketch error, or a neighbour rank when the quantile sits on a tie/zero boundary.
+        assert dist.percentile(q) == pytest.approx(truth, rel=0.03, abs=1e-6)
+
+
+def test_merge_matches_single_pass():
+    rng = random.Random(1)
+    calls = [(make_call(i, agent=rng.choice("ab"), minutes=rng.randrange(180)), {"m": rng.expovariate(1.0)}) for i in range(4000)]
+
+    whole = Aggregator(bucket="1h", exact_up_to=50)
+    whole.add_many(calls)
+    left, right = Aggregator(bucket="1h", exact_up_to=50), Aggregator(bucket="1h", exact_up_to=50)
+    left.add_many(calls[:1500])
+    right.add_many(calls[1500:])
+    left.merge(right)
+
+    for a, b in zip(whole.summaries(), left.summaries()):
+        assert a["count"] == b["count"]
+        assert a["mean"] == pytest.approx(b["mean"])
+        assert a["p95"] == pytest.approx(b["p95"])
+    with pytest.raises(ValueError):
+        left.merge(Aggregator(group_by=["call_id"]))
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+def test_csv_and_json_export(tmp_path):
+    agg = Aggregator(bucket="1d")
+    agg.add_many((make_call(i, agent="a"), {"latency": float(i)}) for i in range(1, 6))
+
+    buffer = io.StringIO()
+    agg.to_csv(buffer)
+    rows = list(csv.DictReader(io.StringIO(buffer.getvalue())))
+    assert rows[0]["agent_id"] == "a"
+    assert rows[0]["metric"] == "latency"
+    assert float(rows[0]["p50"]) == 3.0
+    assert list(rows[0])[:5] == ["agent_id", "bucket", "metric", "count", "mean"]
+
+    path = tmp_path / "summary.json"
+    agg.to_json(str(path))
+    document = json.loads(path.read_text())
+    assert document["group_by"] == ["agent_id", "bucket"]
+    assert document["calls"] == 5
+    assert document["rows"][0]["count"] == 5
+
+    # pathlib paths are written like strings, not treated as file objects.
+    agg.to_json(path)
+    assert json.loads(path.read_text()) == document
+    agg.to_csv(tmp_path / "summary.csv")
+    assert (tmp_path / "summary.csv").read_text(encoding="utf-8").replace("\r\n", "\n") == buffer.getvalue().replace("\r\n", "\n")
@@ -0,0 +1,220 @@
+"""Unit tests for voiceeval.audio.quality and voiceeval.metrics.audio_quality."""
+
+import wave
+from datetime import datetime, timezone
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from voiceeval.audio import AudioIngestor, AudioQualityAnalyzer
+from voiceeval.metrics import (
+    ClippingRatioMetric,
+    DropoutRateMetric,
+    EchoCorrelationMetric,
+    InterruptionRateMetric,
+    LoudnessMetric,
+    SNRMetric,
+)
+from voiceeval.metrics.audio_quality import AUDIO_QUALITY_KEY
+from voiceeval.metrics.voice import VAD_INTERVALS_KEY
+from voiceeval.models import Call, Transcript
+
+SR = 16000
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _write_wav(path, channels, sample_rate: int = SR) -> str:
+    """Write float channels in [-1, 1] as int16 PCM; returns the path."""
+    pcm = (np.stack(channels, axis=1) * 32767).clip(-32768, 32767).astype("<i2")
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(pcm.shape[1])
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(pcm.tobytes())
+    return str(path)
+
+
+def _sine(seconds: float, amp: float, freq: float = 1000.0) -> "np.ndarray":
+    t = np.arange(int(seconds * SR)) / SR
+    return amp * np.sin(2 * np.pi * freq * t)
+
+
+def _voiced(seconds: float, amp: float = 0.3) -> "np.ndarray":
+    return _sine(seconds, amp, 180) + _sine(seconds, amp / 2, 360)
+
+
+def _speech_and_pauses(noise: float, seed: int = 0) -> "np.ndarray":
+    """2 s pause, 3 s voiced, 2 s pause, 3 s voiced over white noise."""
+    rng = np.random.default_rng(seed)
+    gap = np.zeros(2 * SR)
+    audio = np.concatenate([gap, _voiced(3.0), gap, _voiced(3.0)])
+    return audio + rng.normal(0, noise, len(audio))
+
+
+def _call(transcript=None) -> Call:
+    return Call(call_id="c1", agent_id="a1", start_time=datetime(2026, 1, 1, tzinfo=timezone.utc), transcript=transcript)
+
+
+def _analyze(path, speakers=None, **kwargs):
+    with AudioIngestor(path, speakers=speakers) as ingestor:
+        return AudioQualityAnalyzer(**kwargs).analyze(ingestor)
+
+
+# ---------------------------------------------------------------------------
+# Analyzer
+# ---------------------------------------------------------------------------
+
+class TestAnalyzer:
+    def test_level_of_a_reference_tone(self, tmp_path):
+        # BS.1770: K-weighting is ~0 dB at 1 kHz, so a -20 dBFS-peak sine reads ~-23.0 LUFS and dBFS RMS.
+        quality = _analyze(_write_wav(tmp_path / "a.wav", [_sine(5.0, 0.1)])).channels["channel_0"]
+        assert quality.rms_dbfs == pytest.approx(-23.01, abs=0.05)
+        assert quality.lufs == pytest.approx(-23.0, abs=0.2)
+        assert quality.duration == pytest.approx(5.0)
+        assert quality.clipping_ratio == 0.0
+
+    def test_clipping(self, tmp_path):
+        quality = _analyze(_write_wav(tmp_path / "a.wav", [_sine(2.0, 1.5, 173)])).channels["channel_0"]
+        # |1.5 sin| >= 1 for about 54% of the period.
+        assert quality.clipping_ratio == pytest.approx(0.54, abs=0.03)
+
+    def test_snr_tracks_background_noise(self, tmp_path):
+        clean = _analyze(_write_wav(tmp_path / "a.wav", [_speech_and_pauses(0.003)])).channels["channel_0"]
+        noisy = _analyze(_write_wav(tmp_path / "b.wav", [_speech_and_pauses(0.03)])).channels["channel_0"]
+        assert clean.speech_seconds == pytest.approx(6.0, abs=0.5)
+        assert clean.snr_db == pytest.approx(37.5, abs=3)
+        assert noisy.snr_db == pytest.approx(17.5, abs=3)
+
+    def test_dropouts(self, tmp_path):
+        audio = _speech_and_pauses(0.003)
+        for start in (2.5, 5.5, 9.0):
+            i = int(start * SR)
+            audio[i:i + int(0.05 * SR)] = audio[i]  # held sample, as from a lost packet
+        audio[:SR // 2] = 0.0  # leading digital silence is not a dropout
+        quality = _analyze(_write_wav(tmp_path / "a.wav", [audio])).channels["channel_0"]
+        assert quality.dropouts == 3
+        assert quality.dropout_seconds == pytest.approx(0.15, abs=0.01)
+        assert quality.dropouts_per_minute == pytest.approx(18.0, abs=0.1)
+
+    def test_echo_between_channels(self, tmp_path):
+        rng = np.random.default_rng(0)
+        agent = rng.normal(0, 0.1, 10 * SR)
+        user = rng.normal(0, 0.1, 10 * SR)
+        delay = int(0.12 * SR)
+        user[delay:] += 0.5 * agent[:-delay]
+        report = _analyze(_write_wav(tmp_path / "a.wav", [user, agent]), speakers=["user", "agent"], chunk_ms=3000)
+
+        assert report.channels["user"].echo_correlation == pytest.approx(0.5 / np.sqrt(1.25), abs=0.05)
+        assert report.channels["user"].echo_delay_ms == pytest.approx(120.0, abs=1)
+        assert report.channels["agent"].echo_correlation < 0.05
+        assert report.channels["all"].echo_delay_ms == pytest.approx(120.0, abs=1)
+
+    def test_pooled_channel_and_vad_intervals(self, tmp_path):
+        user, agent = _speech_and_pauses(0.003), _speech_and_pauses(0.003, seed=1)
+        report = _analyze(_write_wav(tmp_path / "a.wav", [user, agent]), speakers=["user", "agent"])
+
+        assert set(report.channels) == {"user", "agent", "all"}
+        assert report.channels["all"].speech_seconds == pytest.approx(
+            report.channels["user"].speech_seconds + report.channels["agent"].speech_seconds
+        )
+        # Identical programme on both channels: BS.1770 sums channel powers (+3 LU).
+        assert report.channels["all"].lufs == pytest.approx(report.channels["user"].lufs + 3.0, abs=0.2)
+        assert len(report.vad_intervals["user"]) == 2
+
+    def test_matches_standalone_vad(self, tmp_path):
+        path = _write_wav(tmp_path / "a.wav", [_speech_and_pauses(0.003)])
+        with AudioIngestor(path) as ingestor:
+            expected = AudioQualityAnalyzer().vad.detect_channels(ingestor)
+        assert _analyze(path).vad_intervals == expected
+
+    def test_chunking_does_not_change_results(self, tmp_path):
+        path = _write_wav(tmp_path / "a.wav", [_speech_and_pauses(0.01)])
+        small = _analyze(path, chunk_ms=700).channels["channel_0"]
+        large = _analyze(path, chunk_ms=60000).channels["channel_0"]
+        assert small.lufs == pytest.approx(large.lufs, abs=1e-3)
+        assert small.snr_db == pytest.approx(large.snr_db, abs=1e-3)
+        assert small.dropouts == large.dropouts
+
+    def test_unsigned_8_bit_pcm_is_centred(self, tmp_path):
+        tone = _sine(1.0, 0.1)
+        path8 = tmp_path / "u8.wav"
+        with wave.open(str(path8), "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(1)
+            w.setframerate(SR)
+            w.writeframes((np.round(tone * 128) + 128).clip(0, 255).astype("u1").tobytes())
+        quality = _analyze(str(path8)).channels["all"]
+        assert quality.rms_dbfs == pytest.approx(-23.0, abs=0.3)
+        assert quality.clipping_ratio == 0.0
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+class TestMetrics:
+    def test_metrics_share_one_analysis(self, tmp_path, monkeypatch):
+        path = _write_wav(tmp_path / "a.wav", [_speech_and_pauses(0.003), _speech_and_pauses(0.003, seed=1)])
+        call = _call(Transcript(metadata={"audio_path": path}))
+        runs = []
+        analyze = AudioQualityAnalyzer.analyze
+        monkeypatch.setattr(AudioQualityAnalyzer, "analyze", lambda self, ing: runs.append(1) or analyze(self, ing))
+
+        common = dict(speakers=["user", "agent"])
+        metrics = [
+            ClippingRatioMetric(**common),
+            LoudnessMetric(speaker="user", **common),
+            LoudnessMetric(measure="rms", **common),
+            SNRMetric(speaker="agent", **common),
+            DropoutRateMetric(**common),
+            EchoCorrelationMetric(**common),
+        ]
+        scores = {m.name: m.evaluate(call) for m in metrics}
+
+        assert len(runs) == 1
+        assert set(scores) == {
+            "clipping_ratio", "loudness_lufs.user", "rms_dbfs", "snr_db.agent", "dropouts_per_minute", "echo_correlation",
+        }
+        assert scores["snr_db.agent"] > 30
+        assert scores["dropouts_per_minute"] == 0.0
+        (report,) = call.transcript.metadata[AUDIO_QUALITY_KEY].values()
+        assert set(report) == {"user", "agent", "all"}
+        # The same pass feeds the timeline metrics (the transcript has no segments).
+        assert call.transcript.metadata[VAD_INTERVALS_KEY]["user"] == [[2.0, 5.0], [7.0, 10.0]]
+        assert InterruptionRateMetric().evaluate(call) > 0
+
+    def test_audio_provider(self, tmp_path):
+        path = _write_wav(tmp_path / "a.wav", [_sine(2.0, 0.1)])
+        call = _call()
+        assert LoudnessMetric(measure="rms", audio=lambda c: path).evaluate(call) == pytest.approx(-23.0, abs=0.1)
+        assert AUDIO_QUALITY_KEY in call.transcript.metadata
+
+    def test_reports_are_cached_per_settings(self, tmp_path):
+        path = _write_wav(tmp_path / "a.wav", [_sine(1.0, 0.5), _sine(1.0, 0.1)])
+        call = _call(Transcript(metadata={"audio_path": path}))
+
+        assert ClippingRatioMetric().evaluate(call) == 0.0
+        strict = ClippingRatioMetric(analyzer=AudioQualityAnalyzer(clip_level=0.4))
+        assert strict.evaluate(call) > 0.0
+        named = ClippingRatioMetric(speaker="user", speakers=["user", "agent"], analyzer=AudioQualityAnalyzer(clip_level=0.4))
+        assert named.evaluate(call) > 0.0
+        assert len(call.transcript.metadata[AUDIO_QUALITY_KEY]) == 3
+        # The same settings hit the cache, whatever the chunk size.
+        same = ClippingRatioMetric(analyzer=AudioQualityAnalyzer(clip_level=0.4, chunk_ms=500))
+        assert same.cache_key() == strict.cache_key()
+
+    def test_calls_without_audio_score_zero(self):
+        assert SNRMetric().evaluate(_call()) == 0.0
+
+    def test_unknown_speaker(self, tmp_path):
+        call = _call(Transcript(metadata={"audio_path": _write_wav(tmp_path / "a.wav", [_sine(1.0, 0.1)])}))
+        with pytest.raises(ValueError, match="No channel 'user'"):
+            SNRMetric(speaker="user").evaluate(call)
+
+    def test_invalid_measure(self):
+        with pytest.raises(ValueError, match="measure"):
+            LoudnessMetric(measure="peak")
@@ -0,0 +1,144 @@
+"""Unit tests for voiceeval.audio.batch — concurrent batched transcription."""
+
+import asyncio
+
+import pytest
+
+from voiceeval.audio import BatchTranscriber, Transcriber, TranscriberBackend, TranscriptionBackend
+from voiceeval.cache import DiskCache, content_key
+from voiceeval.models import TranscriptSegment
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+# ---------------------------------------------------------------------------
+# Local stand-in backends
+# ---------------------------------------------------------------------------
+
+class FakeBackend(TranscriptionBackend):
+    """Deterministic local model: the transcript is the clip decoded as text."""
+    cache_namespace = "fake-v1"
+
+    def __init__(self, max_batch_size: int = 1, fail_first: int = 0, delay: float = 0.0):
+        self.max_batch_size = max_batch_size
+        self.fail_first = fail_first
+        self.delay = delay
+        self.batches: list[list[bytes]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def transcribe_batch(self, clips):
+        if self.fail_first > 0:
+            self.fail_first -= 1
+            raise ConnectionError("transient")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            self.batches.append(list(clips))
+            return [[TranscriptSegment(speaker="user", text=clip.decode(), timestamp=0.0)] for clip in clips]
+        finally:
+            self.in_flight -= 1
+
+
+class UpperTranscriber(Transcriber):
+    def transcribe(self, audio: bytes):
+        return [TranscriptSegment(speaker="user", text=audio.decode().upper(), timestamp=0.0)]
+
+
+def _texts(results):
+    return [[seg.text for seg in segments] for segments in results]
+
+
+# ---------------------------------------------------------------------------
+# BatchTranscriber
+# ---------------------------------------------------------------------------
+
+class TestBatchTranscriber:
+    @pytest.mark.anyio
+    async def test_preserves_order_and_batches(self):
+        backend = FakeBackend(max_batch_size=3)
+        results = await BatchTranscriber(backend).transcribe_many([b"a", b"b", b"c", b"d"])
+        assert _texts(results) == [["a"], ["b"], ["c"], ["d"]]
+        assert [len(batch) for batch in backend.batches] == [3, 1]
+
+    @pytest.mark.anyio
+    async def test_concurrency_limit(self):
+        backend = FakeBackend(delay=0.01)
+        await BatchTranscriber(backend, concurrency=2).transcribe_many([bytes([65 + i]) for i in range(8)])
+        assert backend.max_in_flight == 2
+
+    @pytest.mark.anyio
+    async def test_deduplicates_identical_clips(self):
+        backend = FakeBackend()
+        batch = BatchTranscriber(backend)
+        results = await batch.transcribe_many([b"x", b"y", b"x"])
+        assert _texts(results) == [["x"], ["y"], ["x"]]
+        assert sum(len(b) for b in backend.batches) == 2
+        assert batch.stats["deduplicated"] == 1
+
+    @pytest.mark.anyio
+    async def test_retries_transient_failures(self):
+        backend = FakeBackend(fail_first=2)
+        results = await BatchTranscriber(backend, retry_backoff=0.0).transcribe_many([b"a"])
+        assert _texts(results) == [["a"]]
+
+    @pytest.mark.anyio
+    async def test_gives_up_after_max_retries(self):
+        backend = FakeBackend(fail_first=5)
+        with pytest.raises(ConnectionError):
+            await BatchTranscriber(backend, max_retries=1, retry_backoff=0.0).transcribe_many([b"a"])
+
+    @pytest.mark.anyio
+    async def test_disk_cache_skips_backend(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        first = FakeBackend()
+        await BatchTranscriber(first, cache=cache).transcribe_many([b"a", b"b"])
+
+        second = FakeBackend()
+        batch = BatchTranscriber(second, cache=cache)
+        results = await batch.transcribe_many([b"a", b"b", b"c"])
+        assert _texts(results) == [["a"], ["b"], ["c"]]
+        assert second.batches == [[b"c"]]
+        assert batch.stats["cache_hits"] == 2
+
+    @pytest.mark.anyio
+    async def test_cache_is_namespaced_by_backend(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        await BatchTranscriber(FakeBackend(), cache=cache).transcribe_many([b"a"])
+        other = FakeBackend()
+        other.cache_namespace = "fake-v2"
+        await BatchTranscriber(other, cache=cache).transcribe_many([b"a"])
+        assert other.batches == [[b"a"]]
+
+    def test_sync_transcriber_adapter(self):
+        batch = BatchTranscriber(TranscriberBackend(UpperTranscriber()), concurrency=2)
+        assert _texts(batch.transcribe_many_sync([b"hi", b"yo"])) == [["HI"], ["YO"]]
+
+
+# ---------------------------------------------------------------------------
+# DiskCache
+# ---------------------------------------------------------------------------
+
+class TestDiskCache:
+    def test_round_trip_and_miss(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        key = content_key("ns", b"clip")
+        assert cache.get(key) is None
+        cache.put(key, [{"a": 1}])
+        assert key in cache
+        assert cache.get(key) == [{"a": 1}]
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        key = content_key("k")
+        cache.put(key, 1)
+        cache._path(key).write_text("{not json")
+        assert cache.get(key) is None
+
+    def test_content_key_is_unambiguous(self):
+        assert content_key("ab", "c") != content_key("a", "bc")
+        assert content_key(b"x") == content_key("x")
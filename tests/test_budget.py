@@ -0,0 +1,178 @@
+"""Unit tests for voiceeval.observability.budget — per-call span, attribute and event budgets."""
+
+from unittest.mock import patch
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from voiceeval import AgentProfile, CallBudget, Client, set_agent, set_call_detail
+from voiceeval.observability.budget import BudgetTracker, attribute_bytes
+from voiceeval.observability.profiles import ProfileRouter
+
+pytestmark = pytest.mark.usefixtures("clean_call_context")
+
+
+def run_call(tracer, spans=3, text="x" * 10, events=0):
+    with tracer.start_as_current_span("job_entrypoint"):
+        for _ in range(spans):
+            with tracer.start_as_current_span("llm") as span:
+                span.set_attribute("gen_ai.prompt", text)
+                for _ in range(events):
+                    span.add_event("chunk")
+
+
+def exported(exporter, name):
+    return [s for s in exporter.get_finished_spans() if s.name == name]
+
+
+# ---------------------------------------------------------------------------
+# Limits
+# ---------------------------------------------------------------------------
+
+def test_calls_within_budget_are_untouched(make_tracer):
+    tracer, exporter, durations, _ = make_tracer(CallBudget(max_spans=3, max_attribute_bytes=1000, max_events=3))
+    run_call(tracer, spans=3, events=1)
+
+    assert len(exported(exporter, "llm")) == 3
+    assert "voiceeval.truncated" not in exported(exporter, "job_entrypoint")[0].attributes
+    assert durations.histograms == {}
+
+
+def test_span_budget_withholds_further_spans(make_tracer):
+    tracer, exporter, durations, _ = make_tracer(CallBudget(max_spans=5))
+    run_call(tracer, spans=12)
+
+    assert len(exported(exporter, "llm")) == 5
+    root = exported(exporter, "job_entrypoint")[0].attributes
+    assert root["voiceeval.truncated"] is True
+    assert root["voiceeval.truncated.reason"] == "max_spans"
+    assert root["voiceeval.truncated.spans"] == 7
+    # Withheld spans are summarized, not lost.
+    assert durations.summary()["llm"]["count"] == 7
+
+
+def test_attribute_and_event_budgets(make_tracer):
+    # Each llm span carries ~190 bytes: the 100-char prompt plus call_id and tags.
+    tracer, exporter, _, _ = make_tracer(CallBudget(max_attribute_bytes=500))
+    run_call(tracer, spans=10, text="x" * 100)
+    root = exported(exporter, "job_entrypoint")[0].attributes
+    assert root["voiceeval.truncated.reason"] == "max_attribute_bytes"
+    assert 1 <= len(exported(exporter, "llm")) < 10
+    assert root["voiceeval.truncated.spans"] == 10 - len(exported(exporter, "llm"))
+
+    tracer, exporter, _, _ = make_tracer(CallBudget(max_events=10))
+    run_call(tracer, spans=10, events=4)
+    root = exported(exporter, "job_entrypoint")[0].attributes
+    assert root["voiceeval.truncated.reason"] == "max_events"
+    assert len(exported(exporter, "llm")) == 2
+
+
+def test_budgets_are_per_call(make_tracer):
+    tracer, exporter, _, processor = make_tracer(CallBudget(max_spans=2))
+    run_call(tracer, spans=4)
+    run_call(tracer, spans=2)
+
+    roots = exported(exporter, "job_entrypoint")
+    assert [r.attributes.get("voiceeval.truncated", False) for r in roots] == [True, False]
+    assert len(exported(exporter, "llm")) == 4
+    assert processor._budget._calls == {}
+
+
+def test_unmonitored_calls_are_not_budgeted(make_tracer):
+    tracer, exporter, _, _ = make_tracer(CallBudget(max_spans=1), sample_rate=0.0)
+    run_call(tracer, spans=3)
+    assert len(exported(exporter, "llm")) == 3
+
+
+def test_truncation_marker_survives_timing_detail(make_tracer):
+    tracer, exporter, _, _ = make_tracer(CallBudget(max_spans=1))
+    with tracer.start_as_current_span("job_entrypoint"):
+        set_call_detail("timing")
+        for _ in range(3):
+            with tracer.start_as_current_span("llm"):
+                pass
+    root = exported(exporter, "job_entrypoint")[0].attributes
+    assert root["voiceeval.detail"] == "timing"
+    assert root["voiceeval.truncated.spans"] == 2
+
+
+def test_rerouted_root_is_finished_by_its_starting_profile():
+    router = ProfileRouter("default", schedule_delay_millis=60_000)
+    exporters = {name: InMemorySpanExporter() for name in ("default", "billing")}
+    for name, exporter in exporters.items():
+        router.add_profile(AgentProfile(name, call_budget=CallBudget(max_spans=1)), exporter)
+    provider = TracerProvider()
+    provider.add_span_processor(router)
+    tracer = provider.get_tracer("test")
+
+    with tracer.start_as_current_span("job_entrypoint"):
+        for _ in range(3):
+            with tracer.start_as_current_span("llm"):
+                pass
+        set_agent("billing")
+    router.shutdown()
+
+    (root,) = exported(exporters["billing"], "job_entrypoint")
+    assert root.attributes["voiceeval.agent_name"] == "billing"
+    assert root.attributes["voiceeval.truncated.spans"] == 2
+    assert router._routes["default"].tagger._budget._calls == {}
+
+
+def test_tracker_evicts_least_recently_active_calls():
+    tracker = BudgetTracker(CallBudget(max_spans=1), max_calls=2)
+    for call_id in ("a", "b", "a", "c"):
+        tracker.start(call_id)
+    assert list(tracker._calls) == ["a", "c"]
+    # "a" kept its usage: its second span was over budget.
+    assert tracker.finish("a").reason == "max_spans"
+    assert tracker.finish("b") is None
+
+
+def test_spans_ending_after_the_root_are_not_tracked(make_tracer):
+    tracer, exporter, _, processor = make_tracer(CallBudget(max_spans=5, max_events=5))
+    with tracer.start_as_current_span("job_entrypoint"):
+        late = tracer.start_span("llm")
+    late.end()
+
+    assert processor._budget._calls == {}
+    assert len(exported(exporter, "llm")) == 1
+
+
+def test_finished_ids_are_bounded():
+    tracker = BudgetTracker(CallBudget(max_spans=1), max_calls=2)
+    for call_id in ("a", "b", "c"):
+        tracker.start(call_id)
+        tracker.finish(call_id)
+    assert list(tracker._finished) == ["b", "c"]
+
+
+def test_attribute_bytes():
+    assert attribute_bytes({"k": "abc", "n": 3, "xs": ("ab", "c"), "b": b"\x00\x01"}) == (1 + 3) + (1 + 8) + (2 + 3) + (1 + 2)
+    assert attribute_bytes(None) == 0
+
+
+def test_negative_limits_rejected():
+    with pytest.raises(ValueError, match="max_spans"):
+        CallBudget(max_spans=-1)
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+def test_client_and_profiles_pass_budgets():
+    budget, tenant_budget = CallBudget(max_spans=100), CallBudget(max_events=10)
+    with patch("voiceeval.client.Client._validate_api_key"), \
+            patch("voiceeval.client.Client._instrument_libraries"), \
+            patch("opentelemetry.trace.set_tracer_provider") as set_provider:
+        Client(api_key="ve_key", call_budget=budget)
+        client = Client(api_key="ve_key", call_budget=budget, profiles=[AgentProfile("billing", call_budget=tenant_budget)])
+
+    first = set_provider.call_args_list[0].args[0]
+    assert first._active_span_processor._span_processors[0]._budget.budget is budget
+    routes = client._router._routes
+    assert routes["default"].tagger._budget.budget is budget
+    assert routes["billing"].tagger._budget.budget is tenant_budget
+    for call in set_provider.call_args_list:
+        call.args[0].shutdown()
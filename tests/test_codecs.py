@@ -0,0 +1,142 @@
+"""Unit tests for voiceeval.codecs — Call corpus serialization."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from voiceeval.codecs import (
+    CodecError,
+    decode_call,
+    dump_binary,
+    dump_jsonl,
+    encode_call,
+    iter_binary,
+    iter_calls,
+    iter_jsonl,
+)
+from voiceeval.metrics.base import BaseMetric
+from voiceeval.models import Call, Transcript, TranscriptSegment
+from voiceeval.runners import OfflineRunner
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _make_call(i: int = 0) -> Call:
+    return Call(
+        call_id=f"call-{i}",
+        agent_id="agent-a",
+        start_time=datetime(2026, 1, 1, 12, 0, i, tzinfo=timezone(timedelta(hours=2))),
+        end_time=datetime(2026, 1, 1, 10, 5, i, tzinfo=timezone.utc),
+        transcript=Transcript(
+            segments=[
+                TranscriptSegment(speaker="user", text="héllo", timestamp=0.5, end_timestamp=1.0, confidence=0.9),
+                TranscriptSegment(speaker="agent", text="hi there", timestamp=1.25),
+                TranscriptSegment(speaker="user", text="", timestamp=3.0),
+            ],
+            metadata={"lang": "en"},
+        ),
+        metrics={"e2e_latency": 1.5},
+    )
+
+
+class _SegmentCount(BaseMetric):
+    @property
+    def name(self) -> str:
+        return "segments"
+
+    def evaluate(self, call: Call) -> float:
+        return float(len(call.transcript.segments)) if call.transcript else 0.0
+
+
+# ---------------------------------------------------------------------------
+# Round trips
+# ---------------------------------------------------------------------------
+
+class TestBinaryCodec:
+    def test_encode_decode_round_trip(self):
+        call = _make_call()
+        assert decode_call(encode_call(call)) == call
+
+    def test_trusted_decode_matches_validated(self):
+        call = _make_call()
+        payload = encode_call(call)
+        assert decode_call(payload, trusted=True) == decode_call(payload)
+
+    def test_naive_datetime_and_missing_fields(self):
+        call = Call(call_id="c", agent_id="a", start_time=datetime(2026, 3, 1, 8, 30))
+        decoded = decode_call(encode_call(call))
+        assert decoded == call
+        assert decoded.start_time.tzinfo is None
+
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_file_round_trip(self, tmp_path, trusted):
+        path = tmp_path / "calls.vecall"
+        calls = [_make_call(i) for i in range(5)]
+        assert dump_binary(calls, path) == 5
+        assert list(iter_binary(path, trusted=trusted)) == calls
+
+    def test_append_writes_single_header(self, tmp_path):
+        path = tmp_path / "calls.vecall"
+        dump_binary([_make_call(0)], path)
+        dump_binary([_make_call(1)], path, append=True)
+        assert [c.call_id for c in iter_binary(path)] == ["call-0", "call-1"]
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "bad.vecall"
+        path.write_bytes(b"not a corpus")
+        with pytest.raises(CodecError):
+            list(iter_binary(path))
+
+    def test_truncated_record_raises(self, tmp_path):
+        path = tmp_path / "calls.vecall"
+        dump_binary([_make_call()], path)
+        path.write_bytes(path.read_bytes()[:-3])
+        with pytest.raises(CodecError):
+            list(iter_binary(path))
+
+    def test_empty_file_yields_nothing(self, tmp_path):
+        path = tmp_path / "empty.vecall"
+        path.write_bytes(b"")
+        assert list(iter_binary(path)) == []
+
+
+class TestJsonlCodec:
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_file_round_trip(self, tmp_path, trusted):
+        path = tmp_path / "calls.jsonl"
+        calls = [_make_call(i) for i in range(3)]
+        assert dump_jsonl(calls, path) == 3
+        assert list(iter_jsonl(path, trusted=trusted)) == calls
+
+    def test_skips_blank_lines_and_missing_trailing_newline(self, tmp_path):
+        path = tmp_path / "calls.jsonl"
+        lines = [_make_call(i).model_dump_json() for i in range(2)]
+        path.write_text(lines[0] + "\n\n" + lines[1])
+        assert [c.call_id for c in iter_jsonl(path)] == ["call-0", "call-1"]
+
+
+class TestIterCalls:
+    def test_detects_format(self, tmp_path):
+        calls = [_make_call(i) for i in range(2)]
+        dump_binary(calls, tmp_path / "a.vecall")
+        dump_jsonl(calls, tmp_path / "a.jsonl")
+        assert list(iter_calls(tmp_path / "a.vecall")) == calls
+        assert list(iter_calls(tmp_path / "a.jsonl")) == calls
+
+
+# ---------------------------------------------------------------------------
+# OfflineRunner integration
+# ---------------------------------------------------------------------------
+
+class TestOfflineRunnerStream:
+    def test_run_stream_is_lazy(self, tmp_path):
+        path = tmp_path / "calls.vecall"
+        dump_binary([_make_call(i) for i in range(3)], path)
+
+        stream = OfflineRunner([_SegmentCount()]).run_stream(iter_binary(path, trusted=True))
+        call, results = next(stream)
+        assert call.call_id == "call-0"
+        assert results == {"segments": 3.0}
+        assert len(list(stream)) == 2
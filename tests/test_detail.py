@@ -0,0 +1,128 @@
+"""Unit tests for voiceeval.observability.detail — detail levels for unmonitored calls."""
+
+from unittest.mock import patch
+
+import pytest
+
+from voiceeval import Client, monitor_call, skip_call
+from voiceeval.context import set_call_detail
+from voiceeval.observability.detail import DetailLevelSpanProcessor
+from voiceeval.observability.processor import CallIdSpanProcessor
+
+pytestmark = pytest.mark.usefixtures("clean_call_context")
+
+
+def run_call(tracer, before=None, inside=None):
+    if before:
+        before()
+    with tracer.start_as_current_span("job_entrypoint") as root:
+        root.set_attribute("voiceeval.inputs", "secret")
+        if inside:
+            inside()
+        with tracer.start_as_current_span("llm") as llm:
+            llm.set_attribute("gen_ai.prompt.0.content", "my card number is ...")
+            llm.set_attribute("gen_ai.request.model", "gpt-4o")
+            llm.set_attribute("gen_ai.usage.input_tokens", 42)
+            llm.add_event("gen_ai.content.completion", {"text": "..."})
+
+
+# ---------------------------------------------------------------------------
+# Levels
+# ---------------------------------------------------------------------------
+
+def test_monitored_calls_export_full_detail(make_tracer):
+    tracer, exporter, durations, _ = make_tracer(unmonitored_detail="metrics")
+    run_call(tracer)
+
+    spans = {s.name: s for s in exporter.get_finished_spans()}
+    assert spans["llm"].attributes["gen_ai.prompt.0.content"]
+    assert "voiceeval.detail" not in spans["llm"].attributes
+    assert len(spans["llm"].events) == 1
+    assert durations.histograms == {}
+
+
+def test_timing_detail_strips_content(make_tracer):
+    tracer, exporter, _, _ = make_tracer(unmonitored_detail="timing")
+    run_call(tracer, inside=skip_call)
+
+    spans = {s.name: s for s in exporter.get_finished_spans()}
+    assert dict(spans["llm"].attributes) == {
+        "voiceeval.detail": "timing",
+        "gen_ai.request.model": "gpt-4o",
+        "gen_ai.usage.input_tokens": 42,
+    }
+    assert spans["llm"].events == ()
+    # Root span: late skip_call() is reconciled, and content stripped.
+    assert dict(spans["job_entrypoint"].attributes) == {"voiceeval.detail": "timing"}
+    assert spans["llm"].end_time > spans["llm"].start_time
+
+
+def test_metrics_detail_exports_nothing_and_records_durations(make_tracer):
+    tracer, exporter, durations, _ = make_tracer(sample_rate=0.0, unmonitored_detail="metrics")
+    for _ in range(3):
+        run_call(tracer)
+
+    assert exporter.get_finished_spans() == ()
+    summary = durations.summary()
+    assert set(summary) == {"job_entrypoint", "llm"}
+    assert summary["llm"]["count"] == 3
+    assert summary["llm"]["p50"] > 0
+
+
+def test_sampled_out_call_stays_untagged(make_tracer):
+    tracer, exporter, _, _ = make_tracer(sample_rate=0.0)
+    run_call(tracer)
+
+    spans = exporter.get_finished_spans()
+    assert len(spans) == 2
+    assert all("voiceeval.call_id" not in s.attributes for s in spans)
+
+
+def test_per_call_override(make_tracer):
+    tracer, exporter, durations, _ = make_tracer(auto_monitor=False, unmonitored_detail="metrics")
+    run_call(tracer, before=lambda: set_call_detail("timing"))
+    assert [s.attributes["voiceeval.detail"] for s in exporter.get_finished_spans()] == ["timing", "timing"]
+
+    exporter.clear()
+    set_call_detail(None)
+    run_call(tracer, inside=lambda: skip_call(detail="full"))
+    assert len(exporter.get_finished_spans()) == 2
+    assert all("voiceeval.detail" not in s.attributes for s in exporter.get_finished_spans())
+
+
+def test_monitor_call_in_handler_restores_full_detail(make_tracer):
+    tracer, exporter, durations, _ = make_tracer(auto_monitor=False, unmonitored_detail="metrics")
+    run_call(tracer, inside=monitor_call)
+
+    # Both spans end after monitor_call(): the child starts tagged, the root is reconciled.
+    spans = {s.name: s for s in exporter.get_finished_spans()}
+    assert set(spans) == {"job_entrypoint", "llm"}
+    assert spans["job_entrypoint"].attributes["voiceeval.inputs"] == "secret"
+    assert "voiceeval.call_id" in spans["job_entrypoint"].attributes
+
+
+def test_invalid_levels_rejected():
+    with pytest.raises(ValueError, match="detail level"):
+        set_call_detail("verbose")
+    with pytest.raises(ValueError, match="detail level"):
+        CallIdSpanProcessor(unmonitored_detail="none")
+    with pytest.raises(ValueError, match="detail level"):
+        skip_call(detail="none")
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+def test_client_wraps_batch_processor():
+    with patch("voiceeval.client.Client._validate_api_key"), \
+            patch("voiceeval.client.Client._instrument_libraries"), \
+            patch("opentelemetry.trace.set_tracer_provider") as set_provider:
+        client = Client(api_key="ve_key", unmonitored_detail="timing")
+
+    provider = set_provider.call_args.args[0]
+    processors = provider._active_span_processor._span_processors
+    assert processors[0]._unmonitored_detail == "timing"
+    assert isinstance(processors[1], DetailLevelSpanProcessor)
+    assert processors[1].durations is client.span_durations
+    provider.shutdown()
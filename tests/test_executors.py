@@ -0,0 +1,171 @@
+"""Unit tests for voiceeval.executors — context-propagating executors."""
+
+import asyncio
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from opentelemetry import trace
+
+from voiceeval.context import (
+    CallMetadata,
+    get_agent,
+    get_call_detail,
+    get_call_id,
+    is_monitoring_skipped,
+    set_agent,
+    set_call_detail,
+    set_call_metadata,
+    skip_call,
+)
+from voiceeval.executors import (
+    CallContext,
+    ContextProcessPoolExecutor,
+    ContextThreadPoolExecutor,
+    run_in_executor,
+    wrap,
+)
+
+
+pytestmark = pytest.mark.usefixtures("clean_call_context")
+
+
+@pytest.fixture
+def tracer(make_tracer):
+    tracer, exporter, _, _ = make_tracer()
+    return tracer, exporter
+
+
+def _state():
+    """Call state as seen by the worker; module-level so process pools can pickle it."""
+    span = trace.get_current_span().get_span_context()
+    return get_call_id(), get_agent(), get_call_detail(), is_monitoring_skipped(), span.trace_id, span.span_id
+
+
+@pytest.fixture(scope="module")
+def process_pool():
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        pool.submit(int).result()  # start the worker before any call state is set
+        yield pool
+
+
+# ---------------------------------------------------------------------------
+# Threads
+# ---------------------------------------------------------------------------
+
+class TestThreads:
+    def test_worker_spans_join_the_submitting_call(self, tracer):
+        tracer, exporter = tracer
+
+        def work():
+            with tracer.start_as_current_span("decode_audio"):
+                pass
+
+        with ContextThreadPoolExecutor(max_workers=2) as pool:
+            with tracer.start_as_current_span("job_entrypoint"):
+                pool.submit(work).result()
+            with tracer.start_as_current_span("job_entrypoint"):
+                list(pool.map(lambda _: work(), range(2)))
+
+        spans = exporter.get_finished_spans()
+        roots = [s for s in spans if s.name == "job_entrypoint"]
+        workers = [s for s in spans if s.name == "decode_audio"]
+        assert len(workers) == 3
+        assert workers[0].parent.span_id == roots[0].context.span_id
+        assert workers[0].attributes["voiceeval.call_id"] == roots[0].attributes["voiceeval.call_id"]
+        assert {w.attributes["voiceeval.call_id"] for w in workers[1:]} == {roots[1].attributes["voiceeval.call_id"]}
+
+    def test_plain_thread_pool_loses_the_call(self, tracer):
+        tracer, exporter = tracer
+        with ThreadPoolExecutor(max_workers=1) as pool, tracer.start_as_current_span("job_entrypoint"):
+            call_id = pool.submit(get_call_id).result()
+        assert call_id is None
+
+    def test_skip_and_agent_carry_over(self):
+        set_call_metadata(CallMetadata(call_id="c1"))
+        set_agent("billing")
+        skip_call(detail="timing")
+        with ContextThreadPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(_state).result()[:4] == ("c1", "billing", "timing", True)
+
+    def test_wrap(self):
+        set_call_metadata(CallMetadata(call_id="c1"))
+        wrapped = wrap(get_call_id)
+        set_call_metadata(CallMetadata(call_id="c2"))
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(wrapped())) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == ["c1"] * 3
+        assert wrapped.__name__ == "get_call_id"
+
+
+# ---------------------------------------------------------------------------
+# Processes
+# ---------------------------------------------------------------------------
+
+class TestProcesses:
+    def test_call_context_round_trips_through_pickle(self, tracer):
+        tracer, _ = tracer
+        set_agent("billing")
+        set_call_detail("metrics")
+        with tracer.start_as_current_span("job_entrypoint") as root:
+            captured = CallContext.capture()
+        restored = pickle.loads(pickle.dumps(captured))
+
+        call_id, agent, detail, skipped, trace_id, span_id = restored.run(_state)
+        assert (call_id, agent, detail, skipped) == (root.attributes["voiceeval.call_id"], "billing", "metrics", False)
+        assert (trace_id, span_id) == (root.context.trace_id, root.context.span_id)
+        # The restored span context is detached afterwards.
+        assert trace.get_current_span() is trace.INVALID_SPAN
+
+    def test_context_process_pool(self, tracer):
+        tracer, _ = tracer
+        with ContextProcessPoolExecutor(max_workers=1) as pool:
+            pool.submit(int).result()
+            with tracer.start_as_current_span("job_entrypoint") as root:
+                state = pool.submit(_state).result()
+                mapped = list(pool.map(_state_ignoring, range(2)))
+
+        expected = (root.attributes["voiceeval.call_id"], None, None, False, root.context.trace_id, root.context.span_id)
+        assert state == expected
+        assert mapped == [expected, expected]
+
+    def test_empty_context(self):
+        assert CallContext.capture().run(_state)[:4] == (None, None, None, False)
+
+
+def _state_ignoring(_):
+    return _state()
+
+
+# ---------------------------------------------------------------------------
+# run_in_executor
+# ---------------------------------------------------------------------------
+
+class TestRunInExecutor:
+    @pytest.mark.parametrize("make_pool", [lambda: None, lambda: ThreadPoolExecutor(1), lambda: ContextThreadPoolExecutor(1)])
+    def test_threads(self, make_pool):
+        pool = make_pool()
+
+        async def main():
+            set_call_metadata(CallMetadata(call_id="c1"))
+            return await run_in_executor(pool, _state)
+
+        try:
+            assert asyncio.run(main())[0] == "c1"
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    def test_plain_process_pool(self, process_pool):
+        async def main():
+            set_call_metadata(CallMetadata(call_id="c1"))
+            set_agent("billing")
+            return await run_in_executor(process_pool, _state)
+
+        assert asyncio.run(main())[:2] == ("c1", "billing")
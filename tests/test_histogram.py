@@ -0,0 +1,65 @@
+"""Unit tests for voiceeval.histogram — log-bucketed latency histogram."""
+
+import math
+import random
+
+import pytest
+
+from voiceeval.histogram import LatencyHistogram, merged
+
+
+class TestLatencyHistogram:
+    def test_percentiles_within_relative_error(self):
+        rng = random.Random(0)
+        values = sorted(rng.lognormvariate(-3, 1) for _ in range(20000))
+        hist = LatencyHistogram(relative_error=0.01)
+        hist.record_many(values)
+        for q in (0.5, 0.95, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            assert hist.percentile(q) == pytest.approx(exact, rel=0.03)
+        assert hist.min == values[0] and hist.max == values[-1]
+
+    def test_merge_and_round_trip(self):
+        a, b = LatencyHistogram(), LatencyHistogram()
+        a.record_many([0.1, 0.2])
+        b.record_many([0.3, 0.0])
+        combined = merged([a, b])
+        assert combined.count == 4
+        assert combined.min == 0.0
+        restored = LatencyHistogram.from_dict(combined.to_dict())
+        assert restored.summary() == combined.summary()
+
+    def test_rejects_mismatched_layouts(self):
+        with pytest.raises(ValueError):
+            LatencyHistogram(0.01).merge(LatencyHistogram(0.05))
+
+    def test_empty(self):
+        assert LatencyHistogram().summary()["p99"] == 0.0
+
+    def test_vectorized_record_many_matches_scalar(self):
+        pytest.importorskip("numpy")
+        rng = random.Random(3)
+        values = [rng.lognormvariate(0, 3) for _ in range(5000)] + [0.0, 1e-12]
+        scalar, vectorized = LatencyHistogram(), LatencyHistogram()
+        for value in values:
+            scalar.record(value)
+        vectorized.record_many(values)
+        assert vectorized.counts == scalar.counts
+        assert (vectorized.count, vectorized.min, vectorized.max) == (scalar.count, scalar.min, scalar.max)
+        assert vectorized.total == pytest.approx(scalar.total)
+
+    @pytest.mark.parametrize("value", [math.inf, -math.inf, math.nan])
+    def test_rejects_non_finite_values(self, value):
+        hist = LatencyHistogram()
+        with pytest.raises(ValueError, match="non-finite"):
+            hist.record(value)
+        with pytest.raises(ValueError, match="non-finite"):
+            hist.record_many([0.1, value])
+        assert hist.count == 0
+
+    def test_vectorized_rejects_non_finite_values(self):
+        pytest.importorskip("numpy")
+        hist = LatencyHistogram()
+        with pytest.raises(ValueError, match="non-finite"):
+            hist.record_many([0.1] * 100 + [math.inf])
+        assert hist.count == 0 and hist.counts == {}
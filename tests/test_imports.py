@@ -0,0 +1,90 @@
+"""Unit tests for lazy imports — offline entry points must not load the tracing stack."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Generous ceiling for the offline-only import path on a cold interpreter.
+# Pydantic dominates (~150ms locally); loading the tracing stack on top of it
+# roughly doubles the cost.
+IMPORT_BUDGET_SECONDS = 0.6
+
+HEAVY_PACKAGES = ("opentelemetry", "httpx", "google.protobuf", "numpy")
+
+
+def _import_in_subprocess(statement: str) -> dict:
+    """Run ``statement`` in a fresh interpreter; report loaded modules and import time."""
+    script = (
+        "import sys, time\n"
+        "started = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - started\n"
+        "import json\n"
+        "print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.splitlines()[-1])
+
+
+def _heavy(modules) -> list:
+    return sorted({m for m in modules for pkg in HEAVY_PACKAGES if m == pkg or m.startswith(pkg + ".")})
+
+
+# ---------------------------------------------------------------------------
+# Lazy package namespace
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("statement", [
+    "import voiceeval",
+    "from voiceeval.models import Call",
+    "from voiceeval import Call, CallMetadata, get_call_id",
+    "import voiceeval.runners",
+    "from voiceeval.runners import OfflineRunner, Simulator",
+    "from voiceeval.metrics import SpeakerTimeline, InterruptionRateMetric",
+    "import voiceeval.audio",
+    "from voiceeval.store import CallStore",
+    "from voiceeval.search import TranscriptIndex",
+    "from voiceeval.codecs import iter_calls",
+    "from voiceeval import ContextProcessPoolExecutor, ContextThreadPoolExecutor",
+])
+def test_offline_imports_skip_tracing_stack(statement):
+    result = _import_in_subprocess(statement)
+    assert _heavy(result["modules"]) == []
+
+
+def test_offline_import_within_budget():
+    statement = "from voiceeval.models import Call; from voiceeval.runners import OfflineRunner; import voiceeval.metrics"
+    # Best of three to absorb a cold disk cache or a busy machine.
+    elapsed = min(_import_in_subprocess(statement)["elapsed"] for _ in range(3))
+    assert elapsed < IMPORT_BUDGET_SECONDS
+
+
+def test_client_loads_tracing_stack_on_access():
+    result = _import_in_subprocess("import voiceeval; voiceeval.Client")
+    assert "opentelemetry.sdk.trace" in result["modules"]
+    assert "httpx" in result["modules"]
+
+
+def test_lazy_names_resolve():
+    import voiceeval
+    import voiceeval.audio
+    import voiceeval.metrics
+    import voiceeval.runners
+    from voiceeval.client import Client
+    from voiceeval.runners.simulator import Simulator
+
+    assert voiceeval.Client is Client
+    assert voiceeval.runners.Simulator is Simulator
+    for package in (voiceeval, voiceeval.audio, voiceeval.metrics, voiceeval.runners):
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+            assert name in dir(package)
+
+
+def test_unknown_attribute_raises():
+    import voiceeval
+
+    with pytest.raises(AttributeError, match="no_such_name"):
+        voiceeval.no_such_name
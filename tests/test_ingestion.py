@@ -0,0 +1,212 @@
+"""Unit tests for voiceeval.audio.ingestion — memory-mapped audio ingestion."""
+
+import struct
+import wave
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from voiceeval.audio import AudioFormatError, AudioIngestor, Resampler, Transcriber, VAD
+from voiceeval.models import TranscriptSegment
+
+SR = 16000
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _write_wav(path, samples: "np.ndarray", sample_rate: int = SR):
+    """Write int16 ``(n, channels)`` samples with the stdlib wave module."""
+    if samples.ndim == 1:
+        samples = samples[:, None]
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(samples.shape[1])
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(samples.astype("<i2").tobytes())
+
+
+def _write_float_wav(path, samples: "np.ndarray", sample_rate: int = SR):
+    """Minimal IEEE-float WAV with an extra chunk before ``data``."""
+    data = samples.astype("<f4").tobytes()
+    fmt = struct.pack("<HHIIHH", 3, 1, sample_rate, sample_rate * 4, 4, 32)
+    body = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    body += b"LIST" + struct.pack("<I", 3) + b"abc\x00"  # odd-sized chunk with pad byte
+    body += b"data" + struct.pack("<I", len(data)) + data
+    path.write_bytes(b"RIFF" + struct.pack("<I", len(body)) + body)
+
+
+def _stereo_call(seconds: float = 4.0) -> "np.ndarray":
+    """User speaks in the first half (left), agent in the second half (right)."""
+    n = int(seconds * SR)
+    t = np.arange(n) / SR
+    tone = 0.3 * np.sin(2 * np.pi * 200 * t)
+    rng = np.random.default_rng(0)
+    left = np.where(t < seconds / 2, tone, 0) + rng.normal(0, 0.003, n)
+    right = np.where(t >= seconds / 2, tone, 0) + rng.normal(0, 0.003, n)
+    return (np.stack([left, right], axis=1) * 32767).astype("<i2")
+
+
+class _EchoTranscriber(Transcriber):
+    """Reports one segment per clip with its length in samples."""
+    sample_rate = 8000
+
+    def transcribe(self, audio: bytes):
+        return [TranscriptSegment(speaker="unknown", text=str(len(audio) // 2), timestamp=0.0)]
+
+
+# ---------------------------------------------------------------------------
+# Header parsing and views
+# ---------------------------------------------------------------------------
+
+class TestAudioIngestor:
+    def test_parses_wav_and_reads_payload(self, tmp_path):
+        samples = _stereo_call(1.0)
+        _write_wav(tmp_path / "a.wav", samples)
+        with AudioIngestor(str(tmp_path / "a.wav"), speakers=["user", "agent"]) as ing:
+            assert (ing.sample_rate, ing.channels) == (SR, 2)
+            assert ing.duration == pytest.approx(1.0)
+            assert ing.read() == samples.tobytes()
+            assert np.array_equal(ing.samples(), samples)
+
+    def test_views_do_not_copy(self, tmp_path):
+        _write_wav(tmp_path / "a.wav", _stereo_call(1.0))
+        ing = AudioIngestor(str(tmp_path / "a.wav"))
+        channel = ing.channel(1)
+        assert not channel.flags.owndata
+        assert not channel.flags.c_contiguous  # strided view, not a copy
+        frame = next(ing.arrays(frame_ms=20))
+        assert frame.shape == (320, 2) and not frame.flags.owndata
+        ing.close()
+        # Views outlive close(); the mapping is released once they are collected.
+        assert channel[:5].shape == (5,)
+
+    def test_memoryview_frames(self, tmp_path):
+        samples = _stereo_call(0.05)  # 800 samples
+        _write_wav(tmp_path / "a.wav", samples)
+        with AudioIngestor(str(tmp_path / "a.wav")) as ing:
+            frames = list(ing.frames(frame_ms=20))
+            assert all(isinstance(f, memoryview) for f in frames)
+            assert [len(f) for f in frames] == [1280, 1280, 640]
+            assert b"".join(bytes(f) for f in frames) == samples.tobytes()
+            del frames
+
+    def test_float_wav_and_skipped_chunks(self, tmp_path):
+        samples = np.linspace(-1, 1, 100, dtype=np.float32)
+        _write_float_wav(tmp_path / "f.wav", samples)
+        with AudioIngestor(str(tmp_path / "f.wav")) as ing:
+            assert ing.format.dtype == "<f4"
+            assert np.array_equal(ing.channel(0), samples)
+
+    def test_raw_pcm_requires_sample_rate(self, tmp_path):
+        path = tmp_path / "a.pcm"
+        path.write_bytes(np.arange(10, dtype="<i2").tobytes())
+        with pytest.raises(AudioFormatError):
+            AudioIngestor(str(path))
+        with AudioIngestor(str(path), sample_rate=8000, channels=2) as ing:
+            assert ing.samples().shape == (5, 2)
+
+    def test_rejects_unsupported_wav(self, tmp_path):
+        path = tmp_path / "a.wav"
+        with wave.open(str(path), "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(3)
+            w.setframerate(SR)
+            w.writeframes(b"\x00" * 30)
+        with pytest.raises(AudioFormatError):
+            AudioIngestor(str(path))
+
+    def test_corrupt_header_releases_the_file(self, tmp_path, monkeypatch):
+        import voiceeval.audio.ingestion as ingestion
+
+        opened = []
+
+        def spy(*args, **kwargs):
+            opened.append(open(*args, **kwargs))
+            return opened[-1]
+
+        monkeypatch.setattr(ingestion, "open", spy, raising=False)
+        path = tmp_path / "a.wav"
+        path.write_bytes(b"RIFF" + struct.pack("<I", 100) + b"WAVEfmt \x02\x00")
+        with pytest.raises(AudioFormatError):
+            AudioIngestor(str(path))
+        assert len(opened) == 1 and opened[0].closed
+
+    def test_speaker_count_must_match_channels(self, tmp_path):
+        _write_wav(tmp_path / "a.wav", _stereo_call(0.1))
+        with pytest.raises(ValueError):
+            AudioIngestor(str(tmp_path / "a.wav"), speakers=["only-one"])
+
+
+# ---------------------------------------------------------------------------
+# Resampling
+# ---------------------------------------------------------------------------
+
+class TestResampler:
+    def test_chunked_matches_one_shot(self):
+        signal = np.sin(np.arange(4410) / 10.0).astype(np.float32)
+        whole = Resampler(44100, 16000).process(signal)
+        r = Resampler(44100, 16000)
+        chunked = np.concatenate([r.process(signal[i:i + 333]) for i in range(0, len(signal), 333)])
+        assert len(whole) == len(chunked) == 1600
+        assert np.allclose(whole, chunked, atol=1e-5)
+
+    def test_preserves_low_frequency_signal(self):
+        t = np.arange(8000) / 8000
+        out = Resampler(8000, 16000).process(np.sin(2 * np.pi * 50 * t))
+        expected = np.sin(2 * np.pi * 50 * np.arange(len(out)) / 16000)
+        assert np.allclose(out, expected, atol=1e-2)
+
+    def test_multichannel(self):
+        out = Resampler(16000, 8000).process(np.ones((100, 2)))
+        assert out.shape == (50, 2)
+
+    @pytest.mark.parametrize("dtype, scale, offset", [("<i2", 32768, 0), ("<i4", 2 ** 31, 0), ("u1", 128, 128)])
+    def test_integer_pcm_is_normalized(self, dtype, scale, offset):
+        t = np.arange(8000) / 8000
+        tone = 0.1 * np.sin(2 * np.pi * 50 * t)  # -20 dBFS
+        pcm = (tone * scale + offset).astype(dtype)
+        out = Resampler(8000, 16000).process(pcm)
+        assert out.dtype == np.float32
+        assert np.allclose(out, np.sin(2 * np.pi * 50 * np.arange(len(out)) / 16000) * 0.1, atol=1e-2)
+
+    def test_resampled_frames_match_native_scale(self, tmp_path):
+        _write_wav(tmp_path / "call.wav", _stereo_call(1.0))
+        with AudioIngestor(str(tmp_path / "call.wav"), speakers=["user", "agent"]) as ing:
+            native = np.concatenate([f["user"] for f in ing.speaker_frames()])
+            resampled = np.concatenate([f["user"] for f in ing.speaker_frames(target_rate=8000)])
+        native = native / 32768.0
+        assert np.abs(resampled).max() <= 1.0
+        assert np.sqrt(np.mean(resampled ** 2)) == pytest.approx(np.sqrt(np.mean(native ** 2)), rel=0.05)
+
+
+# ---------------------------------------------------------------------------
+# Consumers
+# ---------------------------------------------------------------------------
+
+class TestConsumers:
+    def test_vad_detects_per_speaker_channels(self, tmp_path):
+        _write_wav(tmp_path / "call.wav", _stereo_call(4.0))
+        with AudioIngestor(str(tmp_path / "call.wav"), speakers=["user", "agent"]) as ing:
+            intervals = VAD().detect_channels(ing)
+        assert list(intervals) == ["user", "agent"]
+        (u0, u1), = intervals["user"]
+        (a0, a1), = intervals["agent"]
+        assert u0 == pytest.approx(0.0, abs=0.05) and u1 == pytest.approx(2.0, abs=0.05)
+        assert a0 == pytest.approx(2.0, abs=0.05) and a1 == pytest.approx(4.0, abs=0.05)
+
+    def test_vad_resamples_to_its_rate(self, tmp_path):
+        _write_wav(tmp_path / "call.wav", _stereo_call(4.0))
+        with AudioIngestor(str(tmp_path / "call.wav")) as ing:
+            intervals = VAD(sample_rate=8000).detect_channels(ing)
+        (a0, a1), = intervals["channel_1"]
+        assert a0 == pytest.approx(2.0, abs=0.05)
+
+    def test_transcriber_labels_channels(self, tmp_path):
+        _write_wav(tmp_path / "call.wav", _stereo_call(1.0))
+        with AudioIngestor(str(tmp_path / "call.wav"), speakers=["user", "agent"]) as ing:
+            segments = _EchoTranscriber().transcribe_ingestor(ing)
+        assert sorted(s.speaker for s in segments) == ["agent", "user"]
+        assert all(s.text == "8000" for s in segments)  # resampled to 8 kHz
@@ -0,0 +1,299 @@
+"""Unit tests for voiceeval.judge — batched LLM-judge engine and conversation metrics."""
+
+import asyncio
+import re
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from voiceeval.cache import DiskCache
+from voiceeval.judge import (
+    Criterion,
+    JudgeEngine,
+    JudgeItem,
+    JudgeResponseError,
+    LocalJudgeBackend,
+    PromptJudgeBackend,
+    render_transcript,
+)
+from voiceeval.judge.backends import parse_scores, render_prompt
+from voiceeval.metrics import SentimentMetric, TopicAdherenceMetric
+from voiceeval.models import Call, Transcript, TranscriptSegment
+from voiceeval.retry import RateLimitError, RateLimiter, retry_async
+from voiceeval.runners import OfflineRunner
+
+CRITERION = Criterion("length", "Score by transcript length.", scale=(0.0, 100.0))
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def make_call(call_id, lines, topic=None):
+    segments = [TranscriptSegment(speaker=speaker, text=text, timestamp=float(i)) for i, (speaker, text) in enumerate(lines)]
+    metadata = {"topic": topic} if topic else {}
+    return Call(
+        call_id=call_id,
+        agent_id="agent",
+        start_time=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        transcript=Transcript(segments=segments, metadata=metadata),
+    )
+
+
+class EchoBackend(PromptJudgeBackend):
+    """Replies with each item's transcript length, parsed back out of the prompt."""
+
+    def __init__(self, max_batch_size=4, drop=(), delay=0.0):
+        self.max_batch_size = max_batch_size
+        self.drop = set(drop)
+        self.delay = delay
+        self.prompts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def complete(self, prompt):
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        blocks = re.findall(r"### Item (\d+)\nTranscript:\n(.*?)(?=\n\n### Item |\Z)", prompt, re.S)
+        scores = {item_id: len(text) for item_id, text in blocks if text not in self.drop}
+        return "Here you go:\n```json\n" + str(scores).replace("'", '"') + "\n```"
+
+
+# ---------------------------------------------------------------------------
+# Prompt packing and parsing
+# ---------------------------------------------------------------------------
+
+def test_render_prompt_includes_every_item():
+    prompt = render_prompt(CRITERION, [JudgeItem("1", "hello"), JudgeItem("2", "bye", context="billing")])
+    assert "Score by transcript length." in prompt
+    assert "### Item 1\nTranscript:\nhello" in prompt
+    assert "### Item 2\nContext: billing\nTranscript:\nbye" in prompt
+
+
+def test_parse_scores_clamps_and_ignores_unknown():
+    reply = 'Sure! {"1": 150, "2": "7.5", "3": 1, "4": "n/a"}'
+    assert parse_scores(reply, CRITERION, ["1", "2", "4"]) == {"1": 100.0, "2": 7.5}
+
+
+def test_parse_scores_rejects_non_json():
+    with pytest.raises(JudgeResponseError):
+        parse_scores("I think it's fine", CRITERION, ["1"])
+
+
+def test_render_transcript_elides_middle():
+    call = make_call("c", [("agent", "a" * 50), ("user", "b" * 50), ("agent", "c" * 50)])
+    text = render_transcript(call, max_chars=40)
+    assert text.startswith("agent: aaa")
+    assert "[...]" in text
+    assert text.endswith("ccc")
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+@pytest.mark.anyio
+async def test_engine_packs_batches_and_preserves_order():
+    backend = EchoBackend(max_batch_size=4)
+    engine = JudgeEngine(backend, concurrency=2)
+    items = [JudgeItem(f"call-{i}", "x" * (i + 1)) for i in range(10)]
+
+    scores = await engine.score_many(CRITERION, items)
+
+    assert scores == [float(i + 1) for i in range(10)]
+    assert engine.stats["requests"] == 3
+    assert len(backend.prompts) == 3
+
+
+@pytest.mark.anyio
+async def test_engine_respects_character_budget():
+    backend = EchoBackend(max_batch_size=10)
+    backend.max_batch_chars = 25
+    engine = JudgeEngine(backend)
+
+    await engine.score_many(CRITERION, [JudgeItem(str(i), f"{i}" * 10) for i in range(6)])
+
+    assert engine.stats["requests"] == 3
+
+
+@pytest.mark.anyio
+async def test_engine_bounds_concurrency():
+    backend = EchoBackend(max_batch_size=1, delay=0.01)
+    engine = JudgeEngine(backend, concurrency=3)
+
+    await engine.score_many(CRITERION, [JudgeItem(str(i), "x" * i) for i in range(12)])
+
+    assert backend.max_in_flight == 3
+
+
+@pytest.mark.anyio
+async def test_engine_deduplicates_and_caches(tmp_path):
+    cache = DiskCache(tmp_path)
+    items = [JudgeItem("a", "same"), JudgeItem("b", "same"), JudgeItem("c", "other")]
+
+    first = JudgeEngine(EchoBackend(), cache=cache)
+    assert await first.score_many(CRITERION, items) == [4.0, 4.0, 5.0]
+    assert first.stats["deduplicated"] == 1
+    assert first.stats["scored"] == 2
+
+    backend = EchoBackend()
+    second = JudgeEngine(backend, cache=cache)
+    assert await second.score_many(CRITERION, items) == [4.0, 4.0, 5.0]
+    assert second.stats["cache_hits"] == 2
+    assert backend.prompts == []
+
+
+def test_cache_key_depends_on_rubric_and_context():
+    engine = JudgeEngine(EchoBackend())
+    item = JudgeItem("a", "text")
+    other_rubric = Criterion("length", "Different rubric.", scale=(0.0, 100.0))
+    assert engine.cache_key(CRITERION, item) != engine.cache_key(other_rubric, item)
+    assert engine.cache_key(CRITERION, item) != engine.cache_key(CRITERION, JudgeItem("a", "text", "topic"))
+    assert engine.cache_key(CRITERION, item) == engine.cache_key(CRITERION, JudgeItem("b", "text"))
+
+
+@pytest.mark.anyio
+async def test_items_missing_from_packed_reply_are_rescored_alone():
+    class Flaky(EchoBackend):
+        async def complete(self, prompt):
+            # Drop "bb" from packed prompts only.
+            self.drop = {"bb"} if prompt.count("### Item") > 1 else set()
+            return await super().complete(prompt)
+
+    backend = Flaky(max_batch_size=3)
+    engine = JudgeEngine(backend)
+
+    assert await engine.score_many(CRITERION, [JudgeItem("1", "a"), JudgeItem("2", "bb"), JudgeItem("3", "ccc")]) == [1.0, 2.0, 3.0]
+    assert engine.stats["rescored"] == 1
+    assert engine.stats["requests"] == 2
+
+
+@pytest.mark.anyio
+async def test_item_never_scored_raises():
+    engine = JudgeEngine(EchoBackend(drop={"bad"}), max_retries=0)
+    with pytest.raises(JudgeResponseError):
+        await engine.score_many(CRITERION, [JudgeItem("1", "bad")])
+
+
+@pytest.mark.anyio
+async def test_rate_limit_honours_retry_after():
+    class Throttled(EchoBackend):
+        calls = 0
+
+        async def complete(self, prompt):
+            self.calls += 1
+            if self.calls == 1:
+                raise RateLimitError(retry_after=0.05)
+            return await super().complete(prompt)
+
+    engine = JudgeEngine(Throttled(), retry_backoff=0.0)
+    started = time.perf_counter()
+    assert await engine.score_many(CRITERION, [JudgeItem("1", "abc")]) == [3.0]
+    assert time.perf_counter() - started >= 0.05
+
+
+def test_unsupported_criterion_fails_fast():
+    engine = JudgeEngine(LocalJudgeBackend())
+    with pytest.raises(ValueError, match="cannot score"):
+        engine.score_many_sync(CRITERION, [JudgeItem("1", "x")])
+
+
+# ---------------------------------------------------------------------------
+# Retry and rate limiting
+# ---------------------------------------------------------------------------
+
+@pytest.mark.anyio
+async def test_rate_limiter_spaces_requests():
+    limiter = RateLimiter(requests_per_minute=1200)  # one per 50ms
+    started = time.perf_counter()
+    for _ in range(4):
+        await limiter.acquire()
+    assert time.perf_counter() - started >= 0.14
+
+
+@pytest.mark.anyio
+async def test_penalize_pauses_all_workers():
+    limiter = RateLimiter()
+    limiter.penalize(0.05)
+    started = time.perf_counter()
+    await asyncio.gather(limiter.acquire(), limiter.acquire())
+    assert time.perf_counter() - started >= 0.05
+
+
+@pytest.mark.anyio
+async def test_retry_async_gives_up_after_max_retries():
+    attempts = []
+
+    async def fail():
+        attempts.append(1)
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        await retry_async(fail, max_retries=2, backoff=0.0)
+    assert len(attempts) == 3
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+def test_local_sentiment_is_deterministic():
+    happy = make_call("h", [("agent", "How can I help?"), ("user", "Great, thanks, that was perfect")])
+    angry = make_call("a", [("agent", "How can I help?"), ("user", "This is terrible and I am frustrated")])
+    metric = SentimentMetric()
+
+    assert metric.evaluate(happy) == 1.0
+    assert metric.evaluate(angry) == -1.0
+    assert metric.evaluate_many([happy, angry, happy]) == [1.0, -1.0, 1.0]
+
+
+def test_topic_adherence_uses_call_topic():
+    call = make_call(
+        "t",
+        [("user", "I need to change my booking"), ("agent", "Sure, which booking?"), ("agent", "Nice weather today")],
+        topic="booking changes",
+    )
+    assert TopicAdherenceMetric().evaluate(call) == pytest.approx(2 / 3)
+    assert TopicAdherenceMetric(topic="weather").evaluate(make_call("w", [("agent", "Nice weather today")])) == 1.0
+
+
+def test_metric_without_transcript_scores_zero():
+    call = Call(call_id="x", agent_id="agent", start_time=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    assert SentimentMetric().evaluate(call) == 0.0
+
+
+@pytest.mark.anyio
+async def test_metrics_inside_event_loop():
+    call = make_call("h", [("user", "Great, thanks")])
+    metric = SentimentMetric()
+
+    assert await metric.aevaluate(call) == 1.0
+    assert await metric.aevaluate_many([call, call]) == [1.0, 1.0]
+    with pytest.raises(RuntimeError, match=r"SentimentMetric.evaluate\(\) .* running event loop; use 'await metric.aevaluate"):
+        metric.evaluate(call)
+    with pytest.raises(RuntimeError, match="await metric.aevaluate_many"):
+        metric.evaluate_many([call])
+    with pytest.raises(RuntimeError, match="await engine.score_many"):
+        metric.engine.score_many_sync(metric.criterion, [])
+
+
+def test_offline_runner_batches_judge_metrics():
+    backend = LocalJudgeBackend()
+    engine = JudgeEngine(backend)
+    calls = [make_call(f"c{i}", [("user", "thanks" if i % 2 else "terrible")]) for i in range(10)]
+    runner = OfflineRunner([SentimentMetric(engine=engine)], batch_size=4)
+
+    results = list(runner.run_stream(calls))
+
+    assert [r["sentiment"] for _, r in results] == [-1.0 if i % 2 == 0 else 1.0 for i in range(10)]
+    assert [c.call_id for c, _ in results] == [f"c{i}" for i in range(10)]
+    # 3 batches of calls, each deduplicated down to two distinct transcripts.
+    assert engine.stats["requests"] == 3
+    assert engine.stats["deduplicated"] == 4
@@ -0,0 +1,163 @@
+"""Unit tests for voiceeval.audio.pipeline — streaming audio-to-metrics pipeline."""
+
+import asyncio
+import wave
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from voiceeval.audio import AudioIngestor, AudioPipeline, BatchTranscriber, TranscriptionBackend
+from voiceeval.metrics import InterruptionRateMetric, SentimentMetric, SilenceDurationMetric
+from voiceeval.models import TranscriptSegment
+
+SR = 16000
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+class ClipLengthBackend(TranscriptionBackend):
+    """Local stand-in STT: one segment per clip whose text is the clip length in ms."""
+    sample_rate = 8000
+    max_batch_size = 4
+
+    def __init__(self, fail: bool = False, delay: float = 0.0):
+        self.fail = fail
+        self.delay = delay
+        self.clip_seconds: list[float] = []
+
+    async def transcribe_batch(self, clips):
+        if self.fail:
+            raise RuntimeError("backend down")
+        await asyncio.sleep(self.delay)
+        out = []
+        for clip in clips:
+            seconds = len(clip) / 2 / self.sample_rate
+            self.clip_seconds.append(seconds)
+            out.append([TranscriptSegment(speaker="?", text=f"{seconds * 1000:.0f}", timestamp=0.1)])
+        return out
+
+
+class PeakBackend(ClipLengthBackend):
+    """Records each clip's samples at 16 kHz."""
+    sample_rate = 16000
+
+    def __init__(self):
+        super().__init__()
+        self.clips: list["np.ndarray"] = []
+
+    async def transcribe_batch(self, clips):
+        self.clips.extend(np.frombuffer(clip, dtype="<i2") for clip in clips)
+        return await super().transcribe_batch(clips)
+
+
+def _call_wav(path, turns, seconds=10.0, sample_rate=SR):
+    """Stereo WAV; ``turns`` is a list of (channel, start, end) voiced regions."""
+    n = int(seconds * sample_rate)
+    t = np.arange(n) / sample_rate
+    rng = np.random.default_rng(0)
+    audio = rng.normal(0, 0.003, (n, 2))
+    for channel, start, end in turns:
+        mask = (t >= start) & (t < end)
+        audio[mask, channel] += 0.3 * np.sin(2 * np.pi * 200 * t[mask])
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes((audio * 32767).astype("<i2").tobytes())
+
+
+TURNS = [(0, 1.0, 3.0), (1, 2.5, 5.0), (0, 6.0, 7.0)]
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+class TestAudioPipeline:
+    @pytest.mark.anyio
+    async def test_transcribes_speech_regions_only(self, tmp_path):
+        _call_wav(tmp_path / "call.wav", TURNS)
+        backend = ClipLengthBackend()
+        pipeline = AudioPipeline(
+            BatchTranscriber(backend, concurrency=2),
+            metrics=[InterruptionRateMetric(), SilenceDurationMetric()],
+            queue_size=2,
+        )
+        with AudioIngestor(str(tmp_path / "call.wav"), speakers=["user", "agent"]) as audio:
+            result = await pipeline.run(audio)
+
+        segments = result.call.transcript.segments
+        assert [s.speaker for s in segments] == ["user", "agent", "user"]
+        assert [s.timestamp for s in segments] == sorted(s.timestamp for s in segments)
+        assert segments[0].timestamp == pytest.approx(1.0, abs=0.1)
+        # Only ~5.5s of 20s of channel audio reach the backend.
+        assert result.speech_ratio == pytest.approx(5.5 / 20, abs=0.05)
+        assert sum(backend.clip_seconds) < 0.4 * result.audio_seconds
+
+        vad = result.call.transcript.metadata["vad_intervals"]
+        assert set(vad) == {"user", "agent"}
+        assert result.metrics["interruption_rate"] == pytest.approx(0.5)
+        assert result.metrics["silence_duration"] == pytest.approx(1.0, abs=0.1)
+
+    @pytest.mark.anyio
+    async def test_reports_stage_stats(self, tmp_path):
+        _call_wav(tmp_path / "call.wav", TURNS)
+        pipeline = AudioPipeline(BatchTranscriber(ClipLengthBackend(delay=0.01)), metrics=[SilenceDurationMetric()])
+        with AudioIngestor(str(tmp_path / "call.wav")) as audio:
+            result = await pipeline.run(audio)
+
+        assert set(result.stats) == {"ingest", "vad", "transcribe", "assemble", "metrics"}
+        assert result.stats["ingest"].items == 100  # 10s at 100ms frames
+        assert result.stats["transcribe"].items == 3
+        assert result.stats["transcribe"].mean_latency >= 0.01
+        assert all(s.throughput > 0 for s in result.stats.values())
+        assert set(result.stats["vad"].as_dict()) >= {"throughput", "mean_latency"}
+
+    @pytest.mark.anyio
+    async def test_backend_failure_cancels_pipeline(self, tmp_path):
+        _call_wav(tmp_path / "call.wav", TURNS)
+        transcriber = BatchTranscriber(ClipLengthBackend(fail=True), max_retries=0)
+        with AudioIngestor(str(tmp_path / "call.wav")) as audio:
+            with pytest.raises(RuntimeError, match="backend down"):
+                await AudioPipeline(transcriber, queue_size=1).run(audio)
+
+    @pytest.mark.anyio
+    async def test_resamples_8khz_recordings(self, tmp_path):
+        _call_wav(tmp_path / "call.wav", TURNS, sample_rate=8000)
+        backend = PeakBackend()
+        with AudioIngestor(str(tmp_path / "call.wav"), speakers=["user", "agent"]) as audio:
+            result = await AudioPipeline(BatchTranscriber(backend)).run(audio)
+
+        vad = result.call.transcript.metadata["vad_intervals"]
+        for (start, end), expected in zip(vad["user"] + vad["agent"], [(1.0, 3.0), (6.0, 7.0), (2.5, 5.0)]):
+            assert start == pytest.approx(expected[0], abs=0.1) and end == pytest.approx(expected[1], abs=0.1)
+        assert len(vad["user"]) == 2 and len(vad["agent"]) == 1
+        # Clips reach the backend at its rate and at the recording's level (0.3 peak), unclipped.
+        assert len(backend.clips) == 3
+        for clip in backend.clips:
+            assert np.mean(np.abs(clip) >= 32767) < 0.001
+            assert np.abs(clip).max() / 32768 == pytest.approx(0.3, abs=0.03)
+
+    @pytest.mark.anyio
+    async def test_judge_metrics_inside_the_event_loop(self, tmp_path):
+        _call_wav(tmp_path / "call.wav", TURNS)
+        pipeline = AudioPipeline(BatchTranscriber(ClipLengthBackend()), metrics=[SentimentMetric()])
+        with AudioIngestor(str(tmp_path / "call.wav"), speakers=["user", "agent"]) as audio:
+            result = await pipeline.run(audio)
+        assert -1.0 <= result.metrics["sentiment"] <= 1.0
+
+    def test_run_sync_with_silence(self, tmp_path):
+        _call_wav(tmp_path / "call.wav", [], seconds=2.0)
+        backend = ClipLengthBackend()
+        with AudioIngestor(str(tmp_path / "call.wav")) as audio:
+            result = AudioPipeline(BatchTranscriber(backend)).run_sync(audio)
+        assert result.call.transcript.segments == []
+        assert backend.clip_seconds == []
@@ -0,0 +1,233 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from voiceeval import AgentProfile, Client, agent_scope, set_agent
+from voiceeval.observability.profiles import ProfileRouter
+
+pytestmark = pytest.mark.usefixtures("clean_call_context")
+
+
+@pytest.fixture
+def router():
+    router = ProfileRouter("default", schedule_delay_millis=60_000)
+    exporters = {}
+    for profile in (AgentProfile("default"), AgentProfile("billing"), AgentProfile("support", sample_rate=0.0)):
+        exporters[profile.name] = InMemorySpanExporter()
+        router.add_profile(profile, exporters[profile.name])
+    provider = TracerProvider()
+    provider.add_span_processor(router)
+    yield provider.get_tracer("test"), router, exporters
+    router.shutdown()
+
+
+def names(exporter):
+    return sorted(span.name for span in exporter.get_finished_spans())
+
+
+# ---------------------------------------------------------------------------
+# Routing
+# ---------------------------------------------------------------------------
+
+def test_spans_route_by_agent_scope(router):
+    tracer, router, exporters = router
+    with agent_scope("billing"):
+        with tracer.start_as_current_span("charge"):
+            pass
+    with agent_scope("unknown"):
+        with tracer.start_as_current_span("fallback"):
+            pass
+    with tracer.start_as_current_span("unscoped"):
+        pass
+
+    assert router.force_flush()
+    assert names(exporters["billing"]) == ["charge"]
+    assert names(exporters["default"]) == ["fallback", "unscoped"]
+    assert names(exporters["support"]) == []
+    (charge,) = exporters["billing"].get_finished_spans()
+    assert charge.attributes["voiceeval.agent_name"] == "billing"
+    assert "voiceeval.call_id" in charge.attributes
+
+
+def test_profile_sampling_is_independent(router):
+    tracer, router, exporters = router
+    with agent_scope("support"):
+        with tracer.start_as_current_span("job_entrypoint"):
+            pass
+    with agent_scope("billing"):
+        with tracer.start_as_current_span("job_entrypoint"):
+            pass
+
+    router.force_flush()
+    # sample_rate=0: exported, but the call is not tagged for evaluation.
+    (skipped,) = exporters["support"].get_finished_spans()
+    assert "voiceeval.call_id" not in skipped.attributes
+    (monitored,) = exporters["billing"].get_finished_spans()
+    assert "voiceeval.call_id" in monitored.attributes
+
+
+def test_root_span_follows_agent_set_inside_handler(router):
+    tracer, router, exporters = router
+    with tracer.start_as_current_span("job_entrypoint"):
+        set_agent("billing")
+        with tracer.start_as_current_span("llm"):
+            pass
+
+    router.force_flush()
+    assert names(exporters["billing"]) == ["job_entrypoint", "llm"]
+    assert names(exporters["default"]) == []
+    root = next(s for s in exporters["billing"].get_finished_spans() if s.name == "job_entrypoint")
+    assert root.attributes["voiceeval.agent_name"] == "billing"
+
+
+def test_unended_spans_leave_no_router_state(router):
+    tracer, router, exporters = router
+    sizes = {name: len(value) for name, value in vars(router).items() if isinstance(value, dict)}
+    with agent_scope("billing"):
+        for _ in range(100):
+            tracer.start_span("abandoned")
+    assert {name: len(value) for name, value in vars(router).items() if isinstance(value, dict)} == sizes
+
+
+def test_concurrent_threads_keep_their_agent(router):
+    tracer, router, exporters = router
+
+    def work(agent):
+        with agent_scope(agent):
+            for _ in range(50):
+                with tracer.start_as_current_span(agent):
+                    pass
+
+    threads = [threading.Thread(target=work, args=(agent,)) for agent in ("billing", "default") * 4]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    router.force_flush()
+    for agent in ("billing", "default"):
+        spans = exporters[agent].get_finished_spans()
+        assert len(spans) == 200
+        assert {span.name for span in spans} == {agent}
+
+
+def test_profile_detail_level_applies_before_queueing():
+    router = ProfileRouter("default", schedule_delay_millis=60_000)
+    full, quiet = InMemorySpanExporter(), InMemorySpanExporter()
+    router.add_profile(AgentProfile("default"), full)
+    router.add_profile(AgentProfile("quiet", sample_rate=0.0, unmonitored_detail="metrics"), quiet)
+    provider = TracerProvider()
+    provider.add_span_processor(router)
+    tracer = provider.get_tracer("test")
+
+    for agent in ("default", "quiet"):
+        with agent_scope(agent):
+            with tracer.start_as_current_span("job_entrypoint"):
+                pass
+
+    router.shutdown()
+    assert len(full.get_finished_spans()) == 1
+    assert quiet.get_finished_spans() == ()
+    assert router.durations.summary()["job_entrypoint"]["count"] == 1
+
+
+# ---------------------------------------------------------------------------
+# Queues and export thread
+# ---------------------------------------------------------------------------
+
+def test_full_queue_drops_only_that_profile():
+    router = ProfileRouter("default", schedule_delay_millis=60_000)
+    small, other = InMemorySpanExporter(), InMemorySpanExporter()
+    router.add_profile(AgentProfile("default", max_queue_size=2), small)
+    router.add_profile(AgentProfile("other"), other)
+    tracer = TracerProvider()
+    tracer.add_span_processor(router)
+    tracer = tracer.get_tracer("test")
+
+    for _ in range(5):
+        with tracer.start_as_current_span("a"):
+            pass
+    with agent_scope("other"):
+        with tracer.start_as_current_span("b"):
+            pass
+
+    router.shutdown()
+    assert len(small.get_finished_spans()) == 2
+    assert router.dropped("default") == 3
+    assert len(other.get_finished_spans()) == 1
+
+
+def test_one_export_thread_and_full_batch_wakes_it():
+    before = sum(t.name == "VoiceEvalExport" for t in threading.enumerate())
+    router = ProfileRouter("default", schedule_delay_millis=60_000, max_export_batch_size=4)
+    exporters = [InMemorySpanExporter() for _ in range(3)]
+    for i, exporter in enumerate(exporters):
+        router.add_profile(AgentProfile("default" if i == 0 else f"agent-{i}"), exporter)
+    assert sum(t.name == "VoiceEvalExport" for t in threading.enumerate()) == before + 1
+
+    tracer = TracerProvider()
+    tracer.add_span_processor(router)
+    tracer = tracer.get_tracer("test")
+    with agent_scope("agent-2"):
+        for _ in range(4):
+            with tracer.start_as_current_span("s"):
+                pass
+
+    for _ in range(200):
+        if exporters[2].get_finished_spans():
+            break
+        threading.Event().wait(0.01)
+    assert len(exporters[2].get_finished_spans()) == 4
+    router.shutdown()
+
+
+def test_duplicate_profile_rejected():
+    router = ProfileRouter("default")
+    router.add_profile(AgentProfile("default"), InMemorySpanExporter())
+    with pytest.raises(ValueError, match="Duplicate"):
+        router.add_profile(AgentProfile("default"), InMemorySpanExporter())
+    router.shutdown()
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+def test_client_builds_profile_exporters_on_shared_session():
+    with patch("voiceeval.client.OTLPSpanExporter") as MockExporter, \
+            patch("voiceeval.client.Client._validate_api_key") as validate, \
+            patch("voiceeval.client.Client._instrument_libraries"), \
+            patch("opentelemetry.trace.set_tracer_provider"):
+        client = Client(
+            api_key="ve_main",
+            agent_name="main",
+            profiles=[AgentProfile("billing", api_key="ve_tenant", base_url="https://eu.example/v1/traces")],
+        )
+        client.add_profile(AgentProfile("support"))
+
+        calls = MockExporter.call_args_list
+        assert [c.kwargs["endpoint"] for c in calls] == [
+            "https://api.voiceeval.com/v1/traces",
+            "https://eu.example/v1/traces",
+            "https://api.voiceeval.com/v1/traces",
+        ]
+        assert [c.kwargs["headers"]["Authorization"] for c in calls] == [
+            "Bearer ve_main", "Bearer ve_tenant", "Bearer ve_main",
+        ]
+        assert len({id(c.kwargs["session"]) for c in calls}) == 1
+        # The Client's key, then the billing tenant's; support reuses the Client's.
+        assert [c.args for c in validate.call_args_list] == [(), ("ve_tenant", "https://eu.example/v1/traces")]
+        assert [p.name for p in client._router.profiles] == ["main", "billing", "support"]
+        client._router.shutdown()
+
+
+def test_add_profile_requires_profiles_mode():
+    with patch("voiceeval.client.Client._validate_api_key"), \
+            patch("voiceeval.client.Client._instrument_libraries"), \
+            patch("opentelemetry.trace.set_tracer_provider"):
+        client = Client(api_key="ve_main")
+        with pytest.raises(ValueError, match="profiles"):
+            client.add_profile(AgentProfile("late"))
@@ -0,0 +1,187 @@
+"""Unit tests for voiceeval.search — on-disk transcript index."""
+
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from voiceeval.codecs import CodecError
+from voiceeval.metrics.base import BaseMetric
+from voiceeval.models import Call, Transcript, TranscriptSegment
+from voiceeval.runners import OfflineRunner
+from voiceeval.search import SegmentHit, TranscriptIndex, parse_query, tokenize
+from voiceeval.store import CallStore
+
+NOW = datetime(2026, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _call(call_id: str, *turns) -> Call:
+    """``turns`` are ``(speaker, text, start_seconds)``; each lasts one second."""
+    return Call(
+        call_id=call_id,
+        agent_id="agent-a",
+        start_time=NOW,
+        transcript=Transcript(segments=[
+            TranscriptSegment(speaker=speaker, text=text, timestamp=start, end_timestamp=start + 1.0)
+            for speaker, text, start in turns
+        ]),
+    )
+
+
+CALLS = [
+    _call("c1", ("user", "Hi, I want to cancel my order.", 0.5), ("agent", "Sure, cancelling it now.", 2.25)),
+    _call("c2", ("user", "Please transfer me to a human agent", 1.0), ("agent", "Transferring you.", 3.0)),
+    _call("c3", ("user", "Cancel the order and refund me", 0.0), ("user", "I don't want it", 4.0)),
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    with TranscriptIndex(tmp_path / "index") as ix:
+        ix.add_calls(CALLS)
+        yield ix
+
+
+class _CountingMetric(BaseMetric):
+    def __init__(self):
+        self.seen = []
+
+    @property
+    def name(self) -> str:
+        return "counted"
+
+    def evaluate(self, call: Call) -> float:
+        self.seen.append(call.call_id)
+        return 1.0
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+class TestSearch:
+    def test_phrase_returns_segments_in_ms(self, index):
+        hits = index.search('"cancel my order"')
+        assert [h.call_id for h in hits] == ["c1"]
+        assert hits[0].segments == [SegmentHit(segment=0, speaker="user", start_ms=500, end_ms=1500)]
+
+    def test_phrase_needs_consecutive_words(self, index):
+        assert index.search_ids('"cancel order"') == []
+        assert index.search_ids("cancel order") == ["c1", "c3"]
+
+    def test_boolean_operators(self, index):
+        assert index.search_ids("cancel AND refund") == ["c3"]
+        assert index.search_ids("refund OR transfer") == ["c2", "c3"]
+        assert index.search_ids("cancel AND NOT refund") == ["c1"]
+        assert index.search_ids("NOT cancel") == ["c2"]
+        assert index.search_ids('("talk to a human" OR "to a human") AND NOT cancel') == ["c2"]
+
+    def test_boolean_hits_collect_positive_segments(self, index):
+        (hit,) = index.search("refund OR don't")
+        assert hit.call_id == "c3"
+        assert [s.start_ms for s in hit.segments] == [0, 4000]
+
+    def test_prefix_and_case(self, index):
+        assert index.search_ids("TRANSFER*") == ["c2"]
+        hit = index.search("cancel*")[0]
+        assert [s.speaker for s in hit.segments] == ["user", "agent"]
+
+    def test_speaker_filter(self, index):
+        assert index.search_ids("cancel*", speaker="agent") == ["c1"]
+        assert index.search_ids("human", speaker="agent") == []
+        assert index.search_ids("human", speaker="nobody") == []
+
+    def test_limit(self, index):
+        assert [h.call_id for h in index.search("cancel", limit=1)] == ["c1"]
+
+    @pytest.mark.parametrize("query", ["", "AND cancel", "(cancel", "cancel)", '""', "!!"])
+    def test_invalid_queries(self, query):
+        with pytest.raises(ValueError):
+            parse_query(query)
+
+    def test_tokenize(self):
+        assert tokenize("I DON’T want it, 2 times!") == ["i", "don't", "want", "it", "2", "times"]
+
+
+# ---------------------------------------------------------------------------
+# Updates and persistence
+# ---------------------------------------------------------------------------
+
+class TestUpdates:
+    def test_reopen_uses_memory_mapped_files(self, index, tmp_path):
+        index.close()
+        with TranscriptIndex(tmp_path / "index") as reopened:
+            assert len(reopened) == 3
+            assert reopened.search_ids('"transfer me"') == ["c2"]
+
+    def test_re_adding_a_call_replaces_it(self, index):
+        index.add_calls([_call("c1", ("user", "Where is my parcel?", 0.0))])
+        assert index.search_ids("cancel") == ["c3"]
+        assert index.search_ids("parcel") == ["c1"]
+        assert len(index) == 3
+
+    def test_remove_calls(self, index):
+        assert index.remove_calls(["c3", "missing"]) == 1
+        assert "c3" not in index
+        assert index.search_ids("cancel") == ["c1"]
+        assert index.search_ids("NOT transfer") == ["c1"]
+
+    def test_compact_merges_files(self, index, tmp_path):
+        index.add_calls([_call("c4", ("user", "cancel cancel", 0.0))])
+        index.add_calls([_call("c1", ("user", "never mind", 0.0))])
+        index.remove_calls(["c2"])
+        before = {q: index.search(q) for q in ("cancel", '"never mind"', "human", "NOT refund")}
+
+        index.compact()
+        files = [f for f in os.listdir(tmp_path / "index") if f.endswith(".vidx")]
+        assert len(files) == 1
+        assert {q: index.search(q) for q in before} == before
+        with TranscriptIndex(tmp_path / "index") as reopened:
+            assert reopened.search_ids("cancel") == ["c3", "c4"]
+
+    def test_batches_write_separate_files(self, tmp_path):
+        with TranscriptIndex(tmp_path / "index", batch_size=2) as ix:
+            assert ix.add_calls(iter(CALLS)) == 3
+            assert len([f for f in os.listdir(ix.path) if f.endswith(".vidx")]) == 2
+            assert ix.search_ids("cancel") == ["c1", "c3"]
+
+    def test_corrupt_segment(self, tmp_path):
+        with TranscriptIndex(tmp_path / "index") as ix:
+            ix.add_calls(CALLS[:1])
+            (name,) = [f for f in os.listdir(ix.path) if f.endswith(".vidx")]
+        with open(tmp_path / "index" / name, "r+b") as f:
+            f.write(b"garbage!")
+        with pytest.raises(CodecError):
+            TranscriptIndex(tmp_path / "index")
+
+
+# ---------------------------------------------------------------------------
+# Store and runner integration
+# ---------------------------------------------------------------------------
+
+class TestStoreIntegration:
+    def test_add_from_store_is_incremental(self, tmp_path):
+        with CallStore(batch_size=2) as store, TranscriptIndex(tmp_path / "index") as ix:
+            store.add_calls(CALLS[:2])
+            assert ix.add_from_store(store) == 2
+            assert ix.add_from_store(store) == 0
+            store.add_calls(CALLS[2:])
+            assert ix.add_from_store(store) == 1
+            assert ix.search_ids("cancel") == ["c1", "c3"]
+
+    def test_runner_evaluates_only_matching_calls(self, index):
+        metric = _CountingMetric()
+        with CallStore() as store:
+            store.add_calls(CALLS)
+            results = list(OfflineRunner([metric]).run_search(store, index, "cancel AND NOT refund"))
+        assert [call.call_id for call, _ in results] == ["c1"]
+        assert metric.seen == ["c1"]
+
+    def test_get_calls_keeps_order_and_skips_unknown(self):
+        with CallStore(batch_size=2) as store:
+            store.add_calls(CALLS)
+            assert [c.call_id for c in store.get_calls(["c3", "missing", "c1", "c2"])] == ["c3", "c1", "c2"]
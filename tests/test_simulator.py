@@ -0,0 +1,119 @@
+"""Unit tests for voiceeval.runners.simulator — concurrent load generation."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from voiceeval.context import get_call_id
+from voiceeval.runners import HTTPTransport, InProcessTransport, Simulator
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+# ---------------------------------------------------------------------------
+# Fake agent
+# ---------------------------------------------------------------------------
+
+class FakeAgent:
+    """In-process agent that records concurrency and the call_id it sees."""
+
+    def __init__(self, delay: float = 0.0, fail_on: str = ""):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.active = 0
+        self.max_active = 0
+        self.seen: list[tuple[str, str]] = []
+
+    async def __call__(self, call_id: str, message: str) -> str:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            self.seen.append((call_id, get_call_id()))
+            if message == self.fail_on:
+                raise RuntimeError("agent crashed")
+            return message.upper()
+        finally:
+            self.active -= 1
+
+
+# ---------------------------------------------------------------------------
+# Simulator
+# ---------------------------------------------------------------------------
+
+class TestSimulator:
+    @pytest.mark.anyio
+    async def test_runs_concurrent_calls(self):
+        agent = FakeAgent(delay=0.01)
+        sim = Simulator(InProcessTransport(agent), scripts=[["hi", "book", "bye"]], concurrency=20, total_calls=40)
+        report = await sim.run()
+
+        assert len(report.calls) == 40
+        assert report.calls_completed == 40
+        assert report.turns == 120
+        assert agent.max_active == 20
+        assert report.error_rate == 0.0
+        assert report.turn_latency.percentile(0.5) >= 0.01
+        assert report.turns_per_second > 0
+
+    @pytest.mark.anyio
+    async def test_each_call_has_its_own_call_id_in_context(self):
+        agent = FakeAgent()
+        report = await Simulator(InProcessTransport(agent), scripts=[["a", "b"]], concurrency=5).run()
+        call_ids = {call.call_id for call in report.calls}
+        assert len(call_ids) == 5
+        # The agent sees the simulated call's id both as argument and in context.
+        assert all(arg == ctx for arg, ctx in agent.seen)
+        assert {arg for arg, _ in agent.seen} == call_ids
+
+    @pytest.mark.anyio
+    async def test_records_errors(self):
+        agent = FakeAgent(fail_on="boom")
+        sim = Simulator(InProcessTransport(agent), scripts=[["ok", "boom", "never"], ["ok"]], total_calls=4, concurrency=2)
+        report = await sim.run()
+        assert report.calls_failed == 2
+        assert report.errors == {"RuntimeError": 2}
+        assert report.error_rate == pytest.approx(2 / 6)
+        assert all(c.turns == 1 for c in report.calls if c.error)
+
+    @pytest.mark.anyio
+    async def test_turn_timeout(self):
+        sim = Simulator(InProcessTransport(FakeAgent(delay=1.0)), turn_timeout=0.01)
+        report = await sim.run()
+        assert report.errors == {"TimeoutError": 1}
+
+    @pytest.mark.anyio
+    async def test_ramp_up_and_think_time(self):
+        sim = Simulator(InProcessTransport(FakeAgent()), scripts=[["a", "b"]], concurrency=4, ramp_up=0.08, think_time=(0.01, 0.02), seed=1)
+        report = await sim.run()
+        assert report.wall_seconds >= 0.06  # last worker starts at 3/4 of ramp_up
+        assert report.calls_completed == 4
+        assert all(call.duration >= 0.01 for call in report.calls)
+
+    @pytest.mark.anyio
+    async def test_http_transport_sends_call_id(self):
+        received = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = request.read()
+            received.append((request.headers["X-VoiceEval-Call-Id"], body))
+            return httpx.Response(200, json={"reply": "ok"})
+
+        transport = HTTPTransport("http://agent.local/turn")
+        transport._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        assert await transport.send("call-1", "hello") == "ok"
+        await transport.stop()
+        assert received[0][0] == "call-1"
+        assert b'"call_id":"call-1"' in received[0][1].replace(b" ", b"")
+
+    def test_summary_is_serializable(self):
+        import json
+
+        sim = Simulator(InProcessTransport(lambda call_id, message: "hi"), total_calls=3)
+        summary = asyncio.run(sim.run()).summary()
+        json.dumps(summary)
+        assert set(summary["latency"]) >= {"p50", "p95", "p99"}
@@ -0,0 +1,159 @@
+"""Unit tests for voiceeval.store — SQLite-backed call store."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from voiceeval.metrics.base import BaseMetric
+from voiceeval.models import Call
+from voiceeval.runners import OfflineRunner
+from voiceeval.store import CallStore
+
+NOW = datetime(2026, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _call(call_id: str, agent_id: str = "agent-a", hours_ago: float = 1.0, **metrics) -> Call:
+    return Call(
+        call_id=call_id,
+        agent_id=agent_id,
+        start_time=NOW - timedelta(hours=hours_ago),
+        metrics=metrics,
+    )
+
+
+class _CountingMetric(BaseMetric):
+    def __init__(self):
+        self.seen: list[str] = []
+
+    @property
+    def name(self) -> str:
+        return "counted"
+
+    def evaluate(self, call: Call) -> float:
+        self.seen.append(call.call_id)
+        return 1.0
+
+
+@pytest.fixture
+def store():
+    with CallStore(batch_size=2) as s:
+        yield s
+
+
+# ---------------------------------------------------------------------------
+# Writes and lookups
+# ---------------------------------------------------------------------------
+
+class TestCallStore:
+    def test_add_and_get(self, store):
+        call = _call("c1", e2e_latency=1.5)
+        store.add_call(call)
+        assert len(store) == 1
+        assert store.get_call("c1") == call
+        assert store.get_call("missing") is None
+        assert store.get_results("c1") == {"e2e_latency": 1.5}
+
+    def test_bulk_insert_spans_batches(self, store):
+        assert store.add_calls(_call(f"c{i}") for i in range(5)) == 5
+        assert len(store) == 5
+
+    def test_readding_replaces_call(self, store):
+        store.add_call(_call("c1", agent_id="old"))
+        store.add_call(_call("c1", agent_id="new"))
+        assert len(store) == 1
+        assert store.get_call("c1").agent_id == "new"
+
+    def test_readding_drops_stale_metric_values(self, store):
+        store.add_call(_call("c1", e2e_latency=3.0, ttfb=1.0))
+        store.save_results("c1", {"sentiment": 0.5})
+        store.add_call(_call("c1", e2e_latency=0.5))
+        assert store.get_results("c1") == {"e2e_latency": 0.5}
+        assert store.query_ids(metric_min={"ttfb": 0.0}) == []
+
+    def test_nan_metrics_are_skipped(self, store):
+        store.add_calls([_call("c1", e2e_latency=float("nan"), ttfb=0.2), _call("c2", e2e_latency=1.0)])
+        store.save_results("c2", {"sentiment": float("nan")})
+        assert store.get_results("c1") == {"ttfb": 0.2}
+        assert store.get_results("c2") == {"e2e_latency": 1.0}
+
+    def test_non_numeric_metrics_are_not_indexed(self, store):
+        store.add_call(_call("c1", label="ok", flag=True, score=2))
+        assert store.get_results("c1") == {"score": 2.0}
+
+    def test_persists_to_disk(self, tmp_path):
+        path = tmp_path / "calls.db"
+        with CallStore(path) as s:
+            s.add_call(_call("c1"))
+        with CallStore(path) as s:
+            assert s.get_call("c1").call_id == "c1"
+
+
+class TestQuery:
+    def test_filters_by_agent_time_and_metric(self, store):
+        store.add_calls([
+            _call("slow", hours_ago=2, e2e_latency=3.0),
+            _call("fast", hours_ago=3, e2e_latency=0.5),
+            _call("old", hours_ago=48, e2e_latency=5.0),
+            _call("other", agent_id="agent-b", hours_ago=1, e2e_latency=4.0),
+            _call("unscored", hours_ago=1),
+        ])
+        ids = store.query_ids(
+            agent_id="agent-a",
+            start=NOW - timedelta(hours=24),
+            metric_min={"e2e_latency": 2.0},
+        )
+        assert ids == ["slow"]
+
+    def test_results_are_ordered_by_start_time(self, store):
+        store.add_calls([_call("b", hours_ago=1), _call("a", hours_ago=2)])
+        assert [c.call_id for c in store.query()] == ["a", "b"]
+
+    def test_metric_range_and_limit(self, store):
+        store.add_calls(_call(f"c{i}", hours_ago=10 - i, ttfb=float(i)) for i in range(6))
+        calls = list(store.query(metric_min={"ttfb": 1.0}, metric_max={"ttfb": 4.0}, limit=2))
+        assert [c.call_id for c in calls] == ["c1", "c2"]
+
+    def test_saved_results_are_queryable(self, store):
+        store.add_calls([_call("c1"), _call("c2")])
+        store.save_results("c2", {"interruption_rate": 0.4})
+        assert store.query_ids(metric_min={"interruption_rate": 0.1}) == ["c2"]
+
+
+# ---------------------------------------------------------------------------
+# Incremental runner
+# ---------------------------------------------------------------------------
+
+class TestIncrementalRunner:
+    def test_evaluates_only_new_calls(self, store):
+        metric = _CountingMetric()
+        runner = OfflineRunner([metric])
+
+        store.add_calls(_call(f"c{i}") for i in range(3))
+        assert runner.run_incremental(store) == 3
+        assert runner.run_incremental(store) == 0
+
+        store.add_call(_call("c3"))
+        assert runner.run_incremental(store) == 1
+        assert metric.seen == ["c0", "c1", "c2", "c3"]
+        assert store.get_results("c3") == {"counted": 1.0}
+
+    def test_replaced_call_is_reevaluated(self, store):
+        metric = _CountingMetric()
+        runner = OfflineRunner([metric])
+        store.add_calls([_call("c0"), _call("c1")])
+        runner.run_incremental(store)
+
+        store.add_call(_call("c0"))
+        assert runner.run_incremental(store) == 1
+        assert metric.seen[-1] == "c0"
+
+    def test_consumers_have_independent_watermarks(self, store):
+        store.add_calls(_call(f"c{i}") for i in range(2))
+        OfflineRunner([_CountingMetric()]).run_incremental(store, consumer="a")
+        assert store.get_watermark("a") > 0
+        assert store.get_watermark("b") == 0
+        assert OfflineRunner([_CountingMetric()]).run_incremental(store, consumer="b") == 2
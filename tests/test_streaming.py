@@ -0,0 +1,231 @@
+"""Unit tests for voiceeval.observability.streaming — streaming-response timing."""
+
+import time
+from types import SimpleNamespace as NS
+from unittest.mock import patch
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from voiceeval.observability.streaming import (
+    ITL_BUCKETS,
+    StreamTimer,
+    instrument_streaming,
+    patch_stream_method,
+    time_stream,
+)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def exporter():
+    provider = TracerProvider()
+    exporter = InMemorySpanExporter()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    with patch("voiceeval.observability.instrumentation.tracer", provider.get_tracer("test")):
+        yield exporter
+
+
+def openai_chunks(texts, usage=None):
+    chunks = [NS(choices=[NS(delta=NS(content=None, tool_calls=None, role="assistant"))], usage=None)]
+    chunks += [NS(choices=[NS(delta=NS(content=t, tool_calls=None))], usage=None) for t in texts]
+    if usage:
+        chunks.append(NS(choices=[], usage=NS(prompt_tokens=usage[0], completion_tokens=usage[1])))
+    return chunks
+
+
+def anthropic_events(texts, input_tokens=7, output_tokens=3):
+    return [
+        NS(type="message_start", message=NS(usage=NS(input_tokens=input_tokens))),
+        NS(type="content_block_start"),
+        *(NS(type="content_block_delta", delta=NS(text=t)) for t in texts),
+        NS(type="content_block_stop"),
+        NS(type="message_delta", usage=NS(output_tokens=output_tokens)),
+        NS(type="message_stop"),
+    ]
+
+
+def gemini_chunks(texts):
+    return [
+        NS(candidates=[NS(content=NS(parts=[NS(text=t)]))], usage_metadata=NS(prompt_token_count=5, candidates_token_count=i + 1))
+        for i, t in enumerate(texts)
+    ]
+
+
+def slow(chunks, delay):
+    for chunk in chunks:
+        time.sleep(delay)
+        yield chunk
+
+
+# ---------------------------------------------------------------------------
+# Timing attributes
+# ---------------------------------------------------------------------------
+
+def test_openai_stream_records_ttft_itl_and_usage(exporter):
+    chunks = openai_chunks(["a", "b", "c", "d"], usage=(12, 4))
+    received = list(time_stream(slow(chunks, 0.005), "openai"))
+
+    assert received == chunks
+    (span,) = exporter.get_finished_spans()
+    attrs = span.attributes
+    assert span.name == "openai.stream"
+    assert attrs["voiceeval.stream.chunks"] == 4
+    assert attrs["voiceeval.stream.input_tokens"] == 12
+    assert attrs["voiceeval.stream.output_tokens"] == 4
+    # First content chunk is the second item: two sleeps before it.
+    assert attrs["voiceeval.stream.ttft_ms"] >= 9
+    assert attrs["voiceeval.stream.itl_mean_ms"] >= 4
+    assert attrs["voiceeval.stream.itl_max_ms"] >= attrs["voiceeval.stream.itl_p50_ms"] > 0
+    assert attrs["voiceeval.stream.duration_ms"] >= attrs["voiceeval.stream.ttft_ms"]
+    histogram = attrs["voiceeval.stream.itl_histogram"]
+    assert len(histogram) == ITL_BUCKETS
+    assert sum(histogram) == 3
+    assert histogram[0] == 0  # every gap is >= 1ms
+
+
+def test_anthropic_events(exporter):
+    list(time_stream(anthropic_events(["x", "y"]), "anthropic"))
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "anthropic.stream"
+    assert span.attributes["voiceeval.stream.chunks"] == 2
+    assert span.attributes["voiceeval.stream.input_tokens"] == 7
+    assert span.attributes["voiceeval.stream.output_tokens"] == 3
+
+
+def test_gemini_chunks_use_cumulative_usage(exporter):
+    list(time_stream(gemini_chunks(["x", "y", "z"]), "gemini"))
+
+    (span,) = exporter.get_finished_spans()
+    assert span.attributes["voiceeval.stream.chunks"] == 3
+    assert span.attributes["voiceeval.stream.output_tokens"] == 3
+    assert span.attributes["voiceeval.stream.input_tokens"] == 5
+
+
+def test_span_parented_where_request_started(exporter):
+    from voiceeval.observability import instrumentation
+
+    with instrumentation.tracer.start_as_current_span("turn") as parent:
+        stream = time_stream(openai_chunks(["a"]), "openai")
+    list(stream)
+
+    stream_span = next(s for s in exporter.get_finished_spans() if s.name == "openai.stream")
+    assert stream_span.parent.span_id == parent.get_span_context().span_id
+
+
+def test_histogram_is_constant_size(exporter):
+    timer = StreamTimer("other")
+    for chunk in range(10000):
+        timer.observe(chunk)
+    assert timer.chunks == 10000
+    assert len(timer.histogram) == ITL_BUCKETS
+    assert sum(timer.histogram) == 9999
+
+
+def test_error_mid_stream_marks_span(exporter):
+    def broken():
+        yield from openai_chunks(["a"])
+        raise RuntimeError("connection reset")
+
+    with pytest.raises(RuntimeError):
+        list(time_stream(broken(), "openai"))
+
+    (span,) = exporter.get_finished_spans()
+    assert span.status.status_code.name == "ERROR"
+    assert span.attributes["voiceeval.stream.chunks"] == 1
+
+
+def test_close_early_records_once(exporter):
+    class Source:
+        closed = False
+
+        def __iter__(self):
+            return iter(openai_chunks(["a", "b", "c"]))
+
+        def close(self):
+            self.closed = True
+
+    source = Source()
+    with time_stream(source, "openai") as stream:
+        next(stream)
+        next(stream)
+    list(stream)
+
+    assert source.closed
+    (span,) = exporter.get_finished_spans()
+    assert span.attributes["voiceeval.stream.chunks"] == 1
+
+
+def test_proxy_forwards_attributes(exporter):
+    class Source:
+        response = NS(status_code=200)
+
+        def __iter__(self):
+            return iter(openai_chunks(["a"]))
+
+    stream = time_stream(Source(), "openai")
+    assert stream.response.status_code == 200
+    assert stream.timer.provider == "openai"
+
+
+@pytest.mark.anyio
+async def test_async_stream(exporter):
+    async def source():
+        for event in anthropic_events(["x", "y", "z"]):
+            yield event
+
+    received = [event async for event in time_stream(source(), "anthropic")]
+
+    assert len(received) == 8
+    (span,) = exporter.get_finished_spans()
+    assert span.attributes["voiceeval.stream.chunks"] == 3
+
+
+# ---------------------------------------------------------------------------
+# Client patching
+# ---------------------------------------------------------------------------
+
+def test_patch_wraps_only_streaming_calls(exporter):
+    class Completions:
+        def create(self, **kwargs):
+            return iter(openai_chunks(["a", "b"])) if kwargs.get("stream") else "response"
+
+    assert patch_stream_method(Completions, "create", "openai", is_async=False)
+    assert not patch_stream_method(Completions, "create", "openai", is_async=False)
+
+    assert Completions().create(model="m") == "response"
+    assert exporter.get_finished_spans() == ()
+
+    list(Completions().create(model="m", stream=True))
+    (span,) = exporter.get_finished_spans()
+    assert span.attributes["voiceeval.stream.chunks"] == 2
+
+
+@pytest.mark.anyio
+async def test_patch_async_method(exporter):
+    class AsyncMessages:
+        async def create(self, **kwargs):
+            async def events():
+                for event in anthropic_events(["x"]):
+                    yield event
+            return events()
+
+    patch_stream_method(AsyncMessages, "create", "anthropic", is_async=True)
+    stream = await AsyncMessages().create(stream=True)
+    async for _ in stream:
+        pass
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "anthropic.stream"
+
+
+def test_instrument_streaming_skips_missing_sdks():
+    with patch("voiceeval.observability.streaming.import_module", side_effect=ImportError):
+        assert instrument_streaming() == []
@@ -0,0 +1,135 @@
+"""Unit tests for voiceeval.metrics.timeline and the turn-taking voice metrics."""
+
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from voiceeval.metrics import InterruptionRateMetric, SilenceDurationMetric, SpeakerTimeline
+from voiceeval.metrics.timeline import BargeIn, Gap, OverlapInterval
+from voiceeval.models import Call, Transcript, TranscriptSegment
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _seg(speaker, start, end=None, text="..."):
+    return TranscriptSegment(speaker=speaker, text=text, timestamp=start, end_timestamp=end)
+
+
+def _call(*segments) -> Call:
+    return Call(
+        call_id="c1",
+        agent_id="agent",
+        start_time=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        transcript=Transcript(segments=list(segments)),
+    )
+
+
+# ---------------------------------------------------------------------------
+# SpeakerTimeline
+# ---------------------------------------------------------------------------
+
+class TestSpeakerTimeline:
+    def test_merges_and_sorts_intervals(self):
+        timeline = SpeakerTimeline({"a": [(5, 6), (0, 2), (1, 3), (3, 4)], "b": [(2, 2)]})
+        assert timeline.intervals == {"a": [(0, 4), (5, 6)]}
+
+    def test_overlap_and_barge_in(self):
+        timeline = SpeakerTimeline({"user": [(0, 4)], "agent": [(3, 6)]})
+        analysis = timeline.analyze()
+        assert analysis.overlaps == [OverlapInterval(3, 4)]
+        assert analysis.barge_ins == [BargeIn(3, "agent", ("user",))]
+        assert analysis.gaps == []
+        assert analysis.speaker_changes == 1
+
+    def test_touching_intervals_do_not_overlap(self):
+        timeline = SpeakerTimeline({"user": [(0, 2)], "agent": [(2, 4)]})
+        assert timeline.overlaps() == []
+        assert timeline.barge_ins() == []
+        assert timeline.gaps() == []
+
+    def test_three_way_overlap_is_one_interval(self):
+        timeline = SpeakerTimeline({"a": [(0, 10)], "b": [(2, 5)], "c": [(4, 8)]})
+        assert timeline.overlaps() == [OverlapInterval(2, 8)]
+        assert [b.speaker for b in timeline.barge_ins()] == ["b", "c"]
+
+    def test_gaps_distinguish_turns_from_pauses(self):
+        timeline = SpeakerTimeline({"user": [(0, 1), (1.5, 2)], "agent": [(3, 4)]})
+        assert timeline.gaps() == [Gap(1, 1.5, "user", "user"), Gap(2, 3, "user", "agent")]
+
+        stats = timeline.silence_stats()
+        assert stats.count == 2
+        assert stats.total == pytest.approx(1.5)
+        assert stats.max == pytest.approx(1.0)
+        assert timeline.silence_stats(turn_gaps_only=True).total == pytest.approx(1.0)
+
+    def test_empty_timeline(self):
+        timeline = SpeakerTimeline({})
+        assert timeline.analyze().speaker_changes == 0
+        assert timeline.silence_stats().total == 0.0
+
+    def test_from_transcript_without_end_timestamps(self):
+        transcript = Transcript(segments=[_seg("user", 0), _seg("agent", 2), _seg("user", 5)])
+        timeline = SpeakerTimeline.from_transcript(transcript)
+        # Missing ends run until the next segment; the last one is dropped.
+        assert timeline.intervals == {"user": [(0, 2)], "agent": [(2, 5)]}
+
+    def test_vad_intervals_replace_speaker_segments(self):
+        transcript = Transcript(segments=[_seg("user", 0, 4), _seg("agent", 5, 8)])
+        timeline = SpeakerTimeline.from_transcript(transcript, vad={"user": [(0, 1), (3, 5.5)]})
+        assert timeline.intervals["user"] == [(0, 1), (3, 5.5)]
+        assert timeline.overlaps() == [OverlapInterval(5, 5.5)]
+
+    def test_long_call_scales_linearly(self):
+        n = 200_000
+        timeline = SpeakerTimeline({
+            "user": [(i * 2.0, i * 2.0 + 1.2) for i in range(0, n, 2)],
+            "agent": [(i * 2.0, i * 2.0 + 1.0) for i in range(1, n, 2)],
+        })
+        started = time.perf_counter()
+        analysis = timeline.analyze()
+        assert time.perf_counter() - started < 5.0
+        assert analysis.speaker_changes == n - 1
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+class TestInterruptionRateMetric:
+    def test_rate_is_barge_ins_over_turns(self):
+        call = _call(
+            _seg("user", 0, 2),
+            _seg("agent", 1.5, 4),   # barge-in
+            _seg("user", 5, 6),
+            _seg("agent", 7, 8),
+        )
+        assert InterruptionRateMetric().evaluate(call) == pytest.approx(1 / 3)
+
+    def test_repeated_barge_ins_by_one_speaker(self):
+        call = _call(
+            _seg("user", 0, 10),
+            _seg("agent", 2, 3),     # three barge-ins, one speaker change
+            _seg("agent", 4, 5),
+            _seg("agent", 6, 7),
+            _seg("user", 12, 13),
+        )
+        assert InterruptionRateMetric().evaluate(call) == pytest.approx(3 / 4)
+
+    def test_no_transcript(self):
+        call = Call(call_id="c", agent_id="a", start_time=datetime(2026, 1, 1))
+        assert InterruptionRateMetric().evaluate(call) == 0.0
+
+    def test_uses_vad_provider(self):
+        call = _call(_seg("user", 0, 2), _seg("agent", 3, 4))
+        metric = InterruptionRateMetric(vad=lambda c: {"user": [(0, 3.5)]})
+        assert metric.evaluate(call) == 1.0
+
+
+class TestSilenceDurationMetric:
+    def test_total_silence(self):
+        call = _call(_seg("user", 0, 1), _seg("user", 1.5, 2), _seg("agent", 3, 4))
+        assert SilenceDurationMetric().evaluate(call) == pytest.approx(1.5)
+        assert SilenceDurationMetric(turn_gaps_only=True).evaluate(call) == pytest.approx(1.0)
@@ -0,0 +1,144 @@
+"""Unit tests for voiceeval.audio.vad — frame-based VAD."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from voiceeval.audio import VAD
+
+SR = 16000
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _voiced(seconds: float, amp: float = 0.3) -> "np.ndarray":
+    t = np.arange(int(seconds * SR)) / SR
+    return amp * (np.sin(2 * np.pi * 180 * t) + 0.5 * np.sin(2 * np.pi * 360 * t))
+
+
+def _signal(*parts) -> "np.ndarray":
+    """Concatenate (kind, seconds) parts over a low background noise; returns int16 PCM."""
+    rng = np.random.default_rng(0)
+    audio = np.concatenate([_voiced(sec) if kind == "speech" else np.zeros(int(sec * SR)) for kind, sec in parts])
+    audio = audio + rng.normal(0, 0.003, len(audio))
+    return (audio * 32767).astype("<i2")
+
+
+def _close(actual, expected, tol=0.1):
+    assert len(actual) == len(expected), actual
+    for (a0, a1), (e0, e1) in zip(actual, expected):
+        assert a0 == pytest.approx(e0, abs=tol)
+        assert a1 == pytest.approx(e1, abs=tol)
+
+
+PCM = _signal(("noise", 1.0), ("speech", 1.0), ("noise", 0.1), ("speech", 0.5), ("noise", 2.0), ("speech", 0.3), ("noise", 1.0))
+EXPECTED = [(1.0, 2.6), (4.6, 4.9)]
+
+
+# ---------------------------------------------------------------------------
+# Batch detection
+# ---------------------------------------------------------------------------
+
+class TestDetectSpeech:
+    def test_detects_speech_and_bridges_short_pauses(self):
+        _close(VAD().detect_speech(PCM.tobytes()), EXPECTED)
+
+    def test_accepts_numpy_arrays(self):
+        _close(VAD().detect_speech(PCM), EXPECTED)
+        _close(VAD().detect_speech(PCM.astype(np.float32) / 32768), EXPECTED)
+
+    def test_silence_and_empty_input(self):
+        assert VAD().detect_speech(np.zeros(SR, dtype="<i2")) == []
+        assert VAD().detect_speech(b"") == []
+
+    def test_loud_white_noise_is_not_speech(self):
+        rng = np.random.default_rng(1)
+        noise = (rng.normal(0, 0.2, 2 * SR) * 32767).clip(-32768, 32767).astype("<i2")
+        assert VAD().detect_speech(noise) == []
+
+    def test_short_blips_are_dropped(self):
+        pcm = _signal(("noise", 1.0), ("speech", 0.02), ("noise", 1.0))
+        assert VAD().detect_speech(pcm) == []
+
+    def test_unsigned_8_bit_is_centred(self):
+        pcm8 = ((PCM.astype(np.int32) >> 8) + 128).astype("u1")
+        _close(VAD().detect_speech(pcm8), EXPECTED)
+        assert VAD().detect_speech(np.full(2 * SR, 128, dtype="u1")) == []
+
+    def test_rejects_multichannel_arrays(self):
+        with pytest.raises(ValueError):
+            VAD().detect_speech(np.zeros((100, 2), dtype="<i2"))
+
+
+# ---------------------------------------------------------------------------
+# Streaming
+# ---------------------------------------------------------------------------
+
+class TestVADStream:
+    @pytest.mark.parametrize("chunk_bytes", [1001, 640, 64000])
+    def test_chunked_matches_batch(self, chunk_bytes):
+        data = PCM.tobytes()
+        stream = VAD().stream()
+        intervals = []
+        for i in range(0, len(data), chunk_bytes):
+            intervals += stream.feed(data[i:i + chunk_bytes])
+        intervals += stream.flush()
+        assert intervals == VAD().detect_speech(data)
+
+    def test_emits_within_hangover_of_speech_end(self):
+        vad = VAD(hangover_ms=200)
+        stream = vad.stream()
+        pcm = _signal(("noise", 5.5), ("speech", 1.0), ("noise", 1.0))
+        chunk = int(0.1 * SR)
+        emitted_at = None
+        for i in range(0, len(pcm), chunk):
+            if stream.feed(pcm[i:i + chunk]):
+                emitted_at = stream.position
+                break
+        # The interval ends at 6.5s; it must be reported within hangover + one chunk.
+        assert emitted_at is not None
+        assert emitted_at - 6.5 <= 0.2 + 0.1 + vad.frame_duration
+
+    def test_first_noise_window_is_held_back(self):
+        stream = VAD(noise_window_ms=5000).stream()
+        assert stream.feed(PCM[: 4 * SR]) == []
+        _close(stream.feed(PCM[4 * SR:]), EXPECTED)
+        assert stream.flush() == []
+
+    def test_speech_at_stream_start(self):
+        pcm = _signal(("speech", 1.0), ("noise", 2.0))
+        _close(VAD().detect_speech(pcm), [(0.0, 1.0)])
+
+    def test_steady_hum_is_not_speech(self):
+        t = np.arange(6 * SR) / SR
+        hum = 0.01 * np.sin(2 * np.pi * 60 * t)  # about -43 dBFS
+        pcm = (hum * 32767).astype("<i2")
+        assert VAD().detect_speech(pcm) == []
+        stream = VAD().stream()
+        assert [stream.feed(pcm[i:i + SR // 10]) for i in range(0, len(pcm), SR // 10)] == [[]] * 60
+        assert stream.flush() == []
+
+    def test_max_interval_bounds_open_speech(self):
+        pcm = _signal(("noise", 2.5), ("speech", 3.0))
+        stream = VAD().stream(max_interval_ms=1000)
+        intervals = stream.feed(pcm)
+        assert stream.in_speech
+        assert [round(b - a, 2) for a, b in intervals] == [1.0, 1.0]
+        tail = stream.flush()
+        assert tail and tail[0][0] == pytest.approx(intervals[-1][1])
+
+
+# ---------------------------------------------------------------------------
+# Throughput
+# ---------------------------------------------------------------------------
+
+def test_realtime_factor():
+    import time
+
+    audio = np.tile(PCM, 60)  # ~6 minutes
+    started = time.perf_counter()
+    VAD().detect_speech(audio)
+    elapsed = time.perf_counter() - started
+    assert (len(audio) / SR) / elapsed > 50